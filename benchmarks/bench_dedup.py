@@ -0,0 +1,116 @@
+"""
+近似重复题目检测基准
+
+生成模拟的合并题库：一批互不相同的题目，再为其中一部分生成"其他来源"的副本——
+题号不同、标点和空格有差别、选项顺序打乱（答案字母随之变化），少量副本的答案被改错。
+用 services.dedup_service.find_duplicates 检测，输出耗时以及副本和答案冲突的检出率。
+
+另外检查同一道题出现很多次（如从几十个章节文件合并的题库）时，全部副本归为一组并报告答案冲突；
+检查不通过时返回非零状态。
+
+用法:
+    python benchmarks/bench_dedup.py [题目数量] [副本比例]
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_search import make_questions
+from models.question import Question
+from models.question_store import QuestionStore
+from services.dedup_service import find_duplicates
+
+# 副本中答案被改错的比例
+_CONFLICT_RATIO = 0.05
+
+_PUNCTUATION = str.maketrans({"，": ",", "（": "(", "）": ")", "。": ".", "、": ","})
+
+
+def make_variant(rng, question, number, conflicting):
+    """生成同一道题的另一来源副本"""
+    body = question.text.split(". ", 1)[1]
+    if rng.random() < 0.5:
+        body = body.translate(_PUNCTUATION)
+    if rng.random() < 0.5:
+        body = body.replace("关于", "关于 ", 1)
+    text = f"{number}、{body}"
+
+    contents = [option.split(". ", 1)[1] for option in question.options]
+    order = list(range(len(contents)))
+    rng.shuffle(order)
+    options = [f"{letter}、{contents[old]}" for letter, old in zip("ABCD", order)]
+    correct = "ABCD".index(question.answer)
+    if conflicting:
+        correct = rng.choice([i for i in range(len(contents)) if i != correct])
+    answer = "ABCD"[order.index(correct)]
+    return Question(text, options, answer, question.explanation, "供应商B.docx")
+
+
+def check_repeated(copies=40):
+    """
+    同一道题重复 copies 次（部分副本答案不同），夹在其他题目中间
+
+    Returns:
+        bool: 全部副本归为一组，且这一组报告答案冲突
+    """
+    rng = random.Random(2)
+    others = make_questions(copies + 200)
+    question = others[0]
+    store = QuestionStore(others[copies + 1:])
+    indexes = []
+    for number in range(copies):
+        indexes.append(len(store))
+        store.append(make_variant(rng, question, number + 1, number % 7 == 1))
+        store.append(others[1 + number])
+    report = find_duplicates(store)
+    clusters = [cluster.indexes for cluster in report.clusters]
+    conflicts = [cluster.indexes for cluster in report.conflicts]
+    ok = clusters == [indexes] and conflicts == [indexes]
+    print(f"同一道题重复 {copies} 次：{len(clusters)} 组重复，{len(conflicts)} 组答案不一致，"
+          f"{'通过' if ok else '未通过'}")
+    return ok
+
+
+def main():
+    if not all(check_repeated(copies) for copies in (2, 32, 33, 40, 500)):
+        return 1
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+
+    rng = random.Random(1)
+    original_count = int(count / (1 + ratio))
+    originals = make_questions(original_count)
+    variants = []
+    for index in rng.sample(range(original_count), count - original_count):
+        conflicting = rng.random() < _CONFLICT_RATIO
+        variants.append((index, conflicting))
+    store = QuestionStore(originals)
+    for number, (index, conflicting) in enumerate(variants, 1):
+        store.append(make_variant(rng, originals[index], number, conflicting))
+    del originals
+
+    start = time.perf_counter()
+    report = find_duplicates(store)
+    seconds = time.perf_counter() - start
+
+    found = {tuple(cluster.indexes) for cluster in report.clusters}
+    conflicts = {tuple(cluster.indexes) for cluster in report.conflicts}
+    expected = {(index, original_count + offset) for offset, (index, _) in enumerate(variants)}
+    expected_conflicts = {(index, original_count + offset)
+                          for offset, (index, conflicting) in enumerate(variants) if conflicting}
+
+    print(f"{len(store)} 道题目（{len(variants)} 道为副本，其中 {len(expected_conflicts)} 道答案不同）")
+    print(f"检测耗时 {seconds:.2f} s，{seconds / len(store) * 1e6:.1f} µs/题")
+    print(f"副本检出 {len(found & expected)}/{len(expected)}，误报 {len(found - expected)} 组")
+    print(f"答案冲突检出 {len(conflicts & expected_conflicts)}/{len(expected_conflicts)}，"
+          f"误报 {len(conflicts - expected_conflicts)} 组")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
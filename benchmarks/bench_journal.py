@@ -0,0 +1,95 @@
+"""
+答案日志基准
+
+用 services.journal_service.AnswerJournal 记录一个模拟题库上的大量作答，输出：
+1. 每次点击（QuestionBank.save_user_answer 写入日志）的耗时和实际的写盘（fsync）次数；
+2. 重新打开题库时从日志重放恢复答案的耗时；
+3. 压缩为快照后从快照恢复的耗时。
+
+恢复耗时超过预算（默认 100 ms）时返回非零状态。
+
+用法:
+    python benchmarks/bench_journal.py [作答数量] [恢复预算毫秒]
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_search import make_questions
+import services.journal_service as journal_service
+from services.journal_service import AnswerJournal
+from models.question_bank import QuestionBank
+
+
+def restore(questions, base_path):
+    """打开日志并恢复到新的题库，返回 (耗时毫秒, 题库)"""
+    bank = QuestionBank(questions, "模拟题库")
+    start = time.perf_counter()
+    bank.attach_journal(AnswerJournal(base_path))
+    seconds = time.perf_counter() - start
+    bank.detach_journal()
+    return seconds * 1000, bank
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    budget_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 100.0
+
+    questions = make_questions(count * 2)
+    directory = tempfile.mkdtemp(prefix="bench_journal_")
+    base_path = os.path.join(directory, "bank")
+
+    # 统计写盘次数
+    fsync_count = 0
+    fsync = os.fsync
+
+    def counting_fsync(fd):
+        nonlocal fsync_count
+        fsync_count += 1
+        fsync(fd)
+
+    journal_service.os.fsync = counting_fsync
+    try:
+        rng = random.Random(1)
+        bank = QuestionBank(questions, "模拟题库")
+        # 只测日志重放：压缩阈值设为不会触发
+        bank.attach_journal(AnswerJournal(base_path, compact_records=count * 10))
+        clicks = [(index, rng.choice("ABCD")) for index in rng.sample(range(len(questions)), count)]
+        start = time.perf_counter()
+        for index, answer in clicks:
+            bank.save_user_answer(index, answer)
+        click_seconds = time.perf_counter() - start
+        bank.detach_journal()
+        journal_size = os.path.getsize(base_path + ".journal")
+    finally:
+        journal_service.os.fsync = fsync
+
+    try:
+        replay_ms, replayed = restore(questions, base_path)
+
+        # 下一次写盘时压缩为快照
+        journal = AnswerJournal(base_path, compact_records=1)
+        journal.record(clicks[0][0], clicks[0][1])
+        journal.close()
+        snapshot_ms, restored = restore(questions, base_path)
+        snapshot_size = os.path.getsize(base_path + ".snapshot")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    consistent = replayed.user_answers == bank.user_answers == restored.user_answers
+    print(f"{count} 次作答：每次点击 {click_seconds / count * 1e6:.1f} µs，写盘 {fsync_count} 次，"
+          f"日志 {journal_size / 1024:.0f} KB")
+    print(f"从日志恢复 {replay_ms:.1f} ms，从快照恢复 {snapshot_ms:.1f} ms（{snapshot_size / 1024:.0f} KB），"
+          f"预算 {budget_ms:.0f} ms")
+    print(f"恢复的答案{'一致' if consistent else '不一致'}")
+    return 0 if consistent and max(replay_ms, snapshot_ms) <= budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
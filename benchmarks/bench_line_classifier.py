@@ -0,0 +1,98 @@
+"""
+行识别性能基准
+
+对比旧的逐行正则级联（is_question_line + 选项 + 五种答案格式 + 解析）与
+utils.text_utils.classify_line 的单次识别，输出每秒处理行数。
+
+用法:
+    python benchmarks/bench_line_classifier.py [行数]
+"""
+
+import os
+import re
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.text_utils import classify_line
+
+_OPTION = re.compile(r'^([A-D])[\.、:：]?\s*(.*)$')
+_ANSWERS = [
+    re.compile(r'^答案[：:]\s*([A-Da-d])', re.IGNORECASE),
+    re.compile(r'^答案[是为]?\s*([A-Da-d])', re.IGNORECASE),
+    re.compile(r'^\s*([A-Da-d])\s*$', re.IGNORECASE),
+    re.compile(r'^[（(]?\s*([A-Da-d])\s*[）)]?$', re.IGNORECASE),
+    re.compile(r'.*[（(]\s*([A-Da-d])\s*[）)].*')
+]
+
+
+def legacy_classify(text):
+    """旧解析流程对一行文本的识别顺序"""
+    if (
+        re.match(r'^\（[\u4e00-\u9fa5]+\）\d+[\.、]\s*', text) or
+        re.search(r'\)\d+[\.、]\s*$', text) or
+        re.match(r'^\d+[\.、]\s*', text) or
+        re.match(r'^第\d+题[\.、]?\s*', text) or
+        re.match(r'^\d+、.*', text) or
+        re.match(r'^\d+[^\d\s].*', text)
+    ) and not re.match(r'^解析[:：]', text) and not re.match(r'^答案[:：]', text):
+        return 'question', None
+    match = _OPTION.match(text)
+    if match:
+        return 'option', f"{match.group(1)}. {match.group(2).strip()}"
+    for pattern in _ANSWERS:
+        match = pattern.search(text)
+        if match:
+            return 'answer', match.group(1).upper()
+    if len(text) == 1 and text.upper() in "ABCD":
+        return 'answer', text.upper()
+    if re.match(r'^解析[:：]', text):
+        return 'explanation', re.sub(r'^解析[:：]\s*', '', text).strip()
+    return 'continuation', None
+
+
+def make_bank(line_count, seed=0):
+    """生成模拟题库行：题目、四个选项、答案、解析，偶有题目延续行"""
+    rng = random.Random(seed)
+    lines = []
+    num = 1
+    while len(lines) < line_count:
+        lines.append(f"{num}. 下列关于证券投资基金的说法中，正确的是（ ）")
+        if rng.random() < 0.2:
+            lines.append("该题考查基金的基本概念与分类")
+        for letter in "ABCD":
+            lines.append(f"{letter}. 选项内容{rng.randint(0, 9999)}")
+        lines.append(f"答案：{rng.choice('ABCD')}")
+        lines.append("解析：根据相关法规，基金管理人应当履行诚实信用、谨慎勤勉的义务")
+        num += 1
+    return lines[:line_count]
+
+
+def measure(func, lines):
+    start = time.perf_counter()
+    for text in lines:
+        func(text)
+    return time.perf_counter() - start
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    lines = make_bank(line_count)
+
+    mismatches = sum(1 for text in lines if legacy_classify(text) != classify_line(text))
+    if mismatches:
+        print(f"识别结果不一致: {mismatches} 行")
+        sys.exit(1)
+
+    before = measure(legacy_classify, lines)
+    after = measure(classify_line, lines)
+    print(f"行数: {line_count}")
+    print(f"旧正则级联:   {line_count / before:>12,.0f} 行/秒 ({before:.2f}s)")
+    print(f"单次识别:     {line_count / after:>12,.0f} 行/秒 ({after:.2f}s)")
+    print(f"提速: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
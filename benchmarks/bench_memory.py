@@ -0,0 +1,117 @@
+"""
+题目内存占用基准
+
+分别用三种方式保存同一批模拟题目，用 tracemalloc 测量保存后常驻的内存，输出每道题的平均字节数：
+1. 旧的题目对象（带实例字典，选项为列表）；
+2. 使用 __slots__、选项为元组的 models.question.Question；
+3. 列式的 models.question_store.QuestionStore。
+
+同时测量按随机索引读取题目并访问全部字段的速度。
+
+用法:
+    python benchmarks/bench_memory.py [题目数量 ...]
+"""
+
+import gc
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.question import Question
+from models.question_store import QuestionStore
+
+_WORDS = ["基金", "证券", "投资", "风险", "收益", "管理人", "托管人", "份额", "净值", "申购",
+          "赎回", "组合", "债券", "股票", "货币市场", "信息披露", "合规", "估值"]
+
+
+class LegacyQuestion:
+    """旧的题目模型：每个实例带 __dict__，选项为列表"""
+
+    def __init__(self, text="", options=None, answer="", explanation="", source_file=""):
+        self.text = text
+        self.options = options or []
+        self.answer = answer
+        self.explanation = explanation
+        self.source_file = source_file
+
+
+def make_fields(count, seed=0):
+    """生成模拟题目字段：题干、四个选项、答案、解析和来源文件"""
+    rng = random.Random(seed)
+    source = os.path.join("题库", "基金从业资格考试.docx")
+    for i in range(count):
+        text = f"{i + 1}. 下列关于{''.join(rng.choices(_WORDS, k=6))}的说法，正确的是（ ）"
+        options = [f"{letter}. {''.join(rng.choices(_WORDS, k=3))}" for letter in "ABCD"]
+        answer = rng.choice("ABCD") if rng.random() < 0.9 else "".join(sorted(rng.sample("ABCD", 2)))
+        explanation = "".join(rng.choices(_WORDS, k=8)) if rng.random() < 0.5 else ""
+        yield text, options, answer, explanation, source
+
+
+def build_legacy(count):
+    return [LegacyQuestion(t, o, a, e, s) for t, o, a, e, s in make_fields(count)]
+
+
+def build_slots(count):
+    return [Question(t, o, a, e, s) for t, o, a, e, s in make_fields(count)]
+
+
+def build_store(count):
+    store = QuestionStore()
+    append = store.append
+    for fields in make_fields(count):
+        append(Question(*fields))
+    return store
+
+
+def measure(build, count):
+    """
+    测量一种保存方式
+
+    Returns:
+        tuple: (每题字节数, 构建秒数, 每次随机读取的微秒数)
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    questions = build(count)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del questions
+    gc.collect()
+
+    start = time.perf_counter()
+    questions = build(count)
+    build_seconds = time.perf_counter() - start
+
+    reads = min(count, 100000)
+    indexes = random.Random(1).choices(range(count), k=reads)
+    start = time.perf_counter()
+    for index in indexes:
+        question = questions[index]
+        question.text, question.options, question.answer, question.explanation, question.source_file
+    read_us = (time.perf_counter() - start) / reads * 1e6
+    del questions
+    gc.collect()
+    return used / count, build_seconds, read_us
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000]
+    variants = [("旧对象(__dict__)", build_legacy), ("Question(__slots__)", build_slots),
+                ("QuestionStore", build_store)]
+
+    print(f"{'题目数':>9}  {'保存方式':<20}{'每题字节':>10}{'总计MB':>10}{'构建秒':>9}{'读取微秒':>10}")
+    for count in counts:
+        for name, build in variants:
+            per_question, build_seconds, read_us = measure(build, count)
+            print(f"{count:>9}  {name:<20}{per_question:>10.0f}{per_question * count / 1048576:>10.1f}"
+                  f"{build_seconds:>9.2f}{read_us:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+待处理题目收尾阶段的压力基准
+
+构造“所有题目都缺少答案”的对抗性输入：大量带空括号、没有答案的待定题目，
+其间夹杂可被当作答案的单字母题目。对比旧实现（列表 in 检查 + 遍历中 remove，
+O(n·m)）与 ParserService._finish_assembly 的线性实现，并核对两者输出一致。
+
+用法:
+    python benchmarks/bench_pending_reconciliation.py [最大题目数]
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import logging
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.question import Question
+from models.parse_stats import ParseStats
+from services.parser_service import ParserService, AssemblyState
+
+logging.getLogger('quiz_bank').setLevel(logging.WARNING)
+
+_EMPTY_BRACKETS = re.compile(r'[（(]\s*[）)]')
+
+
+def legacy_finish(state):
+    """旧的收尾实现，原样保留以便对比"""
+    current_q = state.current_q
+    pending_questions = state.pending_questions
+    questions = []
+    if current_q:
+        if current_q.answer:
+            questions.append(current_q)
+        elif pending_questions:
+            pending_questions.append(current_q)
+            for q in pending_questions:
+                if re.search(r'^\d+[\.、]|^第(\d+)题', q.text):
+                    if _EMPTY_BRACKETS.search(q.text) and not q.answer:
+                        for other_q in pending_questions:
+                            if other_q != q and len(other_q.text) == 1 and other_q.text.upper() in "ABCD":
+                                q.answer = other_q.text.upper()
+                                pending_questions.remove(other_q)
+                                break
+                questions.append(q)
+        else:
+            questions.append(current_q)
+    for q in pending_questions:
+        if q not in questions:
+            questions.append(q)
+    return questions
+
+
+def make_state(count, seed=0):
+    """生成对抗性组装状态：全部缺答案，约 5% 为单字母题目"""
+    rng = random.Random(seed)
+    state = AssemblyState()
+    for i in range(count):
+        if rng.random() < 0.05:
+            state.pending_questions.append(Question(text=rng.choice("ABCDabcd")))
+        else:
+            state.pending_questions.append(Question(text=f"{i + 1}. 下列说法正确的是（ ）"))
+    state.current_q = Question(text=f"{count + 1}. 最后一题（ ）")
+    return state
+
+
+def snapshot(questions):
+    return [(q.text, q.answer) for q in questions]
+
+
+def main():
+    max_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    parser = ParserService()
+
+    # 小规模随机用例核对输出一致
+    for seed in range(200):
+        count = random.Random(seed).randint(0, 60)
+        expected = snapshot(legacy_finish(make_state(count, seed)))
+        actual = snapshot(parser._finish_assembly(make_state(count, seed), ParseStats()))
+        if expected != actual:
+            print(f"输出不一致: seed={seed}")
+            sys.exit(1)
+
+    print(f"{'题目数':>10} {'旧实现(s)':>12} {'线性实现(s)':>12}")
+    count = 5_000
+    while count <= max_count:
+        legacy_time = None
+        if count <= 20_000:
+            state = make_state(count)
+            start = time.perf_counter()
+            legacy_finish(state)
+            legacy_time = time.perf_counter() - start
+
+        state = make_state(count)
+        start = time.perf_counter()
+        for _ in parser._finish_assembly(state, ParseStats()):
+            pass
+        linear_time = time.perf_counter() - start
+
+        legacy_text = f"{legacy_time:12.3f}" if legacy_time is not None else f"{'-':>12}"
+        print(f"{count:>10} {legacy_text} {linear_time:12.3f}")
+        count *= 2 if count < 40_000 else 5
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+关键词检索基准
+
+生成模拟的中文题库（题干、四个选项、解析，词汇表较大，"货币市场基金"等常见考点词组
+按一定比例出现），比较以下方式的检索耗时：
+1. services.search_index.SearchIndex（二字/三字片段倒排索引）及其序列化后还原的索引；
+2. QuestionStore.search（直接在 UTF-8 数据中查找子串）。
+
+同时输出索引的构建、序列化和还原耗时及序列化后的大小。
+
+用法:
+    python benchmarks/bench_search.py [题目数量] [重复次数]
+"""
+
+import os
+import sys
+import time
+import random
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.question import Question
+from models.question_store import QuestionStore
+from services.search_index import SearchIndex
+
+# 常见考点词组及其出现在题目中的概率
+_PHRASES = [("货币市场基金", 0.01), ("证券投资基金", 0.03), ("信息披露", 0.02),
+            ("基金管理人", 0.04), ("基金托管人", 0.02), ("净值", 0.05)]
+_QUERIES = ["货币市场基金", "基金管理人 信息披露", "托管人", "净值", "不存在的考点", "基金"]
+
+
+def make_vocabulary(rng, size=3000):
+    """生成随机的二到四字词汇表"""
+    chars = [chr(code) for code in range(0x4E00, 0x4E00 + 2500)]
+    return ["".join(rng.choices(chars, k=rng.randint(2, 4))) for _ in range(size)]
+
+
+def make_questions(count, seed=0):
+    """生成模拟题目"""
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(rng)
+    questions = []
+    for i in range(count):
+        words = rng.choices(vocabulary, k=8)
+        for phrase, probability in _PHRASES:
+            if rng.random() < probability:
+                words.insert(rng.randrange(len(words)), phrase)
+        text = f"{i + 1}. 关于{''.join(words)}，下列说法正确的是（ ）"
+        options = [f"{letter}. {''.join(rng.choices(vocabulary, k=3))}" for letter in "ABCD"]
+        explanation = "".join(rng.choices(vocabulary, k=6)) if rng.random() < 0.5 else ""
+        questions.append(Question(text, options, rng.choice("ABCD"), explanation))
+    return questions
+
+
+def timed(function, repeat):
+    """返回多次运行的耗时中位数（毫秒）和最后一次的结果"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    limit = 200
+
+    questions = make_questions(count)
+    store = QuestionStore(questions)
+
+    start = time.perf_counter()
+    index = SearchIndex()
+    index.extend(questions)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    data = index.to_bytes()
+    dump_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    loaded = SearchIndex.from_bytes(data)
+    load_seconds = time.perf_counter() - start
+
+    print(f"{count} 道题目")
+    print(f"构建索引 {build_seconds:.2f} s，序列化 {dump_seconds:.2f} s（{len(data) / 1048576:.1f} MB），"
+          f"还原 {load_seconds:.2f} s")
+    print(f"{'关键词':<20}{'匹配数':>8}{'索引毫秒':>10}{'还原索引毫秒':>14}{'逐题查找毫秒':>14}")
+    for keyword in _QUERIES:
+        index_ms, results = timed(lambda: index.search(keyword, limit, store.__getitem__), repeat)
+        loaded_ms, _ = timed(lambda: loaded.search(keyword, limit, store.__getitem__), repeat)
+        scan_ms, matches = timed(lambda: store.search(keyword, count), repeat)
+        assert set(results) <= set(matches) and len(results) == min(limit, len(matches))
+        print(f"{keyword:<20}{len(matches):>8}{index_ms:>10.2f}{loaded_ms:>14.2f}{scan_ms:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+练习服务压力测试
+
+生成模拟题库并导出为文本题库，在子进程中用 `main.py --serve` 启动练习服务，
+再用 asyncio 模拟大量学员：若干条长连接，每条连接轮流代表多位学员，
+每位学员新建随机模式的会话后反复作答、下一题，偶尔查看统计。
+输出请求数、每秒请求数、延迟的 p50/p90/p99/最大值，以及服务进程的内存占用（Linux）。
+
+压力测试客户端与服务在同一台机器上运行，会占用一部分 CPU，结果偏保守。
+
+用法:
+    python benchmarks/bench_server.py [学员数量] [连接数] [持续秒数] [题目数量]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_search import make_questions
+from services.export_service import export_questions
+
+_MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+class Client:
+    """一条保持连接的 HTTP/JSON 客户端连接"""
+
+    def __init__(self, reader, writer, host):
+        self.reader = reader
+        self.writer = writer
+        self.host = host
+
+    async def request(self, method, path, payload=None):
+        """发送请求，返回 (状态码, 响应对象)"""
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self.writer.write((f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                           f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+                          .encode('latin-1') + body)
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        status = int(lines[0].split(' ', 2)[1])
+        length = 0
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+
+def percentile(sorted_values, fraction):
+    """已排序数据的分位数"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def rss_mb(pid):
+    """进程的常驻内存（MB），无法读取时返回None"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+async def run_worker(host, port, session_count, deadline, latencies, errors, seed):
+    """一条连接：新建会话后轮流为各学员作答、下一题，直到截止时间"""
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    client = Client(reader, writer, f"{host}:{port}")
+    perf_counter = time.perf_counter
+
+    async def timed(method, path, payload=None):
+        start = perf_counter()
+        status, data = await client.request(method, path, payload)
+        latencies.append(perf_counter() - start)
+        if status >= 400:
+            errors.append((status, data.get('error')))
+        return data
+
+    sessions = []
+    for _ in range(session_count):
+        data = await timed('POST', '/sessions', {'mode': 'random'})
+        sessions.append(data['session'])
+    try:
+        while time.perf_counter() < deadline:
+            for session in sessions:
+                await timed('POST', f'/sessions/{session}/answer', {'answer': rng.choice("ABCD")})
+                await timed('POST', f'/sessions/{session}/next')
+                if rng.random() < 0.05:
+                    await timed('GET', f'/sessions/{session}/stats')
+                if time.perf_counter() >= deadline:
+                    break
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, sessions, connections, seconds):
+    """运行压力测试，返回 (延迟列表, 错误列表, 实际耗时)"""
+    latencies, errors = [], []
+    start = time.perf_counter()
+    deadline = start + seconds
+    per_connection = [sessions // connections + (i < sessions % connections) for i in range(connections)]
+    await asyncio.gather(*(run_worker(host, port, count, deadline, latencies, errors, i)
+                           for i, count in enumerate(per_connection)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    connections = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 10.0
+    count = int(sys.argv[4]) if len(sys.argv) > 4 else 20000
+    connections = max(1, min(connections, sessions))
+
+    directory = tempfile.mkdtemp(prefix="bench_server_")
+    bank_path = os.path.join(directory, "bank.txt")
+    export_questions(make_questions(count), range(count), bank_path)
+
+    server = subprocess.Popen([sys.executable, _MAIN, '--serve', bank_path, '--port', '0'],
+                              stdout=subprocess.PIPE, text=True, encoding='utf-8')
+    try:
+        host = port = None
+        for line in server.stdout:
+            if line.startswith("练习服务已启动: http://"):
+                host, port = line.strip().rsplit("//", 1)[1].rsplit(":", 1)
+                break
+        if port is None:
+            print("练习服务启动失败", file=sys.stderr)
+            return 1
+        idle_rss = rss_mb(server.pid)
+
+        latencies, errors, elapsed = asyncio.run(run_load(host, int(port), sessions, connections, seconds))
+        loaded_rss = rss_mb(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+        os.remove(bank_path)
+        os.rmdir(directory)
+
+    latencies.sort()
+    ms = [value * 1000 for value in latencies]
+    print(f"{count} 道题目，{sessions} 位学员，{connections} 条连接，{elapsed:.1f} s")
+    print(f"请求 {len(ms)} 次，{len(ms) / elapsed:.0f} 次/秒，错误 {len(errors)} 次")
+    print(f"延迟 p50 {percentile(ms, 0.5):.2f} ms，p90 {percentile(ms, 0.9):.2f} ms，"
+          f"p99 {percentile(ms, 0.99):.2f} ms，最大 {ms[-1] if ms else 0:.2f} ms")
+    if idle_rss is not None and loaded_rss is not None:
+        print(f"服务进程内存 {idle_rss:.1f} MB（加载题库后）→ {loaded_rss:.1f} MB（{sessions} 位学员练习后）")
+    if errors:
+        print(f"错误示例: {errors[:3]}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
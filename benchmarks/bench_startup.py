@@ -0,0 +1,122 @@
+"""
+冷启动基准
+
+在新的解释器进程中分别测量：
+1. 导入 main 模块（控制器、视图及其依赖）的耗时，并检查重量级模块
+   （python-docx、lxml、zipfile、multiprocessing 等）没有在启动阶段被导入；
+2. 运行 main.py --profile-startup 到第一个文件对话框出现前的耗时
+   （需要图形界面，没有显示器时跳过）。
+
+取多次运行的中位数与预算比较，超出预算或提前导入了重量级模块时以非零状态退出，
+可用于持续集成中发现启动性能退化。
+
+用法:
+    python benchmarks/bench_startup.py [运行次数] [导入预算毫秒] [首个对话框预算毫秒]
+"""
+
+import os
+import sys
+import json
+import time
+import statistics
+import subprocess
+import compileall
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.startup_profiler import HEAVY_MODULES, REPORT_PREFIX
+
+# 导入阶段的测量脚本：输出导入耗时和已导入的重量级模块
+_IMPORT_PROBE = f"""
+import sys, json, time
+start = time.perf_counter()
+import main
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{'import_ms': elapsed,
+                   'heavy_modules': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import():
+    """
+    在新进程中测量导入 main 模块的耗时
+
+    Returns:
+        dict: import_ms、heavy_modules 和整个进程的耗时 process_ms
+    """
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, '-c', _IMPORT_PROBE],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result['process_ms'] = (time.perf_counter() - start) * 1000
+    return result
+
+
+def measure_first_dialog():
+    """
+    在新进程中测量启动到第一个文件对话框的耗时
+
+    Returns:
+        dict: 启动性能报告加上整个进程的耗时 process_ms；无法创建窗口时返回None
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, 'main.py', '--profile-startup'],
+        cwd=ROOT, capture_output=True, text=True, timeout=60
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    for line in completed.stdout.splitlines():
+        if line.startswith(REPORT_PREFIX):
+            report = json.loads(line[len(REPORT_PREFIX):])
+            report['process_ms'] = elapsed
+            return report
+    return None
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    import_budget = float(sys.argv[2]) if len(sys.argv) > 2 else 150.0
+    dialog_budget = float(sys.argv[3]) if len(sys.argv) > 3 else 600.0
+    failed = False
+
+    # 与打包后的程序一样使用预先编译好的字节码
+    compileall.compile_dir(ROOT, quiet=1)
+
+    imports = [measure_import() for _ in range(runs)]
+    import_ms = statistics.median(r['import_ms'] for r in imports)
+    process_ms = statistics.median(r['process_ms'] for r in imports)
+    heavy = sorted({m for r in imports for m in r['heavy_modules']})
+    print(f"导入 main 模块:     {import_ms:8.1f} ms（进程总计 {process_ms:.1f} ms，预算 {import_budget:.0f} ms）")
+    if import_ms > import_budget:
+        print("  超出导入预算")
+        failed = True
+    if heavy:
+        print(f"  启动阶段导入了重量级模块: {', '.join(heavy)}")
+        failed = True
+
+    first = measure_first_dialog()
+    if first is None:
+        print("首个对话框:         跳过（无法创建窗口，可能没有图形界面）")
+    else:
+        reports = [first] + [measure_first_dialog() for _ in range(runs - 1)]
+        reports = [r for r in reports if r]
+        total_ms = statistics.median(r['total_ms'] for r in reports)
+        process_ms = statistics.median(r['process_ms'] for r in reports)
+        print(f"到首个对话框:       {total_ms:8.1f} ms（进程总计 {process_ms:.1f} ms，预算 {dialog_budget:.0f} ms）")
+        for phase in reports[0]['phases_ms']:
+            phase_ms = statistics.median(r['phases_ms'][phase] for r in reports)
+            print(f"  {phase:<16} {phase_ms:8.1f} ms")
+        if total_ms > dialog_budget:
+            print("  超出启动预算")
+            failed = True
+
+    if failed:
+        sys.exit(1)
+    print("启动性能在预算之内")
+
+
+if __name__ == "__main__":
+    main()
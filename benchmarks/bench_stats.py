@@ -0,0 +1,84 @@
+"""
+做题统计基准
+
+生成模拟题库（按来源文件分为若干章节）并作答全部题目，再模拟连续点击选项（含改答），比较每次点击后
+更新统计的耗时：
+1. QuestionBank.answer_stats 的累计计数（作答时按差值更新）；
+2. 逐题比对全部答案重新计数（原来的做法）。
+
+最后用逐题比对的结果核对累计计数和按来源文件分组的计数。
+
+用法:
+    python benchmarks/bench_stats.py [题目数量] [点击次数] [章节数量]
+"""
+
+import os
+import sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_search import make_questions
+from models.question_bank import QuestionBank
+
+
+def scan_counts(bank):
+    """逐题比对全部答案，返回 (已做数量, 答对数量)"""
+    correct_answer = bank.questions.answer
+    correct = 0
+    for index, answer in bank.user_answers.items():
+        if answer.upper() == correct_answer(index).upper():
+            correct += 1
+    return len(bank.user_answers), correct
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    clicks = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    chapters = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    questions = make_questions(count)
+    for index, question in enumerate(questions):
+        question.source_file = f"第{index * chapters // count + 1}章.docx"
+    bank = QuestionBank(questions, "模拟题库")
+    del questions
+
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for index in range(count):
+        bank.save_user_answer(index, rng.choice("ABCD"))
+    answer_seconds = time.perf_counter() - start
+
+    targets = [(rng.randrange(count), rng.choice("ABCD")) for _ in range(clicks)]
+    start = time.perf_counter()
+    for index, answer in targets:
+        bank.save_user_answer(index, answer)
+        stats = bank.answer_stats
+        (stats.answered, stats.correct, stats.incorrect)
+    running_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for index, answer in targets:
+        bank.save_user_answer(index, answer)
+        scan_counts(bank)
+    scan_seconds = time.perf_counter() - start
+
+    answered, correct = scan_counts(bank)
+    stats = bank.answer_stats
+    groups_ok = True
+    for source, group_answered, group_correct in stats.groups():
+        indexes = [index for index in bank.user_answers if stats.group_of(index) == source]
+        expected = sum(bank._is_correct(index, bank.user_answers[index]) for index in indexes)
+        groups_ok &= (group_answered, group_correct) == (len(indexes), expected)
+
+    print(f"{count} 道题目，{len(stats.groups())} 个来源文件，作答全部题目耗时 {answer_seconds:.2f} s")
+    print(f"每次点击更新统计：累计计数 {running_seconds / clicks * 1e6:.1f} µs，"
+          f"逐题比对 {scan_seconds / clicks * 1e3:.2f} ms")
+    print(f"核对：已做 {stats.answered}/{answered}，答对 {stats.correct}/{correct}，"
+          f"分组计数{'一致' if groups_ok else '不一致'}")
+    return 0 if (stats.answered, stats.correct) == (answered, correct) and groups_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,8 +18,35 @@ COLOR_INCORRECT = "red"
 COLOR_BACKGROUND = "#f5f5f5"
 COLOR_STATUS_TEXT = "#666666"
 
-# 文件配置
-FILE_PATTERNS = ['.docx', '.txt', '.csv']
+# 解析配置：超过该大小（MB）的文本题库分块多进程解析
+PARALLEL_PARSE_MIN_MB = 32
+PARALLEL_CHUNK_MB = 8
+
+# 后台加载时界面检查加载进度的间隔（毫秒）
+LOAD_POLL_INTERVAL_MS = 100
+
+# 增量加载：解析出第一道题后立即显示，其余题目在后台继续加载
+INCREMENTAL_LOAD = True
+
+# 关键词检索最多显示的结果数
+SEARCH_RESULT_LIMIT = 200
+
+# 缓存配置
+CACHE_ENABLED = True
+CACHE_DIR = "quiz_cache"
+CACHE_MAX_SIZE_MB = 256
+
+# 练习进度（随机模式的做题顺序等）保存目录
+SESSION_DIR = "quiz_sessions"
+
+# 答案日志：作答后最多等待多久写盘（秒），日志记录数达到多少时压缩为快照
+JOURNAL_FLUSH_SECONDS = 0.5
+JOURNAL_COMPACT_RECORDS = 5000
+
+# 练习服务（--serve）：默认监听地址和端口，学员会话闲置多久后清除（秒）
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_SESSION_TTL = 2 * 60 * 60
 
 # 日志配置
 LOG_LEVEL = "INFO"
@@ -10,11 +10,31 @@ MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
 See the Mulan PSL v2 for more details.
 """
 
+import os
+import time
 import tkinter as tk
 from models.question_bank import QuestionBank
+from models.question_store import QuestionStore
 from services.file_service import FileService
 from services.parser_service import ParserService
+from services.cache_service import BankCache
+from services.import_service import ImportService
+from services.export_service import export_questions
+from services.load_service import BackgroundLoader, LoadProgress, parse_with_progress
+from services.parser_registry import find_backend
+from services.search_index import SearchIndex
+from services.session_service import SessionStore
 from utils.logger import get_logger
+from config.settings import CACHE_ENABLED, LOAD_POLL_INTERVAL_MS, INCREMENTAL_LOAD, SEARCH_RESULT_LIMIT
+
+# 练习模式：顺序、随机抽题、间隔复习、错题练习
+MODE_SEQUENTIAL = 'sequential'
+MODE_RANDOM = 'random'
+MODE_REVIEW = 'review'
+MODE_MISTAKES = 'mistakes'
+
+# 后台构建检索索引时每加入多少道题目检查一次是否已取消
+_INDEX_CANCEL_INTERVAL = 1000
 
 class AppController:
     """
@@ -38,8 +58,18 @@ class AppController:
         self.view = view
         self.file_service = FileService()
         self.parser_service = ParserService()
+        self.bank_cache = BankCache() if CACHE_ENABLED else None
+        self.import_service = ImportService(self.bank_cache)
         self.question_bank = None
-        self.random_mode = False
+        self.loader = None  # 正在运行的后台加载任务
+        self.progress_dialog = None
+        self.pending_index = None  # 等待加载完成后跳转的题目索引
+        self.search_dialog = None
+        self.index_builder = None  # 正在后台构建检索索引的任务
+        self.pending_search = None  # 等待检索索引构建完成后执行的检索关键词
+        self.session_store = SessionStore()
+        self.session_path = None  # 已恢复练习进度的题库路径，只为完整加载的题库保存进度
+        self.practice_mode = MODE_SEQUENTIAL
         self.save_records = True  # 默认保存做题记录
 
     def set_view(self, view):
@@ -82,6 +112,10 @@ class AppController:
         """
         加载题库文件
 
+        解析在后台线程中进行，界面显示进度并可取消。增量模式下解析出第一道题后
+        立即显示，其余题目在后台继续加入题库；否则加载完成后显示第一题。
+        支持随机访问的格式（如编译题库）直接打开，不经过解析。
+
         Args:
             bank_file (str): 题库文件路径
         """
@@ -89,13 +123,143 @@ class AppController:
             self.exit_application()
             return
 
-        # 加载题库
+        # 新的加载取代尚未完成的加载
+        self._stop_loading()
+
+        opener = find_backend(bank_file).load_opener()
+        if opener:
+            self.logger.info(f"直接打开题库: {bank_file}")
+            try:
+                store = opener(bank_file)
+            except Exception as e:
+                self._on_load_failed(e)
+                return
+            self._show_loaded_bank(bank_file, None, store=store)
+            return
+
+        self.logger.info(f"开始后台加载题库: {bank_file}")
+        loader = BackgroundLoader(self._load_questions, bank_file, incremental=INCREMENTAL_LOAD)
+        self.loader = loader
+        self.progress_dialog = self.view.show_progress(bank_file, loader.cancel)
+        loader.start()
+        self.view.root.after(LOAD_POLL_INTERVAL_MS, self._poll_loader, loader, bank_file)
+
+    def _poll_loader(self, loader, bank_file, on_finished=None, on_failed=None):
+        """
+        检查后台加载任务的进度和结果（在界面线程中定期调用）
+
+        Args:
+            loader (BackgroundLoader): 后台加载任务
+            bank_file (str): 题库文件或文件夹路径
+            on_finished (callable): 加载完成的回调，参数为路径和加载结果的各项，默认为 _on_load_finished
+            on_failed (callable): 加载失败的回调，参数为异常，默认为 _on_load_failed
+        """
+        if loader is not self.loader:
+            return  # 已被取消或被新的加载取代
+
+        for event, data in loader.poll():
+            if event == 'questions':
+                self._on_questions_loaded(bank_file, data)
+                continue
+            if event == 'progress':
+                if self.progress_dialog:
+                    self.progress_dialog.update_progress(data)
+                continue
+
+            # 加载结束：关闭进度对话框后再处理结果
+            self.loader = None
+            self._close_progress_dialog()
+
+            if event == 'done':
+                (on_finished or self._on_load_finished)(bank_file, *data)
+            elif event == 'cancelled':
+                self._on_load_cancelled()
+            else:
+                (on_failed or self._on_load_failed)(data)
+            return
+
+        self.view.root.after(LOAD_POLL_INTERVAL_MS, self._poll_loader, loader, bank_file,
+                             on_finished, on_failed)
+
+    def _on_questions_loaded(self, bank_file, questions):
+        """
+        增量加载：把一批新题目加入正在加载的题库
+
+        第一批题目到达时创建题库并显示第一题；之后的批次只追加题目、更新状态栏，
+        如果有等待中的跳转且目标题目已到达，则完成跳转。
+
+        Args:
+            bank_file (str): 题库文件路径
+            questions (list): 新解析出的题目
+        """
+        bank = self.question_bank
+        if bank is None or not bank.loading:
+            self._close_progress_dialog()
+            self._show_loaded_bank(bank_file, questions, loading=True)
+            return
+
+        bank.extend_questions(questions)
+        if self.pending_index is not None and self.pending_index < bank.get_question_count():
+            self._jump_to_pending()
+        else:
+            self._update_status()
+
+    def _on_load_finished(self, bank_file, questions, search_index, cache_key):
+        """
+        加载完成
+
+        Args:
+            bank_file (str): 题库文件路径
+            questions (list): 全部题目
+            search_index (SearchIndex): 缓存的检索索引，没有时为None（在后台构建）
+            cache_key (str): 题库在缓存中的键，不使用缓存时为None
+        """
+        bank = self.question_bank
+        if bank is None or not bank.loading:
+            # 非增量模式，或文件中没有题目
+            self._show_loaded_bank(bank_file, questions, search_index=search_index)
+            self._start_index_builder(cache_key)
+            return
+
+        bank.loading = False
+        if search_index is not None:
+            bank.search_index = search_index
+        self._start_index_builder(cache_key)
+        self._restore_session()
+        if self.pending_index is not None:
+            if self.pending_index < bank.get_question_count():
+                self._jump_to_pending()
+                return
+
+            # 等待的题号超出了题库范围
+            self.pending_index = None
+            self.view.show_error("错误", f"请输入1-{bank.get_question_count()}之间的题号")
+        # 重新显示当前题目：恢复的答案中可能有当前题目的答案
+        self.show_current_question()
+
+    def _show_loaded_bank(self, bank_file, questions, loading=False, store=None, search_index=None):
+        """
+        使用加载完成的题目创建题库并显示第一题
+
+        Args:
+            bank_file (str): 题库文件路径
+            questions (list): 题目对象列表
+            loading (bool): 其余题目是否仍在加载
+            store: 直接打开的只读题目存储，提供时忽略 questions
+            search_index (SearchIndex): 题目的检索索引
+        """
         try:
-            questions = self.parser_service.parse_document(bank_file)
-            self.question_bank = QuestionBank(questions, bank_file)
+            self._replace_question_bank(QuestionBank(questions, bank_file, store=store,
+                                                     search_index=search_index))
+            self.session_path = None
+            self.question_bank.loading = loading
+            self.pending_index = None
+            self._close_search_dialog()
+            if not loading:
+                self._restore_session()
 
             # 显示做题窗口
-            self.view.root.deiconify()
+            self.view.show()
 
             # 更新题库路径显示
             self.view.update_file_path(bank_file)
@@ -103,14 +267,299 @@ class AppController:
             # 显示第一题
             self.show_current_question()
         except Exception as e:
-            self.logger.error(f"加载题库失败: {str(e)}")
-            self.view.show_error("错误", f"加载题库失败: {str(e)}\n\n请确保选择的是正确格式的题库文件。")
+            self._on_load_failed(e)
+
+    def _replace_question_bank(self, bank):
+        """
+        用新题库取代当前题库
 
-            # 重新选择题库文件，而不是退出应用程序
+        先保存当前题库的练习进度并停止为当前题库构建检索索引，再关闭当前题库直接打开的题目存储
+        （编译题库的内存映射、SQLite 题库的连接），以免反复切换题库时文件句柄一直占用到程序退出。
+
+        Args:
+            bank (QuestionBank): 新题库
+        """
+        self.save_session()
+        if self.index_builder:
+            self.index_builder.cancel()
+            self.index_builder = None
+        previous = self.question_bank
+        self.question_bank = bank
+        if previous is not None and previous is not bank:
+            previous.close()
+
+    def _on_load_failed(self, error):
+        """
+        加载失败：提示错误并重新选择题库文件
+
+        Args:
+            error (Exception): 加载时的异常
+        """
+        self._stop_loading()
+        self.logger.error(f"加载题库失败: {str(error)}")
+        self.view.show_error("错误", f"加载题库失败: {str(error)}\n\n请确保选择的是正确格式的题库文件。")
+
+        # 重新选择题库文件，而不是退出应用程序
+        self.reselect_question_bank()
+
+    def _on_load_cancelled(self):
+        """加载被取消：回到已有的题库，没有题库时重新选择文件"""
+        self.pending_index = None
+        if self.question_bank:
+            self.question_bank.loading = False
+            self._start_index_builder(None)
+            self.view.show()
+            self.show_current_question()
+        else:
             self.reselect_question_bank()
 
-    def show_current_question(self):
-        """显示当前题目"""
+    def cancel_loading(self):
+        """
+        取消正在运行的后台加载（增量加载时由状态栏的取消按钮调用）
+
+        已加载的题目保留在题库中，后台线程停止后回到当前题目。
+        """
+        if self.loader:
+            self.logger.info("用户取消加载")
+            self.loader.cancel()
+
+    def _stop_loading(self):
+        """停止正在运行的后台加载，已加载的题目保留在题库中"""
+        if self.loader:
+            self.loader.cancel()
+            self.loader = None
+        self._close_progress_dialog()
+        self.pending_index = None
+        if self.pending_search:
+            self._close_search_dialog()  # 等待的检索随加载一起放弃
+        if self.question_bank and self.question_bank.loading:
+            self.question_bank.loading = False
+            self._update_status()
+
+    def _close_progress_dialog(self):
+        """关闭加载进度对话框"""
+        if self.progress_dialog:
+            self.progress_dialog.close()
+            self.progress_dialog = None
+
+    def _jump_to_pending(self):
+        """跳转到等待中的题目（目标题目已加载）"""
+        index = self.pending_index
+        self.pending_index = None
+        self.question_bank.jump_to_question(index)
+        self.show_current_question()
+
+    def load_question_folder(self, directory):
+        """
+        加载文件夹中的全部题库文件，合并为一个题库
+
+        导入在后台线程中进行，进度对话框按文件显示进度并可取消，全部文件读完后合并为一个题库。
+
+        Args:
+            directory (str): 题库文件夹路径
+        """
+        if not directory:
+            return
+
+        self._stop_loading()
+
+        self.logger.info(f"开始后台导入题库文件夹: {directory}")
+        loader = BackgroundLoader(self._import_folder, directory)
+        self.loader = loader
+        self.progress_dialog = self.view.show_progress(directory, loader.cancel)
+        loader.start()
+        self.view.root.after(LOAD_POLL_INTERVAL_MS, self._poll_loader, loader, directory,
+                             self._on_folder_loaded, self._on_folder_load_failed)
+
+    def _import_folder(self, loader, directory):
+        """
+        导入文件夹中的全部题库文件（在后台线程中运行）
+
+        Args:
+            loader (BackgroundLoader): 后台加载任务，用于报告进度和检查取消
+            directory (str): 题库文件夹路径
+
+        Returns:
+            tuple: (合并后的题目列表, ImportReport)
+        """
+        return self.import_service.import_directory(directory, loader)
+
+    def _on_folder_loaded(self, directory, questions, report):
+        """
+        文件夹导入完成：用合并后的题目创建题库并显示第一题
+
+        Args:
+            directory (str): 题库文件夹路径
+            questions (list): 合并后的题目
+            report (ImportReport): 导入报告
+        """
+        if not questions:
+            self._on_folder_load_failed(ValueError(report.summary()))
+            return
+        try:
+            self._replace_question_bank(QuestionBank(questions, directory))
+            self._close_search_dialog()
+            self._restore_session()
+
+            # 显示做题窗口
+            self.view.show()
+
+            # 更新题库路径显示
+            self.view.update_file_path(directory)
+
+            # 显示第一题
+            self.show_current_question()
+            self._start_index_builder(None)
+        except Exception as e:
+            self._on_folder_load_failed(e)
+            return
+
+        # 有文件失败时提示，但不影响已导入的题目
+        if report.failures:
+            self.view.show_info("导入结果", report.summary())
+
+    def _on_folder_load_failed(self, error):
+        """
+        文件夹导入失败：提示错误并回到当前题库
+
+        Args:
+            error (Exception): 导入时的异常
+        """
+        self.logger.error(f"加载题库文件夹失败: {str(error)}")
+        self.view.show_error("错误", f"加载题库文件夹失败: {str(error)}")
+        self.view.show()
+
+    def _load_questions(self, loader, bank_file):
+        """
+        读取题目列表，文件未变化时直接使用缓存的解析结果和检索索引（在后台线程中运行）
+
+        检索索引不在加载时构建，以免推迟显示第一题；缓存中没有索引时加载完成后在后台构建。
+
+        Args:
+            loader (BackgroundLoader): 后台加载任务，用于报告进度和检查取消
+            bank_file (str): 题库文件路径
+
+        Returns:
+            tuple: (题目对象列表, 缓存的检索索引或None, 缓存键或None)
+        """
+        if not self.bank_cache:
+            return parse_with_progress(self.parser_service, bank_file, loader), None, None
+
+        try:
+            key = self.bank_cache.fingerprint(bank_file)
+            questions = self.bank_cache.get(key, bank_file)
+        except OSError as e:
+            self.logger.warning(f"计算题库指纹失败: {str(e)}")
+            return parse_with_progress(self.parser_service, bank_file, loader), None, None
+
+        if questions is None:
+            loader.check_cancelled()
+            questions = parse_with_progress(self.parser_service, bank_file, loader)
+            self.bank_cache.put(key, questions, bank_file)
+            return questions, None, key
+
+        loader.report(LoadProgress(len(questions), len(questions), 'cache', len(questions)), questions)
+        search_index = self.bank_cache.get_index(key)
+        if search_index is not None and search_index.count != len(questions):
+            search_index = None
+        return questions, search_index, key
+
+    def _start_index_builder(self, cache_key):
+        """
+        题库加载完成后，检索索引不覆盖全部题目时在后台线程中构建
+
+        直接打开的题目存储（编译题库、SQLite 题库）自带检索，不构建索引。
+
+        Args:
+            cache_key (str): 题库在缓存中的键，构建的索引写入缓存；为None时不写入
+        """
+        bank = self.question_bank
+        if bank is None or bank.loading or self.index_builder:
+            return
+        if not isinstance(bank.questions, QuestionStore):
+            return
+        index = bank.search_index
+        if index is not None and index.count == bank.get_question_count():
+            return
+
+        builder = BackgroundLoader(self._build_search_index, bank.questions, cache_key)
+        self.index_builder = builder
+        builder.start()
+        self.view.root.after(LOAD_POLL_INTERVAL_MS, self._poll_index_builder, builder)
+
+    def _build_search_index(self, loader, questions, cache_key):
+        """
+        构建全部题目的检索索引并写入缓存（在后台线程中运行）
+
+        Args:
+            loader (BackgroundLoader): 后台任务，用于检查取消
+            questions (QuestionStore): 加载完成的题目存储
+            cache_key (str): 题库在缓存中的键，为None时不写入缓存
+
+        Returns:
+            SearchIndex: 检索索引
+        """
+        start = time.perf_counter()
+        index = SearchIndex()
+        for position in range(len(questions)):
+            if position % _INDEX_CANCEL_INTERVAL == 0:
+                loader.check_cancelled()
+            index.add(questions[position])
+        self.logger.info(f"构建检索索引: {index.count} 道题目, "
+                         f"{(time.perf_counter() - start) * 1000:.0f} ms")
+
+        if self.bank_cache and cache_key:
+            self.bank_cache.put_index(cache_key, index)
+        return index
+
+    def _poll_index_builder(self, builder):
+        """
+        检查后台构建检索索引的结果（在界面线程中定期调用）
+
+        构建完成后执行等待中的检索；构建失败时检索退回逐题匹配。
+
+        Args:
+            builder (BackgroundLoader): 构建检索索引的后台任务
+        """
+        if builder is not self.index_builder:
+            return  # 题库已被取代
+
+        for event, data in builder.poll():
+            if event not in ('done', 'error'):
+                continue
+            self.index_builder = None
+            if event == 'done':
+                self.question_bank.search_index = data
+            else:
+                self.logger.warning(f"构建检索索引失败: {str(data)}")
+            self._run_pending_search()
+            return
+
+        self.view.root.after(LOAD_POLL_INTERVAL_MS, self._poll_index_builder, builder)
+
+    def _search_index_ready(self):
+        """
+        检索索引是否已覆盖全部题目（直接打开的题目存储自带检索，总是就绪）
+
+        Returns:
+            bool: 是否可以立即检索
+        """
+        bank = self.question_bank
+        if not isinstance(bank.questions, QuestionStore):
+            return True
+        if bank.loading or self.index_builder:
+            return False
+        index = bank.search_index
+        return index is not None and index.count == bank.get_question_count()
+
+    def show_current_question(self, show_answer=True):
+        """
+        显示当前题目
+
+        Args:
+            show_answer (bool): 是否显示已保存的答案；需要重新作答的题目（如到期复习的题目）为False，
+                只在界面上不显示上次的选择，已保存的答案、统计和答案日志都不变，重新作答时才被新答案取代
+        """
         if not self.question_bank:
             return
 
@@ -118,38 +567,64 @@ class AppController:
         if question:
             self.view.question_frame.display_question(question)
             self.view.feedback_frame.reset()
-            self.view.update_status(
-                self.question_bank.current_index + 1,
-                self.question_bank.get_question_count()
-            )
+            self._update_status()
 
             # 更新做题统计信息
             self._update_stats()
 
             # 如果有用户答案，显示
             user_answer = self.question_bank.get_user_answer(self.question_bank.current_index)
-            if user_answer:
+            if user_answer and show_answer:
                 self.view.question_frame.set_selected_answer(user_answer)
-                self.check_answer(user_answer)
+                self.check_answer(user_answer, graded=False)
 
     def next_question(self):
         """下一题"""
         if self.question_bank:
             # 如果不保存做题记录，则在切换题目时清空用户答案
             if not self.save_records:
-                self.question_bank.user_answers = {}
-
-            self.question_bank.next_question(self.random_mode)
-            self.show_current_question()
+                self.question_bank.clear_user_answers()
+
+            # 增量加载中已到达最后一道已加载的题目：等下一题加载后再显示
+            bank = self.question_bank
+            if (bank.loading and self.practice_mode == MODE_SEQUENTIAL and
+                    bank.current_index >= bank.get_question_count() - 1):
+                self.pending_index = bank.current_index + 1
+                self._update_status()
+                return
+
+            self.pending_index = None
+            show_answer = True
+            if self.practice_mode == MODE_REVIEW:
+                bank.next_review_question()
+                # 复习到期的题目需要重新作答，不显示上次的答案（答案本身保留，重新作答时才被取代）
+                show_answer = False
+            elif self.practice_mode == MODE_MISTAKES:
+                if bank.next_mistake_question() is None:
+                    self.view.show_info("错题练习", "错题本中没有题目")
+                    return
+                # 错题需要重新作答，不显示上次的答案（答案本身保留，重新作答时才被取代）
+                show_answer = False
+            else:
+                bank.next_question(self.practice_mode == MODE_RANDOM)
+            self.show_current_question(show_answer)
 
     def prev_question(self):
         """上一题"""
         if self.question_bank:
             # 如果不保存做题记录，则在切换题目时清空用户答案
             if not self.save_records:
-                self.question_bank.user_answers = {}
-
-            self.question_bank.prev_question(self.random_mode)
+                self.question_bank.clear_user_answers()
+
+            self.pending_index = None
+            if self.practice_mode == MODE_REVIEW:
+                self.question_bank.prev_review_question()
+            elif self.practice_mode == MODE_MISTAKES:
+                if self.question_bank.prev_mistake_question() is None:
+                    self.view.show_info("错题练习", "错题本中没有题目")
+                    return
+            else:
+                self.question_bank.prev_question(self.practice_mode == MODE_RANDOM)
             self.show_current_question()
 
     def jump_to_question(self, question_num):
@@ -174,12 +649,18 @@ class AppController:
                 if 0 <= index < self.question_bank.get_question_count():
                     # 如果不保存做题记录，则在切换题目时清空用户答案
                     if not self.save_records:
-                        self.question_bank.user_answers = {}
+                        self.question_bank.clear_user_answers()
 
                     # 执行跳转并显示题目
+                    self.pending_index = None
                     self.question_bank.jump_to_question(index)
                     self.show_current_question()
                     return True
+                elif index > 0 and self.question_bank.loading:
+                    # 题目尚未加载：记下目标，加载到后自动跳转
+                    self.pending_index = index
+                    self._update_status()
+                    return True
                 else:
                     # 题号超出范围，显示错误信息
                     self.view.show_error(
@@ -191,12 +672,108 @@ class AppController:
                 self.view.show_error("错误", "请输入有效的题号数字")
         return False
 
-    def check_answer(self, user_answer):
+    def search_questions(self, keyword):
+        """
+        按关键词检索题目，只有一个结果时直接跳转，否则显示结果列表
+
+        检索索引尚未就绪时不等待：先显示提示索引构建中的结果对话框，索引构建完成后再填入结果。
+
+        Args:
+            keyword (str): 关键词，以空白分隔时要求同时包含全部词
+
+        Returns:
+            bool: 找到题目返回True，否则返回False
+        """
+        if not self.question_bank:
+            return False
+        keyword = keyword.strip()
+        if not keyword:
+            self.view.show_error("错误", "请输入题号或关键词")
+            return False
+
+        if not self._search_index_ready():
+            self._close_search_dialog()
+            self._start_index_builder(None)
+            self.pending_search = keyword
+            self.search_dialog = self.view.show_search_results(
+                keyword, None, 0, self._on_search_result_selected
+            )
+            return True
+
+        indexes, elapsed_ms = self._search(keyword)
+        if not indexes:
+            self.view.show_info("检索", f"没有找到包含“{keyword}”的题目")
+            return False
+        if len(indexes) == 1:
+            return self.jump_to_question(indexes[0] + 1)
+
+        self._close_search_dialog()
+        self.search_dialog = self.view.show_search_results(
+            keyword, self._search_results(indexes), elapsed_ms, self._on_search_result_selected
+        )
+        return True
+
+    def _search(self, keyword):
+        """
+        在当前题库中检索关键词
+
+        Args:
+            keyword (str): 关键词
+
+        Returns:
+            tuple: (匹配题目的索引列表, 检索耗时毫秒数)
+        """
+        start = time.perf_counter()
+        indexes = self.question_bank.search(keyword, SEARCH_RESULT_LIMIT)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.logger.info(f"检索“{keyword}”: {len(indexes)} 个结果, {elapsed_ms:.1f} ms")
+        return indexes, elapsed_ms
+
+    def _search_results(self, indexes):
+        """
+        生成检索结果列表
+
+        Args:
+            indexes (list): 匹配题目的索引
+
+        Returns:
+            list: (题目索引, 题目文本) 列表
+        """
+        bank = self.question_bank
+        return [(index, bank.get_question(index).text) for index in indexes]
+
+    def _run_pending_search(self):
+        """检索索引就绪后执行等待中的检索，把结果填入已显示的结果对话框"""
+        keyword = self.pending_search
+        self.pending_search = None
+        if keyword is None or not self.search_dialog:
+            return
+        indexes, elapsed_ms = self._search(keyword)
+        self.search_dialog.show_results(self._search_results(indexes), elapsed_ms)
+
+    def _on_search_result_selected(self, index):
+        """
+        跳转到检索结果中选中的题目
+
+        Args:
+            index (int): 题目索引
+        """
+        self.jump_to_question(index + 1)
+
+    def _close_search_dialog(self):
+        """关闭检索结果对话框"""
+        self.pending_search = None
+        if self.search_dialog:
+            self.search_dialog.close()
+            self.search_dialog = None
+
+    def check_answer(self, user_answer, graded=True):
         """
         检查答案
 
         Args:
             user_answer (str): 用户答案
+            graded (bool): 是否为用户本次作答；重新显示已保存的答案时为False，不计入间隔复习
         """
         if not self.question_bank:
             return
@@ -208,6 +785,8 @@ class AppController:
 
             # 检查答案
             is_correct = question.check_answer(user_answer)
+            if graded and self.practice_mode == MODE_REVIEW:
+                self.question_bank.record_review(self.question_bank.current_index, is_correct)
             self.view.feedback_frame.show_feedback(
                 is_correct,
                 user_answer,
@@ -225,7 +804,51 @@ class AppController:
         Args:
             is_random (bool): 是否随机模式
         """
-        self.random_mode = is_random
+        self.set_practice_mode(MODE_RANDOM if is_random else MODE_SEQUENTIAL)
+
+    def set_practice_mode(self, mode):
+        """
+        切换练习模式，进入间隔复习模式时直接显示最早到期的题目，进入错题练习模式时显示下一道错题
+
+        Args:
+            mode (str): MODE_SEQUENTIAL、MODE_RANDOM、MODE_REVIEW 或 MODE_MISTAKES
+        """
+        previous, self.practice_mode = self.practice_mode, mode
+        if mode == previous or not self.question_bank:
+            return
+        if mode == MODE_MISTAKES and not self.question_bank.mistakes:
+            # 错题本为空：留在原来的模式
+            self.practice_mode = previous
+            self.view.navigation_frame.set_practice_mode(previous)
+            self.view.show_info("错题练习", "错题本中没有题目，答错的题目会自动加入错题本")
+            return
+        if mode in (MODE_REVIEW, MODE_MISTAKES):
+            self.next_question()
+
+    def export_mistakes(self):
+        """
+        把错题本中的题目导出为文本题库
+
+        Returns:
+            bool: 导出成功返回True，否则返回False
+        """
+        bank = self.question_bank
+        if not bank or not bank.mistakes:
+            self.view.show_info("导出错题", "错题本中没有题目")
+            return False
+
+        name = os.path.splitext(os.path.basename(bank.file_path.rstrip('/\\')))[0]
+        file_path = self.file_service._save_file_dialog(self, "导出错题", f"{name}_错题本.txt")
+        if not file_path:
+            return False
+        try:
+            count = export_questions(bank.questions, bank.mistakes, file_path)
+        except OSError as e:
+            self.logger.error(f"导出错题失败: {str(e)}")
+            self.view.show_error("错误", f"导出错题失败: {str(e)}")
+            return False
+        self.view.show_info("导出错题", f"已导出 {count} 道错题到:\n{file_path}")
+        return True
 
     def set_save_records(self, save_records):
         """
@@ -235,21 +858,42 @@ class AppController:
             save_records (bool): 是否保存做题记录
         """
         self.save_records = save_records
+        bank = self.question_bank
+        if not bank:
+            return
 
-        # 如果取消保存做题记录，则清空所有用户答案
-        if not save_records and self.question_bank:
-            self.question_bank.user_answers = {}
+        if save_records:
+            # 重新保存做题记录：恢复答案日志中的答案
+            if self.session_path == bank.file_path and bank.journal is None:
+                self._open_journal()
+                self.show_current_question()
+        else:
+            # 取消保存做题记录：停止写入答案日志（已保存的答案保留），清空所有用户答案
+            bank.detach_journal()
+            bank.clear_user_answers()
             self.show_current_question()
 
+    def _update_status(self):
+        """更新状态栏的题号、题目数量和加载状态"""
+        bank = self.question_bank
+        waiting_for = self.pending_index + 1 if self.pending_index is not None else None
+        self.view.update_status(
+            bank.current_index + 1,
+            bank.get_question_count(),
+            bank.loading,
+            waiting_for
+        )
+
     def _update_stats(self):
         """更新做题统计信息"""
         if not self.question_bank:
             return
 
-        # 计算统计信息
-        total_answered = len(self.question_bank.user_answers)
-        correct_count = self.question_bank.get_correct_count()
-        incorrect_count = total_answered - correct_count
+        # 读取累计的统计信息，不重新比对全部答案
+        stats = self.question_bank.answer_stats
+        total_answered = stats.answered
+        correct_count = stats.correct
+        incorrect_count = stats.incorrect
 
         # 更新导航框架中的统计信息显示
         self.view.navigation_frame.update_stats(
@@ -258,12 +902,23 @@ class AppController:
             incorrect_count
         )
 
+    def show_stats_breakdown(self):
+        """显示按来源文件分组的做题统计"""
+        if not self.question_bank:
+            return
+        stats = self.question_bank.answer_stats
+        if not stats.answered:
+            self.view.show_info("做题统计", "还没有做题记录")
+            return
+
+        lines = [f"共做{stats.answered}题，{stats.correct}道正确，正确率 {stats.correct / stats.answered:.0%}"]
+        for source, answered, correct in stats.groups():
+            source = os.path.basename(source or self.question_bank.file_path.rstrip('/\\'))
+            lines.append(f"{source}: 做{answered}题，{correct}道正确，正确率 {correct / answered:.0%}")
+        self.view.show_info("做题统计", "\n".join(lines))
+
     def reselect_question_bank(self):
         """重新选取题库"""
-        # 清空做题记录
-        if self.question_bank:
-            self.question_bank.user_answers = {}
-
         # 隐藏做题窗口
         self.view.root.withdraw()
 
@@ -272,12 +927,65 @@ class AppController:
 
         # 如果用户取消选择，显示原窗口
         if file_path is None:
-            self.view.root.deiconify()
+            self.view.show()
         # 如果已成功加载题库文件（返回"loaded"），窗口显示已由load_question_bank处理
         # 其他情况（例如选择了文件但加载失败）不需要特殊处理
 
+    def reselect_question_folder(self):
+        """选取题库文件夹"""
+        directory = self.file_service._open_directory_dialog()
+        if directory:
+            self.load_question_folder(directory)
+
+    def _restore_session(self):
+        """题库完整加载后恢复上次保存的练习进度"""
+        bank = self.question_bank
+        self.session_path = bank.file_path
+        session = self.session_store.load(bank.file_path)
+        if bank.shuffle_order is None and session.get('shuffle'):
+            if bank.restore_shuffle_order(session['shuffle']):
+                self.logger.info("已恢复随机模式的做题顺序")
+        if bank.review_scheduler is None and session.get('review'):
+            if bank.restore_review_scheduler(session['review']):
+                self.logger.info(f"已恢复间隔复习记录，共 {len(bank.review_scheduler)} 道题目")
+        if isinstance(session.get('mistakes'), list):
+            restored = bank.restore_mistakes(session['mistakes'])
+            self.logger.info(f"已恢复错题本，共 {restored} 道题目")
+        if self.save_records:
+            self._open_journal()
+
+    def _open_journal(self):
+        """打开当前题库的答案日志，恢复上次记录的答案"""
+        bank = self.question_bank
+        start = time.perf_counter()
+        journal = self.session_store.open_journal(bank.file_path)
+        if journal is None:
+            return
+        restored = bank.attach_journal(journal)
+        self.logger.info(f"已恢复 {restored} 道题目的答案，"
+                         f"耗时 {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def save_session(self):
+        """保存当前题库的练习进度并关闭答案日志（切换题库和退出程序前调用）"""
+        bank = self.question_bank
+        if bank is None:
+            return
+        bank.detach_journal()
+        if self.session_path != bank.file_path:
+            return
+        session = {}
+        if bank.shuffle_order is not None:
+            session['shuffle'] = bank.shuffle_order.to_state()
+        if bank.review_scheduler is not None:
+            session['review'] = bank.review_scheduler.to_state()
+        session['mistakes'] = bank.mistakes.to_state()
+        self.session_store.save(bank.file_path, session)
+
     def exit_application(self):
         """退出应用程序"""
+        self.save_session()
+        if self.question_bank:
+            self.question_bank.close()
         if self.view:
             self.view.destroy()
         # 确保程序完全退出
@@ -10,25 +10,185 @@ MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
 See the Mulan PSL v2 for more details.
 """
 
+import os
 import sys
+from utils import startup_profiler
 from controllers.app_controller import AppController
 from views.app_view import AppView
 from utils.logger import get_logger
 
+def compile_command(args):
+    """
+    编译题库：解析题库文件并写入可直接按索引读取的编译题库（.qbc）
+
+    输出文件扩展名为 .qdb 时改为导入带全文索引的 SQLite 题库。
+
+    用法: python main.py --compile 输入文件 [输出文件]
+
+    Args:
+        args (list): --compile 之后的命令行参数
+
+    Returns:
+        int: 进程退出状态
+    """
+    if not args or len(args) > 2:
+        print("用法: python main.py --compile 输入文件 [输出文件]", file=sys.stderr)
+        return 2
+
+    from services.parser_service import ParserService
+    from services.compiled_bank import COMPILED_EXTENSION, compile_bank
+    from services.sqlite_bank import SQLITE_EXTENSION, build_sqlite_bank
+
+    input_path = args[0]
+    output_path = args[1] if len(args) > 1 else os.path.splitext(input_path)[0] + COMPILED_EXTENSION
+    write = compile_bank
+    if os.path.splitext(output_path)[1].lower() == SQLITE_EXTENSION:
+        write = build_sqlite_bank
+    try:
+        count = write(ParserService().iter_questions(input_path), output_path)
+    except Exception as e:
+        print(f"编译失败: {str(e)}", file=sys.stderr)
+        return 1
+
+    print(f"已编译 {count} 道题目: {output_path}")
+    return 0
+
+
+def dedup_command(args):
+    """
+    检测题库中的近似重复题目，输出重复组数和答案不一致的题目
+
+    用法: python main.py --dedup 题库文件或文件夹
+
+    Args:
+        args (list): --dedup 之后的命令行参数
+
+    Returns:
+        int: 进程退出状态，发现答案不一致的重复题目时为1
+    """
+    if len(args) != 1:
+        print("用法: python main.py --dedup 题库文件或文件夹", file=sys.stderr)
+        return 2
+
+    from models.question_bank import QuestionBank
+    from services.parser_service import ParserService
+    from services.import_service import ImportService
+    from services.dedup_service import find_duplicates
+
+    path = args[0]
+    try:
+        if os.path.isdir(path):
+            questions, _ = ImportService().import_directory(path)
+        else:
+            questions = ParserService().iter_questions(path)
+        bank = QuestionBank(questions, path)
+    except Exception as e:
+        print(f"读取题库失败: {str(e)}", file=sys.stderr)
+        return 2
+
+    report = find_duplicates(bank.questions)
+    print(report.summary(bank.questions))
+    return 1 if report.conflicts else 0
+
+
+def serve_command(args):
+    """
+    启动无界面的练习服务（HTTP/JSON），多个学员同时练习
+
+    每个题库文件或文件夹加载一次，题库名为文件名（不含扩展名）。
+
+    用法: python main.py --serve 题库文件或文件夹... [--host 地址] [--port 端口]
+
+    Args:
+        args (list): --serve 之后的命令行参数
+
+    Returns:
+        int: 进程退出状态
+    """
+    usage = "用法: python main.py --serve 题库文件或文件夹... [--host 地址] [--port 端口]"
+    from config.settings import SERVER_HOST, SERVER_PORT
+
+    host, port, paths = SERVER_HOST, SERVER_PORT, []
+    args = list(args)
+    try:
+        while args:
+            arg = args.pop(0)
+            if arg == '--host':
+                host = args.pop(0)
+            elif arg == '--port':
+                port = int(args.pop(0))
+            else:
+                paths.append(arg)
+    except (IndexError, ValueError):
+        print(usage, file=sys.stderr)
+        return 2
+    if not paths:
+        print(usage, file=sys.stderr)
+        return 2
+
+    import asyncio
+    from services.practice_server import PracticeServer, load_bank
+
+    banks = {}
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path.rstrip('/\\')))[0]
+        while name in banks:
+            name += "_"
+        try:
+            banks[name] = load_bank(path)
+        except Exception as e:
+            print(f"读取题库失败: {str(e)}", file=sys.stderr)
+            return 2
+        print(f"已加载题库 {name}: {banks[name].get_question_count()} 道题目", flush=True)
+
+    def ready(address):
+        print(f"练习服务已启动: http://{address[0]}:{address[1]}", flush=True)
+
+    try:
+        asyncio.run(PracticeServer(banks).serve(host, port, ready))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"启动练习服务失败: {str(e)}", file=sys.stderr)
+        return 1
+    return 0
+
+
 def main():
     """
     应用程序主入口函数
 
     初始化应用程序控制器和视图，启动基金考试题库系统。
     处理全局异常并记录日志。
+
+    命令行参数 --profile-startup：启动性能分析模式，输出从导入到第一个文件对话框
+    出现前各阶段的耗时后退出。
+    命令行参数 --compile 输入文件 [输出文件]：编译题库后退出，不打开界面。
+    命令行参数 --dedup 题库文件或文件夹：检测近似重复的题目后退出，不打开界面。
+    命令行参数 --serve 题库文件或文件夹... [--host 地址] [--port 端口]：启动无界面的练习服务。
     """
+    if sys.argv[1:2] == ['--compile']:
+        sys.exit(compile_command(sys.argv[2:]))
+    if sys.argv[1:2] == ['--dedup']:
+        sys.exit(dedup_command(sys.argv[2:]))
+    if sys.argv[1:2] == ['--serve']:
+        sys.exit(serve_command(sys.argv[2:]))
+
+    if '--profile-startup' in sys.argv[1:]:
+        # 计时起点是 startup_profiler 被导入时，此处记录的是模块导入耗时
+        startup_profiler.enable()
+        startup_profiler.mark('imports')
+
     logger = get_logger()
     logger.info("启动基金考试题库系统")
+    startup_profiler.mark('logger')
 
     try:
         # 创建应用控制器和主视图
         controller = AppController()
+        startup_profiler.mark('controller')
         view = AppView(controller)
+        startup_profiler.mark('view')
 
         # 设置控制器的视图引用
         controller.set_view(view)
@@ -36,6 +196,7 @@ def main():
         # 启动应用程序
         controller.start()  # 初始化控制器，打开文件选择对话框
         view.start()        # 启动主窗口事件循环
+        controller.save_session()  # 主窗口关闭后保存练习进度
     except Exception as e:
         # 异常捕获和日志记录
         logger.error(f"应用程序运行出错: {str(e)}")
@@ -45,4 +206,8 @@ def main():
     logger.info("应用程序退出")
 
 if __name__ == "__main__":
+    # 打包为可执行文件后，进程池的子进程需要此调用；脚本模式下不导入 multiprocessing
+    if getattr(sys, 'frozen', False):
+        import multiprocessing
+        multiprocessing.freeze_support()
     main()
\ No newline at end of file
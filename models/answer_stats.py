@@ -0,0 +1,79 @@
+from collections import Counter
+
+
+class AnswerStats:
+    """
+    做题统计的累计计数
+
+    每次作答、改答或撤销答案时按差值更新已做、答对的数量，读取统计是 O(1)，
+    不需要重新比对全部答案。可选按分组（如来源文件）分别计数。
+    """
+
+    def __init__(self, group_of=None):
+        """
+        初始化做题统计
+
+        Args:
+            group_of (callable): 根据题目索引返回所属分组的函数，不提供时不分组统计
+        """
+        self.group_of = group_of
+        self.answered = 0
+        self.correct = 0
+        self._groups = {}  # 分组 -> [已做数量, 答对数量]
+
+    @property
+    def incorrect(self):
+        """答错的数量"""
+        return self.answered - self.correct
+
+    def update(self, index, previous, current):
+        """
+        按一道题的作答结果变化更新计数
+
+        Args:
+            index (int): 题目索引
+            previous (bool): 原来的结果，True 为答对、False 为答错、None 为未作答
+            current (bool): 新的结果，取值同上
+        """
+        if previous is current:
+            return
+        answered = (current is not None) - (previous is not None)
+        correct = (current is True) - (previous is True)
+        self.answered += answered
+        self.correct += correct
+        if self.group_of is not None:
+            counts = self._groups.setdefault(self.group_of(index), [0, 0])
+            counts[0] += answered
+            counts[1] += correct
+
+    def add_many(self, indexes, results):
+        """
+        一次加入多道新作答题目的结果（如恢复保存的答案），比逐题调用 update 快
+
+        Args:
+            indexes (list): 题目索引，之前均未作答
+            results (list): 对应的结果，True 为答对、False 为答错
+        """
+        self.answered += len(results)
+        self.correct += sum(results)
+        if self.group_of is not None:
+            for (group, correct), count in Counter(zip(map(self.group_of, indexes), results)).items():
+                counts = self._groups.setdefault(group, [0, 0])
+                counts[0] += count
+                if correct:
+                    counts[1] += count
+
+    def reset(self):
+        """清空计数"""
+        self.answered = 0
+        self.correct = 0
+        self._groups = {}
+
+    def groups(self):
+        """
+        分组统计
+
+        Returns:
+            list: (分组, 已做数量, 答对数量)，按分组第一次作答的顺序，不含已做数量为0的分组
+        """
+        return [(group, answered, correct) for group, (answered, correct) in self._groups.items() if answered]
@@ -0,0 +1,166 @@
+import time
+import random
+from models.answer_stats import AnswerStats
+
+# 练习模式：顺序、随机抽题
+MODE_SEQUENTIAL = 'sequential'
+MODE_RANDOM = 'random'
+
+# 随机顺序用的 Feistel 网络轮数
+_FEISTEL_ROUNDS = 4
+_MASK32 = 0xFFFFFFFF
+
+
+def _mix(value):
+    """32位整数哈希（Feistel 网络的轮函数）"""
+    value = (value ^ (value >> 16)) * 0x45D9F3B & _MASK32
+    value = (value ^ (value >> 16)) * 0x45D9F3B & _MASK32
+    return value ^ (value >> 16)
+
+
+def permute(position, count, key):
+    """
+    按伪随机排列把位置映射为题目索引，不需要生成整个排列
+
+    在覆盖 count 的最小的 4^k 范围上做 Feistel 网络（一一映射），结果超出 count 时继续映射
+    （cycle walking），平均不到4次即落在范围内。同一个 key 下 0..count-1 的位置恰好对应
+    0..count-1 的每个索引各一次。
+
+    Args:
+        position (int): 在排列中的位置，0 <= position < count
+        count (int): 题目数量
+        key (int): 排列的密钥（32位）
+
+    Returns:
+        int: 题目索引
+    """
+    half = max(1, ((count - 1).bit_length() + 1) // 2)
+    mask = (1 << half) - 1
+    value = position
+    while True:
+        left, right = value >> half, value & mask
+        for round_key in range(key, key + _FEISTEL_ROUNDS):
+            left, right = right, left ^ (_mix((right ^ round_key) & _MASK32) & mask)
+        value = (left << half) | right
+        if value < count:
+            return value
+
+
+class LearnerSession:
+    """
+    练习服务中一位学员的练习进度
+
+    只保存游标、答案和统计，题库本身由全部学员共享（只读）。随机模式的做题顺序由种子和轮次
+    决定，按需计算当前位置对应的题目，不为每位学员生成整个排列，大题库、大量学员时内存占用很小。
+    """
+
+    __slots__ = ('bank', 'mode', 'seed', 'round_number', 'round_count', 'cursor', 'current',
+                 'answers', 'stats', 'last_active')
+
+    def __init__(self, bank, mode=MODE_SEQUENTIAL, seed=None):
+        """
+        初始化练习进度，当前题目为顺序的第一题或随机顺序的第一题
+
+        Args:
+            bank (QuestionBank): 共享的题库
+            mode (str): MODE_SEQUENTIAL 或 MODE_RANDOM
+            seed (int): 随机顺序的种子，默认随机生成
+
+        Raises:
+            ValueError: 练习模式无效
+        """
+        if mode not in (MODE_SEQUENTIAL, MODE_RANDOM):
+            raise ValueError(f"无效的练习模式: {mode}")
+        self.bank = bank
+        self.mode = mode
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.round_number = 0
+        self.round_count = bank.get_question_count()  # 本轮随机顺序的题目数量
+        self.cursor = 0  # 在本轮顺序中的位置
+        self.current = self._index_at(0)  # 当前题目索引（跳转后可能不在顺序的游标处）
+        self.answers = {}  # 题目索引 -> 答案
+        self.stats = AnswerStats()
+        self.last_active = time.monotonic()
+
+    def _index_at(self, cursor):
+        """本轮顺序中某个位置的题目索引"""
+        if self.mode == MODE_SEQUENTIAL or not self.round_count:
+            return cursor
+        key = (self.seed * 1000003 + self.round_number) & _MASK32
+        return permute(cursor, self.round_count, key)
+
+    def next(self):
+        """
+        移动到下一题；随机模式一轮做完时开始新的一轮
+
+        Returns:
+            int: 当前题目索引
+        """
+        count = self.bank.get_question_count()
+        if self.mode == MODE_SEQUENTIAL:
+            if self.current < count - 1:
+                self.current += 1
+            self.cursor = self.current
+        else:
+            if self.cursor + 1 < self.round_count:
+                self.cursor += 1
+            else:
+                self.round_number += 1
+                self.round_count = count
+                self.cursor = 0
+            self.current = self._index_at(self.cursor)
+        return self.current
+
+    def prev(self):
+        """
+        移动到上一题；随机模式在本轮第一题时不动
+
+        Returns:
+            int: 当前题目索引
+        """
+        if self.mode == MODE_SEQUENTIAL:
+            if self.current > 0:
+                self.current -= 1
+            self.cursor = self.current
+        else:
+            if self.cursor > 0:
+                self.cursor -= 1
+            self.current = self._index_at(self.cursor)
+        return self.current
+
+    def jump(self, index):
+        """
+        跳转到指定题目；随机模式下不改变做题顺序，下一题从原来的位置继续
+
+        Args:
+            index (int): 题目索引
+
+        Returns:
+            bool: 索引有效并已跳转返回True
+        """
+        if not 0 <= index < self.bank.get_question_count():
+            return False
+        self.current = index
+        if self.mode == MODE_SEQUENTIAL:
+            self.cursor = index
+        return True
+
+    def answer(self, answer):
+        """
+        作答当前题目，改答时按差值更新统计
+
+        Args:
+            answer (str): 用户答案
+
+        Returns:
+            bool: 是否答对
+        """
+        index = self.current
+        correct_answer = self.bank.questions.answer(index).upper()
+        is_correct = answer.upper() == correct_answer
+        previous = self.answers.get(index)
+        if previous != answer:
+            was_correct = None if previous is None else previous.upper() == correct_answer
+            self.stats.update(index, was_correct, is_correct)
+            self.answers[index] = answer
+        return is_correct
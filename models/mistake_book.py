@@ -0,0 +1,127 @@
+from array import array
+
+# 失效项少于此数时不整理，避免错题很少时频繁重建
+_MIN_COMPACT = 64
+
+
+class MistakeBook:
+    """
+    错题本：最近一次作答错误的题目集合
+
+    按题目第一次答错的先后排列，错题练习模式按此顺序循环。加入、移除和判断是否在错题本中都是 O(1)：
+    题目按加入顺序追加到数组末尾，字典记录每道错题在数组中的位置，移除时只删除字典中的记录，
+    数组中留下的失效项在循环时跳过，失效项多于有效项时整理数组（均摊 O(1)）。
+    """
+
+    def __init__(self, indexes=()):
+        """
+        初始化错题本
+
+        Args:
+            indexes (iterable): 初始的错题索引，按加入顺序
+        """
+        self._order = array('I')  # 按加入顺序排列的题目索引，可能含失效项
+        self._positions = {}  # 错题索引 -> 在 _order 中的位置
+        self._cursor = -1  # 错题练习模式当前题目在 _order 中的位置
+        for index in indexes:
+            self.add(index)
+
+    def __len__(self):
+        """错题数量"""
+        return len(self._positions)
+
+    def __contains__(self, index):
+        """题目是否在错题本中"""
+        return index in self._positions
+
+    def __iter__(self):
+        """按加入顺序遍历错题索引"""
+        return iter(self._positions)
+
+    def add(self, index):
+        """
+        加入错题，已在错题本中的题目保持原来的位置
+
+        Args:
+            index (int): 题目索引
+        """
+        if index not in self._positions:
+            self._positions[index] = len(self._order)
+            self._order.append(index)
+
+    def discard(self, index):
+        """
+        移除错题（如错题已答对），不在错题本中时不做任何事
+
+        Args:
+            index (int): 题目索引
+        """
+        if self._positions.pop(index, None) is not None:
+            stale = len(self._order) - len(self._positions)
+            if stale > _MIN_COMPACT and stale > len(self._positions):
+                self._compact()
+
+    def _valid(self, position):
+        """数组中该位置的题目是否仍是错题"""
+        return self._positions.get(self._order[position]) == position
+
+    def _compact(self):
+        """去掉数组中的失效项，游标移到原位置之前最近的有效项"""
+        cursor = self._cursor
+        new_cursor = -1
+        order = array('I')
+        for position, index in enumerate(self._order):
+            if self._positions.get(index) == position:
+                if position <= cursor:
+                    new_cursor = len(order)
+                self._positions[index] = len(order)
+                order.append(index)
+        self._order = order
+        self._cursor = new_cursor
+
+    def next(self):
+        """
+        错题练习模式：移动到下一道错题，到末尾后从头开始
+
+        Returns:
+            int: 题目索引，错题本为空时返回None
+        """
+        if not self._positions:
+            return None
+        size = len(self._order)
+        position = self._cursor + 1
+        while True:
+            if position >= size:
+                position = 0
+            if self._valid(position):
+                self._cursor = position
+                return self._order[position]
+            position += 1
+
+    def prev(self):
+        """
+        错题练习模式：移动到上一道错题，到开头后从末尾开始
+
+        Returns:
+            int: 题目索引，错题本为空时返回None
+        """
+        if not self._positions:
+            return None
+        size = len(self._order)
+        position = self._cursor - 1
+        while True:
+            if position < 0:
+                position = size - 1
+            if self._valid(position):
+                self._cursor = position
+                return self._order[position]
+            position -= 1
+
+    def to_state(self):
+        """
+        导出可以保存为 JSON 的错题列表
+
+        Returns:
+            list: 按加入顺序排列的错题索引
+        """
+        return list(self._positions)
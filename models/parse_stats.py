@@ -0,0 +1,81 @@
+import time
+
+
+class ParseStats:
+    """一次解析的分阶段耗时和计数"""
+
+    # 参与统计的阶段，依次为读取、解码、行识别、题目组装、最终处理
+    STAGES = ('read', 'decode', 'classify', 'assemble', 'finalize')
+
+    def __init__(self, file_path=""):
+        """
+        初始化解析统计
+
+        Args:
+            file_path (str): 被解析的文件路径
+        """
+        self.file_path = file_path
+        self.started = time.perf_counter()
+        self.read_seconds = 0.0
+        self.decode_seconds = 0.0
+        self.classify_seconds = 0.0
+        self.assemble_seconds = 0.0
+        self.finalize_seconds = 0.0
+        self.total_seconds = 0.0
+        self.line_count = 0
+        self.bytes_read = 0
+        self.question_count = 0
+
+    def merge(self, other):
+        """
+        累加另一份统计（如分块解析时各工作进程的统计）
+
+        并行解析时各阶段耗时是所有进程耗时之和，可能大于总耗时。
+
+        Args:
+            other (ParseStats): 另一份统计
+        """
+        for stage in self.STAGES:
+            attr = stage + '_seconds'
+            setattr(self, attr, getattr(self, attr) + getattr(other, attr))
+        self.line_count += other.line_count
+        self.bytes_read += other.bytes_read
+
+    def finish(self, question_count):
+        """
+        记录解析结束
+
+        Args:
+            question_count (int): 解析出的题目数量
+        """
+        self.question_count = question_count
+        self.total_seconds = time.perf_counter() - self.started
+
+    def as_dict(self):
+        """
+        转换为字典，便于输出或比较
+
+        Returns:
+            dict: 各阶段耗时（秒）及计数
+        """
+        result = {stage: getattr(self, stage + '_seconds') for stage in self.STAGES}
+        result['total'] = self.total_seconds
+        result['lines'] = self.line_count
+        result['bytes'] = self.bytes_read
+        result['questions'] = self.question_count
+        return result
+
+    def summary(self):
+        """
+        生成一行统计摘要
+
+        Returns:
+            str: 摘要文本
+        """
+        stages = ", ".join(f"{stage} {getattr(self, stage + '_seconds'):.3f}s" for stage in self.STAGES)
+        return (f"解析统计: {self.line_count} 行, {self.question_count} 道题目, "
+                f"总耗时 {self.total_seconds:.3f}s ({stages})")
+
+    def __str__(self):
+        """返回统计的字符串表示"""
+        return self.summary()
@@ -1,20 +1,37 @@
 class Question:
-    """题目模型类，表示一个考试题目"""
+    """
+    题目模型类，表示一个考试题目
 
-    def __init__(self, text="", options=None, answer="", explanation=""):
+    使用 __slots__ 而不是实例字典，选项保存为元组，大题库中每道题的对象开销更小。
+    """
+
+    __slots__ = ('text', 'options', 'answer', 'explanation', 'source_file')
+
+    def __init__(self, text="", options=None, answer="", explanation="", source_file=""):
         """
         初始化题目对象
 
         Args:
             text (str): 题目文本
-            options (list): 选项列表
+            options (iterable): 选项，保存为元组
             answer (str): 正确答案（A、B、C、D）
             explanation (str): 题目解析
+            source_file (str): 题目来源文件路径
         """
         self.text = text
-        self.options = options or []
+        self.options = tuple(options) if options else ()
         self.answer = answer
         self.explanation = explanation
+        self.source_file = source_file
+
+    def add_option(self, option):
+        """
+        追加一个选项
+
+        Args:
+            option (str): 选项文本
+        """
+        self.options += (option,)
 
     def is_complete(self):
         """
@@ -1,20 +1,40 @@
-import random
+from models.question_store import QuestionStore
+from models.answer_stats import AnswerStats
+from models.shuffle_order import ShuffleOrder
+from models.review_scheduler import ReviewScheduler
+from models.mistake_book import MistakeBook
 
 class QuestionBank:
-    """题库模型类，管理题目集合"""
+    """
+    题库模型类，管理题目集合
 
-    def __init__(self, questions=None, file_path=None):
+    题目保存在列式的 QuestionStore 中，读取时得到只读的题目视图。
+    """
+
+    def __init__(self, questions=None, file_path=None, store=None, search_index=None):
         """
         初始化题库对象
 
         Args:
-            questions (list): 题目列表
+            questions (iterable): 题目列表
             file_path (str): 题库文件路径
+            store: 已有的只读题目存储（如编译题库），提供时直接使用，忽略 questions
+            search_index (SearchIndex): 与题目对应的检索索引
         """
-        self.questions = questions or []
+        self.questions = store if store is not None else QuestionStore(questions)
         self.file_path = file_path
+        self.search_index = search_index  # 覆盖全部题目时用于关键词检索
         self.current_index = 0
-        self.user_answers = {}  # 存储用户答案
+        self.user_answers = {}  # 存储用户答案，只通过 save_user_answer 等方法修改，以便同步更新统计
+        # user_answers 的累计统计，按来源文件分组；题目存储能直接读取来源时不必构造题目视图
+        self.answer_stats = AnswerStats(getattr(self.questions, 'source_file', None) or self._source_of)
+        self.journal = None  # 答案日志（AnswerJournal），设置后答案的变化随时写入日志
+        self.loading = False  # 题目是否仍在后台加载中，加载期间题目列表只增不减
+        self.shuffle_order = None  # 随机模式的做题顺序，第一次随机切题时生成
+        self.review_scheduler = None  # 间隔复习模式的调度，第一次进入复习模式时生成
+        self.review_history = []  # 间隔复习模式已显示过的题目，用于退回上一题
+        self.mistakes = MistakeBook()  # 最近一次答错的题目（错题本），作答时增量更新
+        self.right_indexes = set()  # 最近一次答对的题目
 
     def add_question(self, question):
         """
@@ -25,6 +45,15 @@ class QuestionBank:
         """
         self.questions.append(question)
 
+    def extend_questions(self, questions):
+        """
+        追加一批题目（增量加载时使用）
+
+        Args:
+            questions (list): 题目对象列表
+        """
+        self.questions.extend(questions)
+
     def get_question(self, index):
         """
         获取指定索引的题目
@@ -33,7 +62,7 @@ class QuestionBank:
             index (int): 题目索引
 
         Returns:
-            Question: 题目对象，如果索引无效则返回None
+            QuestionView: 题目视图，如果索引无效则返回None
         """
         if 0 <= index < len(self.questions):
             return self.questions[index]
@@ -53,13 +82,19 @@ class QuestionBank:
         移动到下一题
 
         Args:
-            random_mode (bool): 是否随机模式
+            random_mode (bool): 是否随机模式，随机模式按打乱的做题顺序前进，一轮内不重复
 
         Returns:
             Question: 下一题目对象
         """
         if random_mode:
-            self.current_index = random.randint(0, len(self.questions) - 1)
+            if self.shuffle_order is None:
+                self.shuffle_order = ShuffleOrder(len(self.questions))
+                index = self.shuffle_order.current()
+            else:
+                index = self.shuffle_order.next(len(self.questions))
+            if index is not None:
+                self.current_index = index
         elif self.current_index < len(self.questions) - 1:
             self.current_index += 1
         return self.get_current_question()
@@ -69,17 +104,137 @@ class QuestionBank:
         移动到上一题
 
         Args:
-            random_mode (bool): 是否随机模式
+            random_mode (bool): 是否随机模式，随机模式按做题顺序后退
 
         Returns:
             Question: 上一题目对象
         """
         if random_mode:
-            self.current_index = random.randint(0, len(self.questions) - 1)
+            # 随机模式按做题顺序退回本轮的上一题
+            if self.shuffle_order is not None:
+                self.current_index = self.shuffle_order.prev()
         elif self.current_index > 0:
             self.current_index -= 1
         return self.get_current_question()
 
+    def next_review_question(self):
+        """
+        间隔复习模式：移动到最早到期的题目，没有到期的题目时做新题
+
+        Returns:
+            Question: 下一题目对象
+        """
+        if self.review_scheduler is None:
+            self.review_scheduler = ReviewScheduler()
+        index = self.review_scheduler.next(len(self.questions))
+        if index is not None:
+            self.review_history.append(self.current_index)
+            self.current_index = index
+        return self.get_current_question()
+
+    def prev_review_question(self):
+        """
+        间隔复习模式：退回上一道显示过的题目
+
+        Returns:
+            Question: 上一题目对象
+        """
+        if self.review_history:
+            self.current_index = self.review_history.pop()
+        return self.get_current_question()
+
+    def record_review(self, index, is_correct):
+        """
+        记录间隔复习模式下的作答结果，更新该题的复习间隔
+
+        Args:
+            index (int): 题目索引
+            is_correct (bool): 是否答对
+
+        Returns:
+            bool: 是否记录（只记录调度取出的题目的第一次作答）
+        """
+        if self.review_scheduler is None:
+            return False
+        return self.review_scheduler.answer(index, is_correct)
+
+    def next_mistake_question(self):
+        """
+        错题练习模式：移动到错题本中的下一道题
+
+        Returns:
+            Question: 下一题目对象，错题本为空时返回None
+        """
+        index = self.mistakes.next()
+        if index is None:
+            return None
+        self.current_index = index
+        return self.get_current_question()
+
+    def prev_mistake_question(self):
+        """
+        错题练习模式：移动到错题本中的上一道题
+
+        Returns:
+            Question: 上一题目对象，错题本为空时返回None
+        """
+        index = self.mistakes.prev()
+        if index is None:
+            return None
+        self.current_index = index
+        return self.get_current_question()
+
+    def restore_mistakes(self, indexes):
+        """
+        恢复保存的错题本，合并到本次已记录的错题之后
+
+        本次已经答对或超出题目范围的题目不恢复。
+
+        Args:
+            indexes (list): MistakeBook.to_state 导出的错题索引
+
+        Returns:
+            int: 恢复的错题数量
+        """
+        count = len(self.questions)
+        before = len(self.mistakes)
+        for index in indexes:
+            if isinstance(index, int) and 0 <= index < count and index not in self.right_indexes:
+                self.mistakes.add(index)
+        return len(self.mistakes) - before
+
+    def restore_review_scheduler(self, state):
+        """
+        恢复保存的间隔复习记录
+
+        Args:
+            state (dict): ReviewScheduler.to_state 导出的复习记录
+
+        Returns:
+            bool: 是否恢复成功
+        """
+        scheduler = ReviewScheduler.from_state(state, len(self.questions))
+        if scheduler is None:
+            return False
+        self.review_scheduler = scheduler
+        return True
+
+    def restore_shuffle_order(self, state):
+        """
+        恢复保存的随机模式做题顺序
+
+        Args:
+            state (dict): ShuffleOrder.to_state 导出的进度
+
+        Returns:
+            bool: 是否恢复成功（题目数量已变化时不恢复）
+        """
+        order = ShuffleOrder.from_state(state, len(self.questions))
+        if order is None:
+            return False
+        self.shuffle_order = order
+        return True
+
     def jump_to_question(self, index):
         """
         跳转到指定题目
@@ -95,6 +250,40 @@ class QuestionBank:
             return self.get_current_question()
         return None
 
+    def search(self, keyword, limit):
+        """
+        按关键词查找题目（题目文本、选项和解析），关键词以空白分隔时要求同时包含全部词
+
+        Args:
+            keyword (str): 关键词
+            limit (int): 最多返回的结果数
+
+        Returns:
+            list: 匹配题目的索引
+        """
+        index = self.search_index
+        if index is not None and index.count == len(self.questions):
+            results = index.search(keyword, limit, self.questions.__getitem__)
+            if results is not None:
+                return results
+
+        search = getattr(self.questions, 'search', None)
+        if search is not None:
+            return search(keyword, limit)
+
+        # 题目存储不支持检索时逐题匹配
+        terms = keyword.split()
+        results = []
+        if not terms:
+            return results
+        for index, question in enumerate(self.questions):
+            fields = (question.text, question.explanation) + tuple(question.options)
+            if all(any(term in field for field in fields) for term in terms):
+                results.append(index)
+                if len(results) >= limit:
+                    break
+        return results
+
     def get_question_count(self):
         """
         获取题目总数
@@ -104,15 +293,89 @@ class QuestionBank:
         """
         return len(self.questions)
 
+    def _source_of(self, index):
+        """
+        题目的来源文件路径，用于分组统计
+
+        Args:
+            index (int): 题目索引
+
+        Returns:
+            str: 来源文件路径，没有记录来源时为空字符串
+        """
+        return self.questions[index].source_file
+
+    def _is_correct(self, index, answer):
+        """答案是否正确（不区分大小写，与 Question.check_answer 一致）"""
+        return answer.upper() == self.questions.answer(index).upper()
+
     def save_user_answer(self, index, answer):
         """
-        保存用户答案
+        保存用户答案，同时按对错更新错题本和做题统计（改答时按差值调整）
 
         Args:
             index (int): 题目索引
             answer (str): 用户答案
         """
+        previous = self.user_answers.get(index)
         self.user_answers[index] = answer
+        is_correct = self._is_correct(index, answer)
+        if previous != answer:
+            was_correct = None if previous is None else self._is_correct(index, previous)
+            self.answer_stats.update(index, was_correct, is_correct)
+            if self.journal is not None:
+                self.journal.record(index, answer)
+        if is_correct:
+            self.right_indexes.add(index)
+            self.mistakes.discard(index)
+        else:
+            self.mistakes.add(index)
+            self.right_indexes.discard(index)
+
+    def clear_user_answers(self):
+        """清空全部用户答案和做题统计，错题本不变"""
+        self.user_answers = {}
+        self.answer_stats.reset()
+        if self.journal is not None:
+            self.journal.clear()
+
+    def attach_journal(self, journal):
+        """
+        使用答案日志：恢复日志中记录的答案，之后答案的变化写入日志
+
+        本次已作答的题目保留本次的答案，并补记到日志中；超出题目范围的记录被忽略。
+
+        Args:
+            journal (AnswerJournal): 答案日志
+
+        Returns:
+            int: 从日志恢复的答案数量
+        """
+        count = len(self.questions)
+        user_answers = self.user_answers
+        restored = {index: answer for index, answer in journal.answers.items()
+                    if index not in user_answers and 0 <= index < count}
+        for index, answer in user_answers.items():
+            if journal.answers.get(index) != answer:
+                journal.record(index, answer)
+        user_answers.update(restored)
+
+        indexes = list(restored)
+        self.answer_stats.add_many(indexes, list(map(self._is_correct, indexes, restored.values())))
+        self.journal = journal
+        return len(restored)
+
+    def detach_journal(self):
+        """写入未写盘的答案并停止使用答案日志"""
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+    def close(self):
+        """关闭直接打开的题目存储（如编译题库的内存映射、SQLite 题库的连接），题库不再使用时调用"""
+        close = getattr(self.questions, 'close', None)
+        if close is not None:
+            close()
 
     def get_user_answer(self, index):
         """
@@ -133,8 +396,4 @@ class QuestionBank:
         Returns:
             int: 正确答案数量
         """
-        correct_count = 0
-        for index, answer in self.user_answers.items():
-            if index < len(self.questions) and answer == self.questions[index].answer:
-                correct_count += 1
-        return correct_count
\ No newline at end of file
+        return self.answer_stats.correct
\ No newline at end of file
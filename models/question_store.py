@@ -0,0 +1,336 @@
+from array import array
+from bisect import bisect_right
+from models.question import Question
+
+# 同一道题的多个选项在选项列中以单元分隔符连接
+_OPTION_SEPARATOR = '\x1f'
+
+# 答案列用一个字节的位图表示由不重复、按顺序排列的 A~G 组成的答案（空答案为0），
+# 其他答案放入溢出表，字节值记为 _ANSWER_OVERFLOW
+_ANSWER_LETTERS = 'ABCDEFG'
+_ANSWER_OVERFLOW = 0x80
+
+
+class _StringColumn:
+    """
+    紧凑的字符串列
+
+    全部字符串以 UTF-8 编码依次存放在同一个 bytearray 中，另用一个数组记录每个字符串的结束位置，
+    每个字符串只额外占用8个字节，没有独立的 str 对象开销。
+    """
+
+    __slots__ = ('_blob', '_ends')
+
+    def __init__(self):
+        """初始化空列"""
+        self._blob = bytearray()
+        self._ends = array('Q')
+
+    def append(self, value):
+        """
+        追加一个字符串
+
+        Args:
+            value (str): 字符串
+        """
+        self._blob += value.encode('utf-8')
+        self._ends.append(len(self._blob))
+
+    def get(self, index):
+        """
+        读取指定位置的字符串
+
+        Args:
+            index (int): 位置
+
+        Returns:
+            str: 字符串
+        """
+        start = self._ends[index - 1] if index else 0
+        return self._blob[start:self._ends[index]].decode('utf-8')
+
+    def find(self, value):
+        """
+        查找包含指定子串的全部字符串
+
+        直接在 UTF-8 数据中查找字节串：UTF-8 编码保证字节串匹配即字符匹配，
+        只需排除跨越两个字符串边界的匹配。
+
+        Args:
+            value (str): 子串
+
+        Returns:
+            set: 包含该子串的字符串位置
+        """
+        pattern = value.encode('utf-8')
+        blob = self._blob
+        ends = self._ends
+        found = set()
+        position = blob.find(pattern)
+        while position >= 0:
+            index = bisect_right(ends, position)
+            if position + len(pattern) <= ends[index]:
+                found.add(index)
+                # 同一个字符串只记录一次，从下一个字符串开始继续查找
+                position = blob.find(pattern, ends[index])
+            else:
+                position = blob.find(pattern, position + 1)
+        return found
+
+    def nbytes(self):
+        """
+        估算占用的内存
+
+        Returns:
+            int: 字节数
+        """
+        return len(self._blob) + self._ends.itemsize * len(self._ends)
+
+
+def _encode_answer(answer):
+    """
+    把答案编码为一个字节的位图
+
+    Args:
+        answer (str): 答案
+
+    Returns:
+        int: 位图，无法用位图表示时返回None
+    """
+    code = 0
+    previous = -1
+    for letter in answer:
+        position = _ANSWER_LETTERS.find(letter)
+        if position <= previous:
+            return None
+        code |= 1 << position
+        previous = position
+    return code
+
+
+def _decode_answer(code):
+    """把位图还原为答案"""
+    return ''.join(letter for i, letter in enumerate(_ANSWER_LETTERS) if code >> i & 1)
+
+
+# 全部位图对应的答案，解码时直接查表
+_ANSWERS = tuple(_decode_answer(code) for code in range(_ANSWER_OVERFLOW))
+
+
+class QuestionStore:
+    """
+    列式题目存储
+
+    题目文本、选项、解析分别存入紧凑的字符串列，答案存为每题一个字节的位图，
+    来源文件按连续区段记录。一百万道题时比逐题保存 Question 对象节省大部分内存。
+
+    按索引读取时返回轻量的 QuestionView，只在访问字段时才解码对应的字符串。
+    存储只支持追加，已存入的题目不可修改。
+    """
+
+    def __init__(self, questions=None):
+        """
+        初始化题目存储
+
+        Args:
+            questions (iterable): 初始题目
+        """
+        self._text = _StringColumn()
+        self._options = _StringColumn()
+        self._explanation = _StringColumn()
+        self._answers = bytearray()
+        self._overflow = {}  # 题目索引 -> 无法紧凑保存的 (选项, 答案)
+        self._source_starts = array('Q')  # 每个来源区段的起始题目索引
+        self._source_names = []
+        if questions:
+            self.extend(questions)
+
+    def append(self, question):
+        """
+        追加一道题目
+
+        Args:
+            question (Question): 题目对象（或具有相同字段的视图）
+        """
+        index = len(self._answers)
+        options = question.options
+        answer = question.answer
+        code = _encode_answer(answer)
+
+        joined = _OPTION_SEPARATOR.join(options)
+        # 含分隔符或空字符串的选项无法从连接后的文本中准确还原
+        exact = not options or (joined.count(_OPTION_SEPARATOR) == len(options) - 1
+                                and '' not in options)
+        if code is None or not exact:
+            self._overflow[index] = (tuple(options), answer)
+            joined = ''
+            code = _ANSWER_OVERFLOW
+
+        self._text.append(question.text)
+        self._options.append(joined)
+        self._explanation.append(question.explanation)
+        self._answers.append(code)
+
+        source_file = question.source_file
+        if not self._source_names or self._source_names[-1] != source_file:
+            self._source_starts.append(index)
+            self._source_names.append(source_file)
+
+    def extend(self, questions):
+        """
+        追加多道题目
+
+        Args:
+            questions (iterable): 题目对象
+        """
+        append = self.append
+        for question in questions:
+            append(question)
+
+    def __len__(self):
+        """题目数量"""
+        return len(self._answers)
+
+    def __getitem__(self, index):
+        """
+        按索引读取题目
+
+        Args:
+            index (int): 题目索引，支持负数
+
+        Returns:
+            QuestionView: 题目视图
+
+        Raises:
+            IndexError: 索引越界
+        """
+        count = len(self._answers)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("题目索引越界")
+        return QuestionView(self, index)
+
+    def __iter__(self):
+        """依次产出全部题目视图"""
+        for index in range(len(self._answers)):
+            yield QuestionView(self, index)
+
+    def text(self, index):
+        """题目文本"""
+        return self._text.get(index)
+
+    def options(self, index):
+        """选项元组"""
+        if self._answers[index] == _ANSWER_OVERFLOW:
+            return self._overflow[index][0]
+        joined = self._options.get(index)
+        return tuple(joined.split(_OPTION_SEPARATOR)) if joined else ()
+
+    def answer(self, index):
+        """正确答案"""
+        code = self._answers[index]
+        if code == _ANSWER_OVERFLOW:
+            return self._overflow[index][1]
+        return _ANSWERS[code]
+
+    def explanation(self, index):
+        """题目解析"""
+        return self._explanation.get(index)
+
+    def source_file(self, index):
+        """来源文件路径"""
+        return self._source_names[bisect_right(self._source_starts, index) - 1]
+
+    def search(self, keyword, limit):
+        """
+        按关键词查找题目文本、选项和解析
+
+        关键词以空白分隔时要求同时包含全部词，区分大小写。
+
+        Args:
+            keyword (str): 关键词
+            limit (int): 最多返回的结果数
+
+        Returns:
+            list: 按题号排序的匹配题目索引
+        """
+        matches = None
+        for term in keyword.split():
+            found = self._text.find(term) | self._options.find(term) | self._explanation.find(term)
+            for index, (options, _) in self._overflow.items():
+                if any(term in option for option in options):
+                    found.add(index)
+            matches = found if matches is None else matches & found
+            if not matches:
+                return []
+        return sorted(matches)[:limit] if matches else []
+
+    def nbytes(self):
+        """
+        估算各列占用的内存（不含溢出表）
+
+        Returns:
+            int: 字节数
+        """
+        return (self._text.nbytes() + self._options.nbytes() + self._explanation.nbytes()
+                + len(self._answers) + self._source_starts.itemsize * len(self._source_starts))
+
+
+class QuestionView:
+    """
+    题目存储中一道题的只读视图
+
+    与 Question 提供相同的字段和方法，字段在访问时才从存储中解码。
+    """
+
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store, index):
+        """
+        初始化题目视图
+
+        Args:
+            store (QuestionStore): 题目存储
+            index (int): 题目索引
+        """
+        self._store = store
+        self._index = index
+
+    @property
+    def text(self):
+        """题目文本"""
+        return self._store.text(self._index)
+
+    @property
+    def options(self):
+        """选项元组"""
+        return self._store.options(self._index)
+
+    @property
+    def answer(self):
+        """正确答案"""
+        return self._store.answer(self._index)
+
+    @property
+    def explanation(self):
+        """题目解析"""
+        return self._store.explanation(self._index)
+
+    @property
+    def source_file(self):
+        """来源文件路径"""
+        return self._store.source_file(self._index)
+
+    def to_question(self):
+        """
+        复制为独立的题目对象
+
+        Returns:
+            Question: 题目对象
+        """
+        return Question(self.text, self.options, self.answer, self.explanation, self.source_file)
+
+    is_complete = Question.is_complete
+    check_answer = Question.check_answer
+    __str__ = Question.__str__
@@ -0,0 +1,183 @@
+import time
+import heapq
+
+# SM-2 参数：初始难度系数、最小难度系数、答对后的前两次间隔（天）
+_INITIAL_EASE = 2.5
+_MIN_EASE = 1.3
+_FIRST_INTERVAL = 1.0
+_SECOND_INTERVAL = 6.0
+
+# 判断题只有对错，答对记为4分，答错记为1分（SM-2 的0~5分制）
+_QUALITY_CORRECT = 4
+_QUALITY_INCORRECT = 1
+
+# 答错的题目在同一次练习中再出现的间隔，以及没作答就跳过的题目推迟的时间（秒）
+_RELEARN_DELAY = 10 * 60
+_SKIP_DELAY = 10 * 60
+
+_DAY = 24 * 60 * 60
+
+# 复习记录中每道题的字段位置：难度系数、间隔（天）、连续答对次数、到期时间、版本号
+_EASE, _INTERVAL, _REPETITIONS, _DUE, _VERSION = range(5)
+
+
+class ReviewScheduler:
+    """
+    间隔重复（SM-2）复习调度
+
+    每道做过的题目记录难度系数、复习间隔和到期时间，答对后间隔按难度系数增长，答错后从头开始。
+    到期时间保存在最小堆中，取下一题时弹出最早到期的题目，不需要扫描整个题库（O(log n)）。
+    题目重新安排时直接压入新的堆项，旧的堆项按版本号判断已失效，弹出时丢弃（延迟删除）。
+
+    取题顺序：已到期的复习题，其次按题号顺序的新题，新题做完后提前复习最早到期的题目。
+    """
+
+    def __init__(self):
+        """初始化空的复习记录"""
+        self._cards = {}  # 题目索引 -> [难度系数, 间隔, 连续答对次数, 到期时间, 版本号]
+        self._heap = []  # (到期时间, 题目索引, 版本号)
+        self._next_new = 0  # 下一道新题的最小可能索引
+        self.current = None  # 已取出、尚未作答的题目索引
+
+    def __len__(self):
+        """做过的题目数量"""
+        return len(self._cards)
+
+    @staticmethod
+    def _new_card(now):
+        """新题目的复习记录"""
+        return [_INITIAL_EASE, 0.0, 0, now, 0]
+
+    def _schedule(self, index, card, due):
+        """设置题目的到期时间并压入堆"""
+        card[_DUE] = due
+        card[_VERSION] += 1
+        heapq.heappush(self._heap, (due, index, card[_VERSION]))
+
+    def _pop_valid(self):
+        """弹出堆顶之前的失效项，返回最早到期的有效堆项（不弹出），堆为空时返回None"""
+        heap = self._heap
+        cards = self._cards
+        while heap:
+            due, index, version = heap[0]
+            if cards[index][_VERSION] == version:
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def next(self, count, now=None):
+        """
+        取下一道要做的题目
+
+        上一道取出的题目没有作答时推迟一段时间（新题按到期处理），避免反复取到同一道题。
+
+        Args:
+            count (int): 题库当前的题目数量
+            now (float): 当前时间戳，默认为 time.time()
+
+        Returns:
+            int: 题目索引，题库为空时返回None
+        """
+        now = time.time() if now is None else now
+        if self.current is not None:
+            card = self._cards.get(self.current)
+            if card is None:
+                card = self._cards[self.current] = self._new_card(now)
+            self._schedule(self.current, card, max(card[_DUE], now) + _SKIP_DELAY)
+            self.current = None
+
+        top = self._pop_valid()
+        if top is not None and top[0] <= now:
+            heapq.heappop(self._heap)
+            self.current = top[1]
+            return self.current
+
+        # 没有到期的题目时做新题；新题指针只增不减，跳过已经做过的题目
+        while self._next_new < count and self._next_new in self._cards:
+            self._next_new += 1
+        if self._next_new < count:
+            self.current = self._next_new
+            return self.current
+
+        # 全部题目都做过且都未到期：提前复习最早到期的题目
+        if top is not None:
+            heapq.heappop(self._heap)
+            self.current = top[1]
+        return self.current
+
+    def answer(self, index, correct, now=None):
+        """
+        记录作答结果，按 SM-2 更新难度系数和复习间隔
+
+        同一次取出的题目只记录第一次作答，重复提交或非本次取出的题目不改变安排。
+
+        Args:
+            index (int): 题目索引
+            correct (bool): 是否答对
+            now (float): 当前时间戳，默认为 time.time()
+
+        Returns:
+            bool: 是否记录了本次作答
+        """
+        if index != self.current:
+            return False
+        self.current = None
+        now = time.time() if now is None else now
+
+        card = self._cards.get(index)
+        if card is None:
+            card = self._cards[index] = self._new_card(now)
+
+        quality = _QUALITY_CORRECT if correct else _QUALITY_INCORRECT
+        card[_EASE] = max(_MIN_EASE, card[_EASE] + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        if correct:
+            repetitions = card[_REPETITIONS]
+            if repetitions == 0:
+                card[_INTERVAL] = _FIRST_INTERVAL
+            elif repetitions == 1:
+                card[_INTERVAL] = _SECOND_INTERVAL
+            else:
+                card[_INTERVAL] = card[_INTERVAL] * card[_EASE]
+            card[_REPETITIONS] = repetitions + 1
+            self._schedule(index, card, now + card[_INTERVAL] * _DAY)
+        else:
+            card[_REPETITIONS] = 0
+            card[_INTERVAL] = 0.0
+            self._schedule(index, card, now + _RELEARN_DELAY)
+        return True
+
+    def to_state(self):
+        """
+        导出可以保存为 JSON 的复习记录
+
+        Returns:
+            dict: 复习记录
+        """
+        return {
+            'cards': [[index, card[_EASE], card[_INTERVAL], card[_REPETITIONS], card[_DUE]]
+                      for index, card in self._cards.items()],
+        }
+
+    @classmethod
+    def from_state(cls, state, count):
+        """
+        从保存的复习记录恢复调度
+
+        Args:
+            state (dict): to_state 导出的复习记录
+            count (int): 题库当前的题目数量，超出范围的记录被丢弃
+
+        Returns:
+            ReviewScheduler: 复习调度，记录无效时返回None
+        """
+        scheduler = cls()
+        try:
+            for index, ease, interval, repetitions, due in state['cards']:
+                if 0 <= index < count:
+                    scheduler._cards[int(index)] = [float(ease), float(interval), int(repetitions),
+                                                    float(due), 0]
+        except (KeyError, TypeError, ValueError):
+            return None
+        scheduler._heap = [(card[_DUE], index, 0) for index, card in scheduler._cards.items()]
+        heapq.heapify(scheduler._heap)
+        return scheduler
@@ -0,0 +1,122 @@
+import random
+from array import array
+
+
+class ShuffleOrder:
+    """
+    随机模式的做题顺序
+
+    每一轮是题目索引的一个随机排列，游标指向当前题目，上一题、下一题只移动游标（O(1)），
+    一轮之内每道题恰好出现一次，做完一轮后重新打乱开始下一轮。
+
+    排列只由种子、轮次和本轮的题目数量决定，保存这几个数和游标即可恢复进度。
+    题库在加载过程中增加的题目从下一轮开始加入。
+    """
+
+    def __init__(self, count, seed=None, round_number=0, cursor=0):
+        """
+        初始化做题顺序
+
+        Args:
+            count (int): 本轮的题目数量
+            seed (int): 随机种子，默认随机生成
+            round_number (int): 轮次，从0开始
+            cursor (int): 当前题目在本轮排列中的位置
+        """
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self.round_number = round_number
+        self.count = count
+        self._order = self._permutation(count)
+        self.cursor = min(max(cursor, 0), max(count - 1, 0))
+
+    def _permutation(self, count):
+        """
+        生成本轮的排列
+
+        Args:
+            count (int): 题目数量
+
+        Returns:
+            array: 题目索引的排列
+        """
+        order = list(range(count))
+        random.Random(self.seed * 1000003 + self.round_number).shuffle(order)
+        return array('I', order)
+
+    def current(self):
+        """
+        当前题目
+
+        Returns:
+            int: 题目索引，题库为空时返回None
+        """
+        return self._order[self.cursor] if self.count else None
+
+    def next(self, count=None):
+        """
+        移动到下一题，本轮做完时开始新的一轮
+
+        Args:
+            count (int): 题库当前的题目数量，开始新的一轮时使用；默认沿用本轮的数量
+
+        Returns:
+            int: 题目索引，题库为空时返回None
+        """
+        if self.cursor + 1 < self.count:
+            self.cursor += 1
+        else:
+            self.round_number += 1
+            if count is not None:
+                self.count = count
+            self._order = self._permutation(self.count)
+            self.cursor = 0
+        return self.current()
+
+    def prev(self):
+        """
+        回到本轮的上一题，已在本轮第一题时不动
+
+        Returns:
+            int: 题目索引，题库为空时返回None
+        """
+        if self.cursor > 0:
+            self.cursor -= 1
+        return self.current()
+
+    @property
+    def remaining(self):
+        """本轮还没有做到的题目数量"""
+        return max(self.count - self.cursor - 1, 0)
+
+    def to_state(self):
+        """
+        导出可以保存为 JSON 的进度
+
+        Returns:
+            dict: 进度
+        """
+        return {
+            'seed': self.seed,
+            'round': self.round_number,
+            'count': self.count,
+            'cursor': self.cursor,
+        }
+
+    @classmethod
+    def from_state(cls, state, count):
+        """
+        从保存的进度恢复做题顺序
+
+        Args:
+            state (dict): to_state 导出的进度
+            count (int): 题库当前的题目数量
+
+        Returns:
+            ShuffleOrder: 做题顺序；进度无效或题目数量已变化（题库被修改）时返回None
+        """
+        try:
+            if state['count'] != count:
+                return None
+            return cls(count, int(state['seed']), int(state['round']), int(state['cursor']))
+        except (KeyError, TypeError, ValueError):
+            return None
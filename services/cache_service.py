@@ -0,0 +1,298 @@
+import os
+import sys
+import zlib
+import struct
+import marshal
+import hashlib
+from models.question import Question
+from services.parser_service import PARSER_VERSION
+from services.search_index import SearchIndex
+from utils.logger import get_logger
+from config.settings import CACHE_DIR, CACHE_MAX_SIZE_MB
+
+# 缓存文件头：魔数 + 解析器版本 + 题库文件内容哈希
+_MAGIC = b'QBCACHE2'
+_HEADER = struct.Struct('<8sI16s')
+_ENTRY_SUFFIX = '.bin'
+_INDEX_SUFFIX = '.idx'
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class BankCache:
+    """
+    已解析题库的磁盘缓存，以文件指纹为键，按总大小做LRU淘汰
+
+    查找只用路径、大小和修改时间，不读取文件内容；命中时再核对条目中保存的内容哈希，
+    未命中时解析完成后才计算哈希写入缓存，不推迟显示第一题。
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        """
+        初始化题库缓存
+
+        Args:
+            cache_dir (str): 缓存目录，默认为程序目录下的 CACHE_DIR
+            max_bytes (int): 缓存总大小上限（字节）
+        """
+        self.logger = get_logger()
+        self.cache_dir = cache_dir or os.path.join(self._get_app_directory(), CACHE_DIR)
+        self.max_bytes = max_bytes if max_bytes is not None else CACHE_MAX_SIZE_MB * 1024 * 1024
+
+    def _get_app_directory(self):
+        """
+        获取程序所在目录
+
+        Returns:
+            str: 目录路径
+        """
+        if getattr(sys, 'frozen', False):
+            # 运行于 exe 模式
+            return os.path.dirname(sys.executable)
+        # 运行于脚本模式
+        return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def fingerprint(self, file_path):
+        """
+        计算文件指纹：路径、大小、修改时间和解析器版本（只读取文件状态，不读取内容）
+
+        Args:
+            file_path (str): 题库文件路径
+
+        Returns:
+            str: 指纹字符串
+
+        Raises:
+            OSError: 无法读取文件状态
+        """
+        stat = os.stat(file_path)
+        key = hashlib.blake2b(digest_size=16)
+        key.update(os.path.normcase(os.path.abspath(file_path)).encode('utf-8'))
+        key.update(f"|{stat.st_size}|{stat.st_mtime_ns}|{PARSER_VERSION}|".encode('ascii'))
+        return key.hexdigest()
+
+    @staticmethod
+    def content_hash(file_path):
+        """
+        计算文件内容的哈希
+
+        Args:
+            file_path (str): 题库文件路径
+
+        Returns:
+            bytes: 16字节的哈希值
+
+        Raises:
+            OSError: 无法读取文件
+        """
+        content_hash = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            while True:
+                chunk = f.read(_HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                content_hash.update(chunk)
+        return content_hash.digest()
+
+    def get(self, key, file_path):
+        """
+        读取缓存的题目列表，命中时核对题库文件的内容哈希
+
+        Args:
+            key (str): 文件指纹
+            file_path (str): 题库文件路径
+
+        Returns:
+            list: 题目对象列表，未命中、缓存失效或文件内容已变化时返回None
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.warning(f"读取题库缓存失败: {str(e)}")
+            return None
+
+        try:
+            magic, version, digest = _HEADER.unpack_from(data)
+            if magic != _MAGIC or version != PARSER_VERSION:
+                raise ValueError("缓存格式或解析器版本不匹配")
+            if digest != self.content_hash(file_path):
+                # 文件内容变化但大小和修改时间没变（如被保留时间戳的工具改写）
+                self._remove(self._entry_path(key, _INDEX_SUFFIX))
+                raise ValueError("题库文件内容已变化")
+            questions = self._load_records(data[_HEADER.size:])
+        except Exception as e:
+            self.logger.warning(f"题库缓存已失效，将重新解析: {str(e)}")
+            self._remove(entry_path)
+            return None
+
+        # 更新访问时间，作为LRU依据
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        self.logger.info(f"命中题库缓存，共 {len(questions)} 道题目")
+        return questions
+
+    def put(self, key, questions, file_path):
+        """
+        写入题目列表到缓存，并淘汰最久未使用的条目
+
+        解析完成后才计算文件内容的哈希；文件在解析期间被修改（指纹已变化）时不写入。
+
+        Args:
+            key (str): 解析前计算的文件指纹
+            questions (list): 题目对象列表
+            file_path (str): 题库文件路径
+        """
+        try:
+            digest = self.content_hash(file_path)
+            if self.fingerprint(file_path) != key:
+                self.logger.info("题库文件在解析期间被修改，跳过缓存")
+                return
+        except OSError as e:
+            self.logger.warning(f"计算题库内容哈希失败: {str(e)}")
+            return
+
+        records = [self._question_to_record(q) for q in questions]
+        payload = _HEADER.pack(_MAGIC, PARSER_VERSION, digest) + zlib.compress(marshal.dumps(records), 1)
+        if len(payload) > self.max_bytes:
+            self.logger.info("题库过大，跳过缓存")
+            return
+
+        entry_path = self._entry_path(key)
+        tmp_path = entry_path + '.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            self.logger.warning(f"写入题库缓存失败: {str(e)}")
+            self._remove(tmp_path)
+            return
+
+        self._evict()
+
+    def get_index(self, key):
+        """
+        读取与缓存题目一起保存的检索索引
+
+        Args:
+            key (str): 文件指纹
+
+        Returns:
+            SearchIndex: 检索索引，未命中或数据失效时返回None
+        """
+        index_path = self._entry_path(key, _INDEX_SUFFIX)
+        try:
+            with open(index_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.warning(f"读取检索索引缓存失败: {str(e)}")
+            return None
+
+        try:
+            index = SearchIndex.from_bytes(data)
+        except Exception as e:
+            self.logger.warning(f"检索索引缓存已失效，将重新构建: {str(e)}")
+            self._remove(index_path)
+            return None
+
+        try:
+            os.utime(index_path)
+        except OSError:
+            pass
+        return index
+
+    def put_index(self, key, index):
+        """
+        写入检索索引到缓存，并淘汰最久未使用的条目
+
+        Args:
+            key (str): 文件指纹
+            index (SearchIndex): 检索索引
+        """
+        payload = index.to_bytes()
+        if len(payload) > self.max_bytes:
+            self.logger.info("检索索引过大，跳过缓存")
+            return
+
+        index_path = self._entry_path(key, _INDEX_SUFFIX)
+        tmp_path = index_path + '.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            self.logger.warning(f"写入检索索引缓存失败: {str(e)}")
+            self._remove(tmp_path)
+            return
+
+        self._evict()
+
+    def _evict(self):
+        """按访问时间淘汰缓存条目，直到总大小不超过上限"""
+        try:
+            entries = []
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith((_ENTRY_SUFFIX, _INDEX_SUFFIX)):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError as e:
+            self.logger.warning(f"扫描题库缓存失败: {str(e)}")
+            return
+
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            self.logger.debug(f"淘汰题库缓存: {path}")
+
+    def _entry_path(self, key, suffix=_ENTRY_SUFFIX):
+        """返回缓存条目的文件路径"""
+        return os.path.join(self.cache_dir, key + suffix)
+
+    def _remove(self, path):
+        """删除文件，忽略错误"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _load_records(self, payload):
+        """
+        反序列化缓存内容为题目列表
+
+        在后台加载线程中运行，不能暂停垃圾回收（gc.disable 对整个进程生效，界面线程也会受影响）。
+
+        Args:
+            payload (bytes): 压缩后的序列化数据
+
+        Returns:
+            list: 题目对象列表
+        """
+        records = marshal.loads(zlib.decompress(payload))
+        return [self._record_to_question(record) for record in records]
+
+    @staticmethod
+    def _question_to_record(question):
+        """把题目对象转换为可序列化的元组"""
+        return (question.text, tuple(question.options), question.answer, question.explanation,
+                question.source_file)
+
+    @staticmethod
+    def _record_to_question(record):
+        """把缓存元组还原为题目对象"""
+        text, options, answer, explanation, source_file = record
+        return Question(text, options, answer, explanation, source_file)
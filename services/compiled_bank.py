@@ -0,0 +1,247 @@
+import os
+import sys
+import json
+import mmap
+import struct
+from array import array
+from models.question import Question
+from utils.logger import get_logger
+
+# 编译题库文件扩展名
+COMPILED_EXTENSION = '.qbc'
+
+# 文件头：魔数、格式版本、题目数、偏移表位置、来源文件表位置和长度
+_MAGIC = b'QBC\x00'
+_VERSION = 1
+_HEADER = struct.Struct('<4sIQQQQ')
+
+# 每道题的记录头：来源文件编号、选项数；随后是题目、答案、解析和各选项的 UTF-8 字节长度
+_RECORD_HEAD = struct.Struct('<IH')
+_OFFSET = struct.Struct('<Q')
+_MAX_OPTIONS = 0xFFFF
+
+
+def compile_bank(questions, output_path):
+    """
+    把题目写入编译题库文件
+
+    文件布局为：文件头 | 题目记录（UTF-8 数据区）| 偏移表 | 来源文件表（JSON）。
+    题目逐个写入，偏移表在内存中只占每题8个字节，可以直接接在流式解析之后使用。
+    先写入临时文件，完成后再替换目标文件。
+
+    Args:
+        questions (iterable): 题目对象
+        output_path (str): 输出文件路径
+
+    Returns:
+        int: 写入的题目数量
+
+    Raises:
+        ValueError: 题目的选项数超出格式限制
+    """
+    offsets = array('Q')
+    sources = {}
+    temp_path = output_path + '.tmp'
+
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(b'\0' * _HEADER.size)
+            position = _HEADER.size
+
+            for question in questions:
+                options = question.options
+                if len(options) > _MAX_OPTIONS:
+                    raise ValueError(f"选项数量超出限制: {len(options)}")
+
+                source_id = sources.setdefault(question.source_file, len(sources))
+                fields = [question.text.encode('utf-8'), question.answer.encode('utf-8'),
+                          question.explanation.encode('utf-8')]
+                fields.extend(option.encode('utf-8') for option in options)
+
+                record = b''.join((
+                    _RECORD_HEAD.pack(source_id, len(options)),
+                    struct.pack(f'<{len(fields)}I', *map(len, fields)),
+                    *fields,
+                ))
+                offsets.append(position)
+                f.write(record)
+                position += len(record)
+
+            # 偏移表固定为小端字节序
+            if sys.byteorder == 'big':
+                offsets.byteswap()
+            table_offset = position
+            offsets.tofile(f)
+            sources_offset = table_offset + len(offsets) * _OFFSET.size
+            sources_blob = json.dumps(list(sources), ensure_ascii=False).encode('utf-8')
+            f.write(sources_blob)
+
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(offsets), table_offset,
+                                 sources_offset, len(sources_blob)))
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return len(offsets)
+
+
+class CompiledBank:
+    """
+    以内存映射方式打开的编译题库
+
+    打开时只读取文件头和来源文件表，题目在按索引读取时才从映射中解码，
+    因此打开很大的题库也几乎不耗时、不占常驻内存，按索引读取为 O(1)。
+    与 QuestionStore 提供相同的读取接口，可以直接作为 QuestionBank 的题目存储。
+    """
+
+    def __init__(self, file_path):
+        """
+        打开编译题库文件
+
+        Args:
+            file_path (str): 文件路径
+
+        Raises:
+            ValueError: 文件不是有效的编译题库
+        """
+        self.logger = get_logger()
+        self.file_path = file_path
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError("不是有效的编译题库文件")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # 按题号跳转是随机访问，关闭预读以免读入大量用不到的页面
+        if hasattr(mmap, 'MADV_RANDOM'):
+            self._map.madvise(mmap.MADV_RANDOM)
+
+        try:
+            magic, version, count, table_offset, sources_offset, sources_size = \
+                _HEADER.unpack_from(self._map, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("不是有效的编译题库文件或版本不受支持")
+            if (table_offset + count * _OFFSET.size != sources_offset or
+                    sources_offset + sources_size > size):
+                raise ValueError("编译题库文件已损坏")
+            self._sources = json.loads(self._map[sources_offset:sources_offset + sources_size])
+        except Exception:
+            self._map.close()
+            raise
+
+        self._count = count
+        self._table_offset = table_offset
+        self.logger.info(f"已打开编译题库: {file_path}，共 {count} 道题目")
+
+    def close(self):
+        """关闭内存映射"""
+        self._map.close()
+
+    def __len__(self):
+        """题目数量"""
+        return self._count
+
+    def __getitem__(self, index):
+        """
+        按索引读取题目
+
+        Args:
+            index (int): 题目索引，支持负数
+
+        Returns:
+            Question: 新建的题目对象
+
+        Raises:
+            IndexError: 索引越界
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("题目索引越界")
+        return self._read(index)
+
+    def __iter__(self):
+        """依次产出全部题目"""
+        for index in range(self._count):
+            yield self._read(index)
+
+    def _locate(self, index):
+        """
+        读取一道题的记录头
+
+        Args:
+            index (int): 题目索引
+
+        Returns:
+            tuple: (来源文件编号, 各字段长度, 第一个字段的起始位置)
+        """
+        offset = _OFFSET.unpack_from(self._map, self._table_offset + index * _OFFSET.size)[0]
+        source_id, option_count = _RECORD_HEAD.unpack_from(self._map, offset)
+        offset += _RECORD_HEAD.size
+        lengths = struct.unpack_from(f'<{option_count + 3}I', self._map, offset)
+        return source_id, lengths, offset + 4 * len(lengths)
+
+    def _read(self, index):
+        """解码一道题"""
+        source_id, lengths, position = self._locate(index)
+        data = self._map
+        fields = []
+        for length in lengths:
+            fields.append(data[position:position + length].decode('utf-8'))
+            position += length
+        text, answer, explanation = fields[:3]
+        return Question(text, fields[3:], answer, explanation, self._sources[source_id])
+
+    def answer(self, index):
+        """
+        只读取一道题的正确答案
+
+        Args:
+            index (int): 题目索引
+
+        Returns:
+            str: 正确答案
+        """
+        _, lengths, position = self._locate(index)
+        position += lengths[0]
+        return self._map[position:position + lengths[1]].decode('utf-8')
+
+
+def open_compiled_bank(file_path):
+    """
+    编译题库的随机访问打开函数（供解析后端注册表使用）
+
+    Args:
+        file_path (str): 文件路径
+
+    Returns:
+        CompiledBank: 已打开的编译题库
+    """
+    return CompiledBank(file_path)
+
+
+def parse_compiled_bank(parser, file_path, stats):
+    """
+    编译题库的流式解析后端，依次产出其中的全部题目（如合并导入文件夹时使用）
+
+    Args:
+        parser (ParserService): 解析服务
+        file_path (str): 文件路径
+        stats (ParseStats): 解析统计
+
+    Yields:
+        Question: 题目对象
+    """
+    bank = CompiledBank(file_path)
+    try:
+        count = 0
+        for question in bank:
+            count += 1
+            stats.line_count = count
+            yield question
+        stats.bytes_read = os.path.getsize(file_path)
+        stats.finish(count)
+    finally:
+        bank.close()
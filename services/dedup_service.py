@@ -0,0 +1,299 @@
+import os
+import re
+import time
+import operator
+import unicodedata
+from array import array
+from functools import lru_cache
+from itertools import compress
+from utils.logger import get_logger
+
+# 默认的相似度阈值：两道题规范化后的字符片段集合的 Jaccard 相似度不低于此值时视为重复
+DEFAULT_THRESHOLD = 0.8
+
+# 题目各字段连接在一起规范化，最多调用一次 unicodedata.normalize
+_FIELD_SEPARATOR = '\x00'
+
+# 标点最终都会去掉，只有全角字母数字和带圈数字等需要 NFKC 统一；
+# 中文题目大多不含这些字符，先检查再规范化可以省去大部分 NFKC 的开销
+_COMPATIBILITY_CHARS = re.compile('[\uff10-\uff19\uff21-\uff3a\uff41-\uff5a\u2460-\u24ff]')
+
+# 题号前缀（如 "12." "12、" "(12)"），不同来源的题库编号不同，比较前去掉
+_NUMBER_PREFIX = re.compile(r'^\s*(?:[(（]\d+[)）]|\d+\s*[.．、:：])\s*')
+# 选项字母前缀（如 "A." "B、" "C)"，已统一为小写）
+_OPTION_PREFIX = re.compile(r'^\s*([a-z])\s*[.．、:：)）]\s*')
+# 比较时忽略的空白、标点和下划线
+_IGNORED = re.compile(r'[\W_]+')
+
+# 字符片段长度
+_SHINGLE_SIZE = 3
+
+# MinHash 签名：片段哈希的低位决定所在的桶，每个桶取哈希最小的片段（单次排列 MinHash），
+# 每道题只需计算一次片段哈希。签名按 _BANDS 段、每段 _ROWS 个值分段做 LSH，
+# 相似度 0.8 的两道题至少有一段完全相同的概率约为 98%，0.3 时约为 6%
+_SIGNATURE_SIZE = 32
+_BIN_MASK = _SIGNATURE_SIZE - 1
+_EMPTY = -1  # 空桶（CPython 的 hash() 不会返回 -1）
+_BANDS = 8
+_ROWS = _SIGNATURE_SIZE // _BANDS
+
+# 签名中相同的值所占比例是相似度的估计（32个值时标准差约0.07），
+# 估计值比阈值低出此数以上的候选对不再计算精确的相似度
+_ESTIMATE_MARGIN = 0.25
+
+# 同一个桶内签名完全相同的题目直接合并，只在签名不同的代表之间两两比较；
+# 代表超过此数量时（多为题干套话占满了这一段），不在这一段比较代表，
+# 近似重复的题目由其他段找出，避免比较次数随题目数量平方增长
+_MAX_BUCKET_SIZE = 32
+
+# 取字符片段用的切片对象，按需加长
+_SLICES = []
+
+
+def _normalize(text):
+    """去掉空白和标点"""
+    return _IGNORED.sub('', text)
+
+
+def normalize_question(question):
+    """
+    规范化题目，用于比较不同来源的同一道题
+
+    去掉题号和选项字母，选项按内容排序，忽略空白、标点、全角半角和大小写的差别。
+    正确答案换算为对应的选项内容，选项顺序不同的同一道题答案也能直接比较。
+
+    Args:
+        question (Question): 题目对象
+
+    Returns:
+        tuple: (规范化的题目内容, 规范化的答案)
+    """
+    joined = _FIELD_SEPARATOR.join((question.answer, question.text, *question.options))
+    if _COMPATIBILITY_CHARS.search(joined):
+        joined = unicodedata.normalize('NFKC', joined)
+    fields = joined.casefold().split(_FIELD_SEPARATOR)
+    text = _normalize(_NUMBER_PREFIX.sub('', fields[1], count=1))
+    options = {}
+    for position, option in enumerate(fields[2:]):
+        match = _OPTION_PREFIX.match(option)
+        letter = match.group(1) if match else chr(ord('a') + position)
+        options[letter] = _normalize(option[match.end():] if match else option)
+
+    content = _FIELD_SEPARATOR.join([text] + sorted(options.values()))
+    answer = fields[0]
+    if options and all(letter in options for letter in answer):
+        answer = _FIELD_SEPARATOR.join(sorted(options[letter] for letter in answer))
+    else:
+        answer = _normalize(answer)
+    return content, answer
+
+
+def _shingles(content):
+    """
+    取规范化内容的全部字符片段
+
+    Args:
+        content (str): 规范化的题目内容
+
+    Returns:
+        iterator: 字符片段（可能重复），内容短于片段长度时只有内容本身
+    """
+    count = len(content) - _SHINGLE_SIZE + 1
+    if count <= 0:
+        return iter((content,))
+    while len(_SLICES) < count:
+        start = len(_SLICES)
+        _SLICES.append(slice(start, start + _SHINGLE_SIZE))
+    return map(content.__getitem__, _SLICES[:count])
+
+
+def _jaccard(first, second):
+    """两个集合的 Jaccard 相似度"""
+    return len(first & second) / len(first | second)
+
+
+class DuplicateCluster:
+    """一组互为近似重复的题目"""
+
+    def __init__(self, indexes, answers):
+        """
+        初始化重复题目组
+
+        Args:
+            indexes (list): 题目索引，按题号排序
+            answers (list): 各题规范化后的答案
+        """
+        self.indexes = indexes
+        self.answers = answers
+
+    @property
+    def conflicting(self):
+        """组内题目的答案是否不一致（缺少答案的题目不参与比较）"""
+        return len(set(filter(None, self.answers))) > 1
+
+
+class DedupReport:
+    """近似重复题目检测报告"""
+
+    def __init__(self, question_count, clusters, seconds):
+        """
+        初始化检测报告
+
+        Args:
+            question_count (int): 检测的题目数量
+            clusters (list): 重复题目组（DuplicateCluster）
+            seconds (float): 检测耗时（秒）
+        """
+        self.question_count = question_count
+        self.clusters = clusters
+        self.seconds = seconds
+
+    @property
+    def duplicate_count(self):
+        """可以去掉的重复题目数量（每组保留一道）"""
+        return sum(len(cluster.indexes) - 1 for cluster in self.clusters)
+
+    @property
+    def conflicts(self):
+        """答案不一致的重复题目组"""
+        return [cluster for cluster in self.clusters if cluster.conflicting]
+
+    def summary(self, questions=None, max_listed=20):
+        """
+        生成检测摘要文本
+
+        Args:
+            questions: 被检测的题目序列，提供时列出答案冲突的题目的来源和答案
+            max_listed (int): 最多列出的答案冲突组数
+
+        Returns:
+            str: 摘要
+        """
+        conflicts = self.conflicts
+        lines = [f"检测 {self.question_count} 道题目，发现 {len(self.clusters)} 组重复"
+                 f"（可去掉 {self.duplicate_count} 道），其中 {len(conflicts)} 组答案不一致，"
+                 f"耗时 {self.seconds:.2f} 秒"]
+        if questions is None:
+            return "\n".join(lines)
+
+        for cluster in conflicts[:max_listed]:
+            members = []
+            for index in cluster.indexes:
+                question = questions[index]
+                source = os.path.basename(question.source_file) if question.source_file else ""
+                members.append(f"第{index + 1}题{'(' + source + ')' if source else ''} 答案{question.answer or '缺失'}")
+            lines.append("答案冲突: " + "，".join(members))
+        if len(conflicts) > max_listed:
+            lines.append(f"……另有 {len(conflicts) - max_listed} 组答案冲突未列出")
+        return "\n".join(lines)
+
+
+def find_duplicates(questions, threshold=DEFAULT_THRESHOLD):
+    """
+    用 MinHash 签名和 LSH 分段查找近似重复的题目
+
+    每道题计算一次规范化内容的字符片段签名，签名某一段完全相同的题目才成为候选对，
+    再用精确的 Jaccard 相似度确认。候选对只占全部题目对的极小部分，
+    耗时随题目数量线性增长，不需要两两比较。相互重复的题目用并查集合并为一组。
+
+    Args:
+        questions: 题目序列（如 QuestionBank.questions），支持 len() 和按索引读取
+        threshold (float): 相似度阈值
+
+    Returns:
+        DedupReport: 检测报告
+    """
+    logger = get_logger()
+    start = time.perf_counter()
+    count = len(questions)
+
+    # 第一遍：计算签名，同时记下答案
+    signatures = array('q')
+    answers = []
+    empty_bins = [_EMPTY] * _SIGNATURE_SIZE
+    bins = range(_SIGNATURE_SIZE)
+    for question in questions:
+        content, answer = normalize_question(question)
+        answers.append(answer)
+        # 哈希从大到小写入字典，每个桶最后留下的是哈希最小的片段（重复的片段不影响结果）
+        hashes = sorted(map(hash, _shingles(content)), reverse=True)
+        minimums = dict(zip(map(_BIN_MASK.__and__, hashes), hashes))
+        signatures.extend(map(minimums.get, bins, empty_bins))
+
+    @lru_cache(maxsize=4096)
+    def shingles_of(index):
+        return set(_shingles(normalize_question(questions[index])[0]))
+
+    parent = array('I', range(count))
+
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def union(root, other_root):
+        # 根节点取较小的题目索引，组内第一道题即为根
+        parent[max(root, other_root)] = min(root, other_root)
+
+    # 第二遍：逐段找出签名这一段相同的题目，同一个桶内的题目两两确认。
+    # 大多数题目的每一段都是唯一的，用字典和集合运算找出重复的段，不逐题循环
+    data = signatures.tobytes()
+    stride = _SIGNATURE_SIZE * signatures.itemsize
+    width = _ROWS * signatures.itemsize
+    empty_band = array('q', [_EMPTY] * _ROWS).tobytes()
+    min_agreement = (threshold - _ESTIMATE_MARGIN) * _SIGNATURE_SIZE
+    comparisons = 0
+    for band in range(_BANDS):
+        offset = band * width
+        keys = list(map(data.__getitem__, map(slice, range(offset, len(data), stride),
+                                              range(offset + width, len(data) + 1, stride))))
+        last = dict(zip(keys, range(count)))
+        if len(last) == count:
+            continue
+        # 不是该段最后一次出现的题目，与最后一次出现的题目同桶
+        buckets = {}
+        for index in compress(range(count), map(operator.ne, map(last.__getitem__, keys), range(count))):
+            key = keys[index]
+            buckets.setdefault(key, [last[key]]).append(index)
+        del keys, last
+
+        for key, members in buckets.items():
+            if key == empty_band:
+                continue
+            # 同一道题的多个副本（规范化后内容相同）签名完全相同，直接合并，不受桶大小限制
+            representatives = {}
+            for index in members:
+                first = representatives.setdefault(data[index * stride:(index + 1) * stride], index)
+                if first != index:
+                    root, other_root = find(index), find(first)
+                    if root != other_root:
+                        union(root, other_root)
+            if len(representatives) < 2 or len(representatives) > _MAX_BUCKET_SIZE:
+                continue
+            members = sorted(representatives.values())
+            for position, index in enumerate(members):
+                for other in members[:position]:
+                    root, other_root = find(index), find(other)
+                    if root == other_root:
+                        continue
+                    agreement = sum(map(operator.eq,
+                                        signatures[index * _SIGNATURE_SIZE:(index + 1) * _SIGNATURE_SIZE],
+                                        signatures[other * _SIGNATURE_SIZE:(other + 1) * _SIGNATURE_SIZE]))
+                    if agreement < min_agreement:
+                        continue
+                    comparisons += 1
+                    if _jaccard(shingles_of(other), shingles_of(index)) >= threshold:
+                        union(root, other_root)
+
+    groups = {}
+    for index in range(count):
+        root = find(index)
+        if root != index:
+            groups.setdefault(root, [root]).append(index)
+    clusters = [DuplicateCluster(indexes, [answers[i] for i in indexes]) for indexes in groups.values()]
+
+    report = DedupReport(count, clusters, time.perf_counter() - start)
+    logger.info(f"重复题目检测: {count} 道题目，{comparisons} 次比较，{len(clusters)} 组重复，"
+                f"{len(report.conflicts)} 组答案不一致，耗时 {report.seconds:.2f} 秒")
+    return report
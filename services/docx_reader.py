@@ -0,0 +1,148 @@
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ElementTree
+
+# WordprocessingML 命名空间
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_BODY = _W + 'body'
+_P = _W + 'p'
+_R = _W + 'r'
+_HYPERLINK = _W + 'hyperlink'
+_T = _W + 't'
+_TAB = _W + 'tab'
+_PTAB = _W + 'ptab'
+_BR = _W + 'br'
+_CR = _W + 'cr'
+_NO_BREAK_HYPHEN = _W + 'noBreakHyphen'
+_BR_TYPE = _W + 'type'
+
+_PACKAGE_RELS = '_rels/.rels'
+_RELS_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+_OFFICE_DOCUMENT_REL = '/officeDocument'
+_DEFAULT_DOCUMENT_PART = 'word/document.xml'
+
+
+def open_docx_paragraphs(file_path):
+    """
+    打开Word文档并返回段落文本生成器
+
+    直接从 zip 包中流式读取主文档部件，不加载图片等其他部件。
+    lxml 缺失、文件不是有效的 docx 包时在此处立即抛出异常，便于调用方回退。
+
+    Args:
+        file_path (str): 文档路径
+
+    Returns:
+        generator: 逐段产出段落文本的生成器
+
+    Raises:
+        ImportError: 未安装 lxml
+        zipfile.BadZipFile: 文件不是 zip 包
+        KeyError: 包中没有主文档部件
+    """
+    from lxml import etree
+
+    archive = zipfile.ZipFile(file_path)
+    try:
+        part_name = _find_document_part(archive)
+        archive.getinfo(part_name)
+    except Exception:
+        archive.close()
+        raise
+
+    return _iter_paragraphs(etree, archive, part_name)
+
+
+def _find_document_part(archive):
+    """
+    通过包关系找到主文档部件的名称
+
+    Args:
+        archive (zipfile.ZipFile): docx 包
+
+    Returns:
+        str: 主文档部件在包中的路径
+    """
+    try:
+        rels = ElementTree.fromstring(archive.read(_PACKAGE_RELS))
+    except (KeyError, ElementTree.ParseError):
+        return _DEFAULT_DOCUMENT_PART
+
+    for rel in rels.iter(_RELS_NS + 'Relationship'):
+        if rel.get('Type', '').endswith(_OFFICE_DOCUMENT_REL):
+            target = rel.get('Target', '')
+            return posixpath.normpath(target.lstrip('/'))
+    return _DEFAULT_DOCUMENT_PART
+
+
+def _iter_paragraphs(etree, archive, part_name):
+    """
+    流式解析主文档部件，产出正文中的顶层段落文本
+
+    与 python-docx 的 Document.paragraphs 一致，只包含 w:body 的直接子段落，
+    表格中的段落不计入。处理完的元素随即释放。
+
+    Args:
+        etree: lxml.etree 模块
+        archive (zipfile.ZipFile): docx 包
+        part_name (str): 主文档部件路径
+
+    Yields:
+        str: 段落文本
+    """
+    with archive, archive.open(part_name) as stream:
+        for _, elem in etree.iterparse(stream, events=('end',), tag=_P, huge_tree=True):
+            parent = elem.getparent()
+            if parent is None or parent.tag != _BODY:
+                continue
+
+            yield paragraph_text(elem)
+
+            # 释放已处理的段落及其之前的兄弟元素（包括表格）
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+
+
+def paragraph_text(paragraph):
+    """
+    提取段落文本，规则与 python-docx 的 Paragraph.text 相同
+
+    Args:
+        paragraph: w:p 元素
+
+    Returns:
+        str: 段落文本
+    """
+    parts = []
+    for child in paragraph:
+        if child.tag == _R:
+            _append_run_text(child, parts)
+        elif child.tag == _HYPERLINK:
+            for run in child:
+                if run.tag == _R:
+                    _append_run_text(run, parts)
+    return ''.join(parts)
+
+
+def _append_run_text(run, parts):
+    """
+    把一个 w:r 中的文本追加到 parts
+
+    Args:
+        run: w:r 元素
+        parts (list): 文本片段列表
+    """
+    for child in run:
+        tag = child.tag
+        if tag == _T:
+            parts.append(child.text or '')
+        elif tag == _TAB or tag == _PTAB:
+            parts.append('\t')
+        elif tag == _BR:
+            if child.get(_BR_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag == _CR:
+            parts.append('\n')
+        elif tag == _NO_BREAK_HYPHEN:
+            parts.append('-')
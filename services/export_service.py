@@ -0,0 +1,43 @@
+import os
+import re
+from utils.logger import get_logger
+
+# 题目文本开头的题号（如 "12." "12、" "第12题"），导出时重新编号
+_NUMBER_PREFIX = re.compile(r'^\s*(?:\d+\s*[.．、]|第\d+题)\s*')
+
+
+def export_questions(questions, indexes, file_path):
+    """
+    把指定的题目导出为文本题库，导出的文件可以直接作为题库打开
+
+    题目按索引顺序从1开始重新编号，每道题依次写出题干、选项、答案和解析，题目之间空一行。
+    使用带 BOM 的 UTF-8 编码，Windows 记事本也能正确显示。
+
+    Args:
+        questions: 题目序列（如 QuestionBank.questions），支持按索引读取
+        indexes (iterable): 要导出的题目索引
+        file_path (str): 导出文件路径
+
+    Returns:
+        int: 导出的题目数量
+
+    Raises:
+        OSError: 文件无法写入
+    """
+    logger = get_logger()
+    count = 0
+    tmp_path = file_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8-sig', newline='\r\n') as f:
+        for index in sorted(indexes):
+            question = questions[index]
+            count += 1
+            lines = [f"{count}. {_NUMBER_PREFIX.sub('', question.text, count=1)}"]
+            lines.extend(question.options)
+            if question.answer:
+                lines.append(f"答案：{question.answer}")
+            if question.explanation:
+                lines.append(f"解析：{question.explanation}")
+            f.write("\n".join(lines) + "\n\n")
+    os.replace(tmp_path, file_path)
+    logger.info(f"已导出 {count} 道题目到: {file_path}")
+    return count
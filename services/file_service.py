@@ -15,8 +15,24 @@ import sys
 import time
 import tkinter as tk
 from tkinter import filedialog, messagebox
+from utils import startup_profiler
 from utils.logger import get_logger
-from config.settings import FILE_PATTERNS
+from services.parser_registry import supported_extensions
+
+def _describe_extensions(extensions):
+    """
+    把扩展名列表写成提示文字，如 ".docx, .txt 或 .csv"
+
+    Args:
+        extensions (list): 扩展名列表
+
+    Returns:
+        str: 提示文字
+    """
+    if len(extensions) < 2:
+        return "".join(extensions)
+    return f"{', '.join(extensions[:-1])} 或 {extensions[-1]}"
+
 
 class FileService:
     """文件服务类，负责文件选择和基本文件操作"""
@@ -82,7 +98,8 @@ class FileService:
         """
         打开系统文件选择对话框，让用户选择题库文件
 
-        创建临时的根窗口显示文件选择对话框，并在选择后进行文件有效性检查。
+        优先使用主窗口作为对话框的父窗口（不必再创建一个 Tk 解释器），没有主窗口时
+        创建临时的根窗口，并在选择后进行文件有效性检查。
         如果设置了direct_load参数，将直接调用控制器的load_question_bank方法加载文件。
 
         Args:
@@ -95,12 +112,12 @@ class FileService:
             None: 如果用户取消选择或发生错误
         """
         try:
-            # 创建临时的根窗口
-            root = tk.Tk()
-            root.withdraw()  # 隐藏窗口
+            parent, temporary = self._get_dialog_parent(controller)
+            startup_profiler.finish_at_first_dialog()
 
             # 打开文件选择对话框
             file_path = filedialog.askopenfilename(
+                parent=parent,
                 title="选择题库文件",
                 filetypes=[
                     ("所有文件", "*.*")  # 只保留所有文件选项
@@ -109,7 +126,8 @@ class FileService:
             )
 
             # 销毁临时窗口
-            root.destroy()
+            if temporary:
+                parent.destroy()
 
             if file_path:
                 self.logger.info(f"用户选择了文件: {file_path}")
@@ -121,16 +139,17 @@ class FileService:
 
                 # 检查文件扩展名是否支持
                 file_ext = os.path.splitext(file_path)[1].lower()
-                if file_ext not in FILE_PATTERNS and file_ext != '':  # 空扩展名视为文件夹，跳过检查
+                if file_ext not in supported_extensions() and file_ext != '':  # 空扩展名视为文件夹，跳过检查
                     self.logger.warning(f"选择的文件类型不受支持: {file_ext}")
-                    # 创建临时的根窗口用于显示警告
-                    warn_root = tk.Tk()
-                    warn_root.withdraw()
+                    warn_parent, temporary = self._get_dialog_parent(controller)
                     messagebox.showwarning(
                         "文件类型警告",
-                        f"选择的文件类型 {file_ext} 不在支持列表中，但系统仍将尝试加载。\n\n如果加载失败，请选择 .docx, .txt 或 .csv 格式的文件。"
+                        f"选择的文件类型 {file_ext} 不在支持列表中，但系统仍将尝试加载。\n\n"
+                        f"如果加载失败，请选择 {_describe_extensions(supported_extensions())} 格式的文件。",
+                        parent=warn_parent
                     )
-                    warn_root.destroy()
+                    if temporary:
+                        warn_parent.destroy()
 
                 # 直接加载模式：调用控制器加载题库
                 if direct_load and controller:
@@ -148,4 +167,84 @@ class FileService:
                 return None
         except Exception as e:
             self.logger.error(f"打开文件选择对话框时出错: {str(e)}")
+            return None
+
+    def _get_dialog_parent(self, controller):
+        """
+        获取对话框的父窗口
+
+        Args:
+            controller: 控制器对象，其视图的根窗口可作为父窗口
+
+        Returns:
+            tuple: (父窗口, 是否为临时创建的根窗口，用完需销毁)
+        """
+        view = getattr(controller, 'view', None)
+        if view is not None:
+            return view.root, False
+
+        # 创建临时的根窗口
+        root = tk.Tk()
+        root.withdraw()  # 隐藏窗口
+        return root, True
+
+    def _save_file_dialog(self, controller=None, title="保存文件", initial_file=""):
+        """
+        打开系统保存文件对话框，让用户选择导出文件的位置
+
+        Args:
+            controller: 控制器对象，其视图的根窗口作为对话框的父窗口
+            title (str): 对话框标题
+            initial_file (str): 默认的文件名
+
+        Returns:
+            str: 选择的文件路径
+            None: 如果用户取消选择或发生错误
+        """
+        try:
+            parent, temporary = self._get_dialog_parent(controller)
+            file_path = filedialog.asksaveasfilename(
+                parent=parent,
+                title=title,
+                initialfile=initial_file,
+                defaultextension=".txt",
+                filetypes=[("文本文件", "*.txt"), ("所有文件", "*.*")],
+                initialdir=self._get_main_directory()
+            )
+            if temporary:
+                parent.destroy()
+
+            if file_path:
+                self.logger.info(f"用户选择了保存位置: {file_path}")
+                return file_path
+
+            self.logger.info("用户取消了保存")
+            return None
+        except Exception as e:
+            self.logger.error(f"打开保存文件对话框时出错: {str(e)}")
+            return None
+
+    def _open_directory_dialog(self):
+        """
+        打开系统文件夹选择对话框，让用户选择存放多个题库文件的文件夹
+
+        Returns:
+            str: 选择的文件夹路径
+            None: 如果用户取消选择或发生错误
+        """
+        try:
+            directory = filedialog.askdirectory(
+                title="选择题库文件夹",
+                initialdir=self._get_main_directory(),
+                mustexist=True
+            )
+
+            if directory:
+                self.logger.info(f"用户选择了文件夹: {directory}")
+                return directory
+
+            self.logger.info("用户取消了文件夹选择")
+            return None
+        except Exception as e:
+            self.logger.error(f"打开文件夹选择对话框时出错: {str(e)}")
             return None
\ No newline at end of file
@@ -0,0 +1,259 @@
+import os
+import re
+import time
+from services.load_service import LoadProgress
+from services.parser_service import ParserService
+from services.parser_registry import backend_for_extension, supported_extensions
+from utils.logger import get_logger
+
+
+def _parse_file_worker(file_path):
+    """
+    在工作进程中解析单个题库文件
+
+    Args:
+        file_path (str): 题库文件路径
+
+    Returns:
+        tuple: (文件路径, 题目列表, 耗时秒数, 错误信息)，失败时题目列表为None
+    """
+    start = time.perf_counter()
+    try:
+        questions = ParserService(parallel=False).parse_document(file_path)
+        return file_path, questions, time.perf_counter() - start, None
+    except Exception as e:
+        return file_path, None, time.perf_counter() - start, str(e)
+
+
+def _natural_key(path):
+    """按自然顺序排序的键，使“第2章”排在“第10章”之前"""
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', path)]
+
+
+class ImportResult:
+    """单个文件的导入结果"""
+
+    def __init__(self, file_path, question_count=0, seconds=0.0, error=None, cached=False):
+        """
+        初始化导入结果
+
+        Args:
+            file_path (str): 文件路径
+            question_count (int): 解析出的题目数量
+            seconds (float): 解析耗时（秒）
+            error (str): 错误信息，成功时为None
+            cached (bool): 是否来自缓存
+        """
+        self.file_path = file_path
+        self.question_count = question_count
+        self.seconds = seconds
+        self.error = error
+        self.cached = cached
+
+
+class ImportReport:
+    """文件夹导入报告，记录每个文件的耗时和失败情况"""
+
+    def __init__(self, directory):
+        """
+        初始化导入报告
+
+        Args:
+            directory (str): 导入的文件夹路径
+        """
+        self.directory = directory
+        self.results = []
+        self.seconds = 0.0
+
+    @property
+    def failures(self):
+        """失败的文件结果列表"""
+        return [r for r in self.results if r.error]
+
+    @property
+    def question_count(self):
+        """导入的题目总数"""
+        return sum(r.question_count for r in self.results)
+
+    def summary(self):
+        """
+        生成导入摘要文本
+
+        Returns:
+            str: 摘要
+        """
+        lines = [f"共导入 {len(self.results) - len(self.failures)}/{len(self.results)} 个文件，"
+                 f"{self.question_count} 道题目，耗时 {self.seconds:.2f} 秒"]
+        for r in self.failures:
+            lines.append(f"失败: {os.path.basename(r.file_path)} - {r.error}")
+        return "\n".join(lines)
+
+
+class ImportService:
+    """题库导入服务，负责把一个文件夹中的多个题库文件并行解析并合并"""
+
+    def __init__(self, bank_cache=None, max_workers=None):
+        """
+        初始化导入服务
+
+        Args:
+            bank_cache (BankCache): 题库缓存，为None时不使用缓存
+            max_workers (int): 工作进程数，默认为CPU核数
+        """
+        self.logger = get_logger()
+        self.bank_cache = bank_cache
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def list_bank_files(self, directory):
+        """
+        列出文件夹（含子文件夹）中所有支持的题库文件，按自然顺序排序
+
+        由 --compile 生成的编译题库（.qbc、.qdb）与同名的源文件在同一个文件夹时只导入源文件，
+        以免同一批题目导入两次。
+
+        Args:
+            directory (str): 文件夹路径
+
+        Returns:
+            list: 文件路径列表
+        """
+        extensions = set(supported_extensions())
+        files = []
+        for root, dirs, names in os.walk(directory):
+            dirs.sort(key=_natural_key)
+            banks = [name for name in names if os.path.splitext(name)[1].lower() in extensions]
+            sources = {os.path.splitext(name)[0].lower() for name in banks
+                       if not backend_for_extension(name).random_access}
+            for name in banks:
+                if (backend_for_extension(name).random_access
+                        and os.path.splitext(name)[0].lower() in sources):
+                    self.logger.info(f"跳过与源文件同名的编译题库: {os.path.join(root, name)}")
+                    continue
+                files.append(os.path.join(root, name))
+        files.sort(key=lambda path: _natural_key(os.path.relpath(path, directory)))
+        return files
+
+    def import_directory(self, directory, loader=None):
+        """
+        并行解析文件夹中的所有题库文件，按文件顺序合并题目
+
+        单个文件失败不会中断整体导入，失败信息记录在报告中。
+        提供后台加载任务时，每读完一个文件报告一次进度并检查是否已取消。
+
+        Args:
+            directory (str): 文件夹路径
+            loader (BackgroundLoader): 后台加载任务，为None时不报告进度
+
+        Returns:
+            tuple: (题目列表, ImportReport)
+
+        Raises:
+            FileNotFoundError: 文件夹不存在
+            ValueError: 文件夹中没有支持的题库文件
+            LoadCancelled: 导入被取消
+        """
+        if not os.path.isdir(directory):
+            self.logger.error(f"文件夹不存在: {directory}")
+            raise FileNotFoundError(f"文件夹不存在: {directory}")
+
+        files = self.list_bank_files(directory)
+        if not files:
+            raise ValueError(f"文件夹中没有支持的题库文件（{', '.join(supported_extensions())}）")
+
+        self.logger.info(f"开始导入文件夹: {directory}，共 {len(files)} 个文件")
+        start = time.perf_counter()
+        report = ImportReport(directory)
+        parsed = {}
+        keys = {}
+
+        question_count = 0
+
+        def file_done(questions):
+            """记录一个文件已读完，报告进度并检查取消"""
+            nonlocal question_count
+            question_count += len(questions or ())
+            if loader:
+                loader.check_cancelled()
+                loader.report(LoadProgress(len(parsed), len(files), 'files', question_count))
+
+        # 先从缓存读取未变化的文件
+        to_parse = []
+        for file_path in files:
+            cached = self._get_cached(file_path, keys)
+            if cached is not None:
+                parsed[file_path] = (cached, 0.0, None, True)
+                file_done(cached)
+            else:
+                to_parse.append(file_path)
+
+        results = self._parse_files(to_parse)
+        try:
+            for file_path, questions, seconds, error in results:
+                parsed[file_path] = (questions, seconds, error, False)
+                if questions is not None and file_path in keys:
+                    self.bank_cache.put(keys[file_path], questions, file_path)
+                file_done(questions)
+        finally:
+            # 取消时立即停止进程池，不再等待尚未开始的文件
+            results.close()
+
+        # 按文件顺序合并，保证结果确定
+        merged = []
+        for file_path in files:
+            questions, seconds, error, cached = parsed[file_path]
+            if error:
+                self.logger.error(f"导入失败: {file_path} - {error}")
+                report.results.append(ImportResult(file_path, 0, seconds, error))
+                continue
+            self.logger.info(f"导入 {file_path}: {len(questions)} 道题目，耗时 {seconds:.2f} 秒"
+                             f"{'（缓存）' if cached else ''}")
+            merged.extend(questions)
+            report.results.append(ImportResult(file_path, len(questions), seconds, None, cached))
+
+        report.seconds = time.perf_counter() - start
+        self.logger.info(report.summary())
+        return merged, report
+
+    def _get_cached(self, file_path, keys):
+        """
+        从缓存读取单个文件的解析结果
+
+        Args:
+            file_path (str): 文件路径
+            keys (dict): 文件路径到指纹的映射，计算出的指纹会写入其中
+
+        Returns:
+            list: 题目列表，未命中时返回None
+        """
+        if not self.bank_cache:
+            return None
+        try:
+            keys[file_path] = self.bank_cache.fingerprint(file_path)
+        except OSError as e:
+            self.logger.warning(f"计算题库指纹失败: {str(e)}")
+            return None
+        return self.bank_cache.get(keys[file_path], file_path)
+
+    def _parse_files(self, files):
+        """
+        解析多个文件，文件多于一个时使用进程池
+
+        Args:
+            files (list): 文件路径列表
+
+        Returns:
+            generator: 按文件顺序逐个产生 (文件路径, 题目列表, 耗时秒数, 错误信息)，
+                关闭生成器时取消尚未开始的文件
+        """
+        workers = min(self.max_workers, len(files))
+        if workers <= 1:
+            for file_path in files:
+                yield _parse_file_worker(file_path)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            yield from executor.map(_parse_file_worker, files)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
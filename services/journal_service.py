@@ -0,0 +1,224 @@
+import os
+import json
+import time
+import threading
+from utils.logger import get_logger
+from config.settings import JOURNAL_FLUSH_SECONDS, JOURNAL_COMPACT_RECORDS
+
+# 日志文件第一行：格式标记和代数，代数与快照不同的日志已并入快照（压缩中途退出留下的旧日志）
+_JOURNAL_MAGIC = "QJ1"
+_JOURNAL_SUFFIX = '.journal'
+_SNAPSHOT_SUFFIX = '.snapshot'
+
+# 日志记录：每行一条，"题目索引\t答案"，答案为空表示撤销该题答案，_CLEAR 表示清空全部答案
+_CLEAR = "*"
+
+
+class AnswerJournal:
+    """
+    用户答案的追加式日志
+
+    每次作答只在内存中追加一条记录并立即返回，由后台线程攒批写入日志文件，
+    每批写完调用一次 fsync；第一条记录到达后等待 JOURNAL_FLUSH_SECONDS 再写，
+    连续点击的记录合并为一次写盘，界面线程不会等待磁盘。
+
+    打开时读取快照并重放日志恢复答案。程序崩溃时，最后一批未写完的记录（不完整的行）被忽略，
+    之前的记录不受影响。日志记录数超过 JOURNAL_COMPACT_RECORDS 且多于答案数量时，
+    把全部答案写成新的快照并换用空日志（压缩）：快照和日志都先写临时文件再替换，
+    快照的代数加一，日志第一行记录所属的代数，压缩中途退出时旧日志因代数不符被忽略。
+    """
+
+    def __init__(self, base_path, flush_seconds=JOURNAL_FLUSH_SECONDS, compact_records=JOURNAL_COMPACT_RECORDS):
+        """
+        打开答案日志并恢复已记录的答案
+
+        Args:
+            base_path (str): 日志文件路径（不含扩展名），快照和日志分别加上 .snapshot、.journal
+            flush_seconds (float): 第一条未写入的记录最多等待多久写盘（秒）
+            compact_records (int): 日志记录数达到此数时考虑压缩
+        """
+        self.logger = get_logger()
+        self.journal_path = base_path + _JOURNAL_SUFFIX
+        self.snapshot_path = base_path + _SNAPSHOT_SUFFIX
+        self.flush_seconds = flush_seconds
+        self.compact_records = compact_records
+        self.answers = {}  # 题目索引 -> 答案，已包含尚未写盘的记录
+        self._generation = 0
+        self._journal_records = 0  # 日志文件中的记录数
+        self._needs_compact = False  # 日志文件不能直接追加（已过时或末尾有不完整的记录），下次写盘时压缩
+        self._pending = []  # 尚未写盘的记录行
+        self._file = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = None
+        self._load()
+
+    def _load(self):
+        """读取快照并重放日志"""
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            self._generation = int(snapshot['generation'])
+            self.answers = dict(zip(snapshot['indexes'], snapshot['answers']))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(f"读取答案快照失败: {str(e)}")
+
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8', newline='\n') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.warning(f"读取答案日志失败: {str(e)}")
+            return
+
+        header, _, body = data.partition('\n')
+        if header != f"{_JOURNAL_MAGIC} {self._generation}":
+            self.logger.info("答案日志已并入快照，忽略")
+            self._needs_compact = True
+            return
+        # 最后一段没有换行符时是写到一半的记录，丢弃；不能再在其后追加，下次写盘时压缩
+        lines = body.split('\n')
+        if lines.pop():
+            self.logger.warning("答案日志末尾有不完整的记录，已忽略")
+            self._needs_compact = True
+        answers = self.answers
+        for line in lines:
+            index, separator, answer = line.partition('\t')
+            if not separator:
+                if line == _CLEAR:
+                    answers.clear()
+                continue
+            try:
+                index = int(index)
+            except ValueError:
+                continue
+            if answer:
+                answers[index] = answer
+            else:
+                answers.pop(index, None)
+        self._journal_records = len(lines)
+
+    def record(self, index, answer):
+        """
+        记录一道题的答案（不等待写盘）
+
+        Args:
+            index (int): 题目索引
+            answer (str): 用户答案，为空或None时表示撤销该题答案
+        """
+        with self._condition:
+            if answer:
+                self.answers[index] = answer
+            else:
+                self.answers.pop(index, None)
+            self._append(f"{index}\t{answer or ''}")
+
+    def clear(self):
+        """记录清空全部答案（不等待写盘）"""
+        with self._condition:
+            self.answers.clear()
+            self._append(_CLEAR)
+
+    def _append(self, line):
+        """追加一条待写盘的记录并唤醒后台线程（调用时已持有锁）"""
+        if self._closed:
+            return
+        self._pending.append(line)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="answer-journal", daemon=True)
+            self._thread.start()
+        self._condition.notify()
+
+    def _run(self):
+        """后台线程入口：攒批写盘，必要时压缩"""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                # 等一会儿，把这段时间内的点击合并为一次写盘（新记录的唤醒不提前结束等待）
+                deadline = time.monotonic() + self.flush_seconds
+                while not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                lines, self._pending = self._pending, []
+                snapshot = None
+                if (self._needs_compact or
+                        self._journal_records + len(lines) >= max(self.compact_records, len(self.answers))):
+                    snapshot = dict(self.answers)
+            try:
+                if snapshot is not None:
+                    self._compact(snapshot)
+                else:
+                    self._write(lines)
+            except OSError as e:
+                # 日志末尾可能留下不完整的记录，下次写盘时改为压缩
+                self.logger.warning(f"写入答案日志失败: {str(e)}")
+                self._needs_compact = True
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+
+    def _write(self, lines):
+        """
+        把一批记录追加到日志文件并 fsync
+
+        Args:
+            lines (list): 记录行
+        """
+        if self._file is None:
+            self._file = open(self.journal_path, 'a', encoding='utf-8', newline='\n')
+            if self._file.tell() == 0:
+                self._file.write(f"{_JOURNAL_MAGIC} {self._generation}\n")
+        self._file.write("\n".join(lines) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._journal_records += len(lines)
+
+    def _compact(self, answers):
+        """
+        把全部答案写成新的快照，换用空日志
+
+        Args:
+            answers (dict): 包含全部已记录答案的副本
+        """
+        generation = self._generation + 1
+        tmp_path = self.snapshot_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'generation': generation, 'indexes': list(answers), 'answers': list(answers.values())},
+                      f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        tmp_path = self.journal_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(f"{_JOURNAL_MAGIC} {generation}\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
+        self._generation = generation
+        self._journal_records = 0
+        self._needs_compact = False
+        self.logger.info(f"答案日志已压缩为快照，共 {len(answers)} 道题目的答案")
+
+    def close(self):
+        """写入全部未写盘的记录并关闭日志（切换题库和退出程序前调用）"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
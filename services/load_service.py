@@ -0,0 +1,207 @@
+import os
+import time
+import queue
+import threading
+from models.parse_stats import ParseStats
+from services.parser_registry import find_backend
+from utils.logger import get_logger
+
+# 后台任务向界面报告进度的最小间隔（秒）
+_PROGRESS_INTERVAL = 0.1
+
+
+class LoadCancelled(Exception):
+    """加载被用户取消"""
+
+
+class LoadProgress:
+    """题库加载进度快照"""
+
+    def __init__(self, done=0, total=0, unit='bytes', question_count=0):
+        """
+        初始化加载进度
+
+        Args:
+            done (int): 已处理的数量
+            total (int): 总数量，未知时为0
+            unit (str): 计量单位：'bytes' 字节、'paragraphs' 段落、'rows' 行、'cache' 缓存、
+                'files' 文件（导入文件夹），前三种由解析后端的 progress_unit 决定
+            question_count (int): 已解析的题目数量
+        """
+        self.done = done
+        self.total = total
+        self.unit = unit
+        self.question_count = question_count
+
+    @property
+    def fraction(self):
+        """完成比例（0~1），总量未知时为None"""
+        if self.total <= 0:
+            return None
+        return min(1.0, self.done / self.total)
+
+    def describe(self):
+        """
+        生成进度说明文本
+
+        Returns:
+            str: 进度说明
+        """
+        if self.unit == 'bytes':
+            processed = f"已读取 {self.done / 1048576:.1f}"
+            if self.total:
+                processed += f"/{self.total / 1048576:.1f}"
+            processed += " MB"
+        elif self.unit == 'cache':
+            processed = "已从缓存读取"
+        elif self.unit == 'files':
+            processed = f"已读取 {self.done}/{self.total} 个文件"
+        elif self.unit == 'paragraphs':
+            processed = f"已处理 {self.done} 段"
+        else:
+            processed = f"已处理 {self.done} 行"
+        return f"{processed}，已解析 {self.question_count} 道题目"
+
+
+class BackgroundLoader:
+    """
+    在后台线程中运行加载任务
+
+    后台线程只通过队列向界面线程传递进度和结果，不直接操作界面；
+    界面线程用 root.after 定期调用 poll 取出事件。
+    增量模式下，已解析的题目随进度分批送出，界面无需等待全部解析完成。
+    """
+
+    def __init__(self, target, *args, incremental=False):
+        """
+        初始化后台加载任务
+
+        Args:
+            target (callable): 加载函数，调用方式为 target(loader, *args)，返回加载结果
+            *args: 传给加载函数的其他参数
+            incremental (bool): 是否分批送出已解析的题目
+        """
+        self.logger = get_logger()
+        self.target = target
+        self.args = args
+        self.incremental = incremental
+        self._events = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._last_report = 0.0
+        self._thread = threading.Thread(target=self._run, name="bank-loader", daemon=True)
+
+    def start(self):
+        """启动后台线程"""
+        self._thread.start()
+
+    def cancel(self):
+        """请求取消，加载函数在下一次检查时停止"""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self):
+        """是否已请求取消"""
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        """
+        检查是否已请求取消
+
+        Raises:
+            LoadCancelled: 已请求取消
+        """
+        if self._cancel_event.is_set():
+            raise LoadCancelled()
+
+    def due(self):
+        """
+        距上次报告是否已超过报告间隔
+
+        Returns:
+            bool: 是否应该报告进度
+        """
+        return time.perf_counter() - self._last_report >= _PROGRESS_INTERVAL
+
+    def report(self, progress, questions=None):
+        """
+        报告加载进度；增量模式下同时送出自上次报告以来解析出的题目
+
+        Args:
+            progress (LoadProgress): 进度快照
+            questions (list): 新解析出的题目，非增量模式下忽略
+        """
+        self._last_report = time.perf_counter()
+        if self.incremental and questions:
+            self._events.put(('questions', questions))
+        self._events.put(('progress', progress))
+
+    def poll(self):
+        """
+        取出后台线程产生的全部事件（在界面线程中调用）
+
+        Returns:
+            list: (事件类型, 数据) 列表，事件类型为 'questions'、'progress'、'done'、'error'
+                或 'cancelled'
+        """
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _run(self):
+        """后台线程入口"""
+        try:
+            result = self.target(self, *self.args)
+        except LoadCancelled:
+            self.logger.info("加载已取消")
+            self._events.put(('cancelled', None))
+        except Exception as e:
+            self._events.put(('error', e))
+        else:
+            self._events.put(('done', result))
+
+
+def parse_with_progress(parser_service, file_path, loader):
+    """
+    流式解析题库文件，边解析边报告进度并响应取消
+
+    第一道题解析出来后立即报告，之后按报告间隔分批报告。
+    取消时关闭题目生成器，已打开的文件和进程池随之释放。
+
+    Args:
+        parser_service (ParserService): 解析服务
+        file_path (str): 题库文件路径
+        loader (BackgroundLoader): 后台加载任务
+
+    Returns:
+        list: 题目对象列表
+
+    Raises:
+        LoadCancelled: 加载被取消
+    """
+    stats = ParseStats(file_path)
+    stream = parser_service.iter_questions(file_path, stats)
+    questions = []
+    new_questions = []
+    try:
+        unit = find_backend(file_path).progress_unit
+        total = os.path.getsize(file_path) if unit == 'bytes' else 0
+
+        loader.report(LoadProgress(0, total, unit))
+        for question in stream:
+            questions.append(question)
+            new_questions.append(question)
+            loader.check_cancelled()
+            if len(questions) == 1 or loader.due():
+                done = stats.bytes_read if unit == 'bytes' else stats.line_count
+                loader.report(LoadProgress(done, total, unit, len(questions)), new_questions)
+                new_questions = []
+        loader.check_cancelled()
+    finally:
+        stream.close()
+
+    done = stats.bytes_read if unit == 'bytes' else stats.line_count
+    loader.report(LoadProgress(done, total, unit, len(questions)), new_questions)
+    return questions
@@ -0,0 +1,208 @@
+import os
+import importlib
+
+# 内容嗅探读取的文件头字节数
+SNIFF_SIZE = 4096
+
+_ZIP_MAGIC = b'PK\x03\x04'
+_COMPILED_MAGIC = b'QBC\x00'
+_SQLITE_MAGIC = b'SQLite format 3\x00'
+
+
+class ParserBackend:
+    """
+    一种题库格式的解析后端
+
+    只保存描述信息和实现所在的位置（"模块:函数"），第一次解析该格式时才导入实现模块，
+    因此注册表本身不引入任何重量级依赖。
+
+    解析函数的调用方式为 parse(parser_service, file_path, stats)，返回逐个产出
+    Question 的可迭代对象。支持随机访问的格式另有打开函数 open(file_path)，
+    返回可按索引读取题目的存储，无需解析全部内容。
+    """
+
+    def __init__(self, name, extensions, target, streaming=True, parallel=False,
+                 random_access=False, progress_unit='bytes', sniff=None, description="",
+                 opener=None):
+        """
+        初始化解析后端
+
+        Args:
+            name (str): 后端名称
+            extensions (tuple): 对应的文件扩展名（小写，含点）
+            target (str): 解析函数位置，格式为 "模块:函数"
+            streaming (bool): 是否边读边产出题目
+            parallel (bool): 大文件是否可以分块多进程解析
+            random_access (bool): 是否支持不解析全部内容而直接按索引读取题目
+            progress_unit (str): 加载进度的计量单位：'bytes'、'paragraphs' 或 'rows'
+            sniff (callable): 根据文件头字节判断是否为该格式的函数，没有则为None
+            description (str): 格式说明
+            opener (str): 随机访问打开函数位置，格式为 "模块:函数"，random_access 为真时提供
+        """
+        self.name = name
+        self.extensions = tuple(extensions)
+        self.target = target
+        self.streaming = streaming
+        self.parallel = parallel
+        self.random_access = random_access
+        self.progress_unit = progress_unit
+        self.sniff = sniff
+        self.description = description
+        self.opener = opener
+        self._parse = None
+        self._open = None
+
+    def load(self):
+        """
+        导入并返回解析函数
+
+        Returns:
+            callable: 解析函数
+        """
+        if self._parse is None:
+            self._parse = _resolve(self.target)
+        return self._parse
+
+    def load_opener(self):
+        """
+        导入并返回随机访问打开函数
+
+        Returns:
+            callable: 打开函数，不支持随机访问时返回None
+        """
+        if self._open is None and self.opener:
+            self._open = _resolve(self.opener)
+        return self._open
+
+    def __repr__(self):
+        """返回后端的字符串表示"""
+        return f"ParserBackend({self.name!r}, {self.extensions!r})"
+
+
+def _resolve(target):
+    """按 "模块:函数" 导入函数"""
+    module_name, function_name = target.split(':')
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+_backends = []
+_by_extension = {}
+
+
+def register_backend(backend):
+    """
+    注册解析后端；扩展名已被注册时，新后端取代旧后端
+
+    Args:
+        backend (ParserBackend): 解析后端
+    """
+    _backends.append(backend)
+    for ext in backend.extensions:
+        _by_extension[ext] = backend
+
+
+def list_backends():
+    """
+    列出全部已注册的后端
+
+    Returns:
+        list: 按注册顺序排列的后端
+    """
+    return list(_backends)
+
+
+def supported_extensions():
+    """
+    列出支持的文件扩展名
+
+    Returns:
+        list: 扩展名列表，按注册顺序排列
+    """
+    return list(_by_extension)
+
+
+def backend_for_extension(file_path):
+    """
+    按扩展名查找后端
+
+    Args:
+        file_path (str): 文件路径
+
+    Returns:
+        ParserBackend: 后端，扩展名未注册时返回None
+    """
+    return _by_extension.get(os.path.splitext(file_path)[1].lower())
+
+
+def sniff_backend(file_path):
+    """
+    根据文件内容查找后端
+
+    Args:
+        file_path (str): 文件路径
+
+    Returns:
+        ParserBackend: 第一个识别出该内容的后端，都不识别时返回None
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(SNIFF_SIZE)
+    except OSError:
+        return None
+
+    for backend in _backends:
+        if backend.sniff and backend.sniff(head):
+            return backend
+    return None
+
+
+def find_backend(file_path):
+    """
+    查找文件对应的后端：先按扩展名，再按内容嗅探，最后按纯文本处理
+
+    Args:
+        file_path (str): 文件路径
+
+    Returns:
+        ParserBackend: 解析后端
+    """
+    return backend_for_extension(file_path) or sniff_backend(file_path) or _by_extension['.txt']
+
+
+def _sniff_docx(head):
+    """Word 文档是 zip 包"""
+    return head.startswith(_ZIP_MAGIC)
+
+
+def _sniff_compiled(head):
+    """编译题库以固定魔数开头"""
+    return head.startswith(_COMPILED_MAGIC)
+
+
+def _sniff_sqlite(head):
+    """SQLite 数据库文件头"""
+    return head.startswith(_SQLITE_MAGIC)
+
+
+register_backend(ParserBackend(
+    'docx', ('.docx',), 'services.parser_service:parse_docx_bank',
+    progress_unit='paragraphs', sniff=_sniff_docx, description="Word 文档"
+))
+register_backend(ParserBackend(
+    'txt', ('.txt',), 'services.parser_service:parse_text_bank',
+    parallel=True, description="纯文本"
+))
+register_backend(ParserBackend(
+    'csv', ('.csv',), 'services.parser_service:parse_csv_bank',
+    progress_unit='rows', description="CSV 表格"
+))
+register_backend(ParserBackend(
+    'compiled', ('.qbc',), 'services.compiled_bank:parse_compiled_bank',
+    random_access=True, progress_unit='rows', sniff=_sniff_compiled,
+    opener='services.compiled_bank:open_compiled_bank', description="编译题库"
+))
+register_backend(ParserBackend(
+    'sqlite', ('.qdb',), 'services.sqlite_bank:parse_sqlite_bank',
+    random_access=True, progress_unit='rows', sniff=_sniff_sqlite,
+    opener='services.sqlite_bank:open_sqlite_bank', description="SQLite 题库（带全文索引）"
+))
@@ -1,32 +1,167 @@
+import io
 import re
 import os
 import csv
-from docx import Document
+import time
+import codecs
+import logging
+from collections import deque
+from itertools import islice
 from models.question import Question
+from models.parse_stats import ParseStats
+from services.parser_registry import backend_for_extension, find_backend
 from utils.logger import get_logger
-from utils.text_utils import is_question_line, extract_answer_from_text
+from utils.encoding_utils import open_text_file
+from config.settings import PARALLEL_PARSE_MIN_MB, PARALLEL_CHUNK_MB
+from utils.text_utils import (
+    classify_line,
+    extract_answer_from_text,
+    LINE_QUESTION,
+    LINE_OPTION,
+    LINE_ANSWER,
+    LINE_EXPLANATION,
+    OPTION_PATTERN,
+    SEPARATE_ANSWER_PATTERNS
+)
+
+# 解析器版本，解析规则变化时递增，使已缓存的解析结果失效
+PARSER_VERSION = 3
+
+# 可以在行首安全切分的文本编码（换行符不会出现在多字节字符内部）
+_SPLITTABLE_ENCODINGS = ('utf-8', 'utf-8-sig', 'gbk', 'gb18030')
+
+# 文本文件每次读取的字节数，以及 Word 段落、CSV 行每批处理的行数；
+# 开头几批从较小的值逐步加倍，使第一道题尽快产出
+_READ_BLOCK_SIZE = 1024 * 1024
+_FIRST_READ_BLOCK_SIZE = 32 * 1024
+_LINE_BATCH_SIZE = 4096
+_FIRST_LINE_BATCH_SIZE = 128
+
+
+def _mid_file_encoding(encoding):
+    """
+    返回从文件中间某一行开始解码时使用的编码
+
+    BOM 只出现在文件开头，文件中间的 U+FEFF 应按普通字符保留。
+
+    Args:
+        encoding (str): 整个文件的编码
+
+    Returns:
+        str: 编码名称
+    """
+    return 'utf-8' if encoding == 'utf-8-sig' else encoding
+
+
+class AssemblyState:
+    """题目组装状态机在两段文本之间需要保留的状态"""
+
+    def __init__(self):
+        """初始化组装状态"""
+        self.current_q = None
+        self.pending_questions = []
+        self.has_empty_brackets = False
+
+
+def _parse_chunk_worker(file_path, start, end, encoding):
+    """
+    在工作进程中组装文本文件一个字节区间内的题目
+
+    Args:
+        file_path (str): 文件路径
+        start (int): 起始字节偏移（行首）
+        end (int): 结束字节偏移（不含）
+        encoding (str): 文本编码
+
+    Returns:
+        tuple: (组装完成的题目列表, 区间结束时的组装状态, 本区间的解析统计)
+    """
+    stats = ParseStats(file_path)
+    read_start = time.perf_counter()
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    stats.read_seconds += time.perf_counter() - read_start
+
+    if start > 0:
+        encoding = _mid_file_encoding(encoding)
+
+    state = AssemblyState()
+    parser = ParserService(parallel=False)
+    batches = parser._iter_text_batches(io.BytesIO(data), encoding, stats)
+    questions = list(parser._assemble_lines(batches, state, stats))
+    return questions, state, stats
+
+
+def parse_text_bank(parser, file_path, stats):
+    """
+    纯文本题库的解析后端
+
+    Args:
+        parser (ParserService): 解析服务
+        file_path (str): 文件路径
+        stats (ParseStats): 解析统计
+
+    Returns:
+        generator: 逐个产出题目的生成器
+    """
+    return parser._finalize_stream(parser._assemble_text_file(file_path, stats), stats)
+
+
+def parse_docx_bank(parser, file_path, stats):
+    """
+    Word 题库的解析后端
+
+    Args:
+        parser (ParserService): 解析服务
+        file_path (str): 文件路径
+        stats (ParseStats): 解析统计
+
+    Returns:
+        generator: 逐个产出题目的生成器
+    """
+    batches = parser._iter_line_batches(parser._iter_docx_lines(file_path), stats)
+    return parser._finalize_stream(parser._assemble_questions(batches, stats), stats)
+
+
+def parse_csv_bank(parser, file_path, stats):
+    """
+    CSV 题库的解析后端
+
+    Args:
+        parser (ParserService): 解析服务
+        file_path (str): 文件路径
+        stats (ParseStats): 解析统计
+
+    Returns:
+        generator: 逐个产出题目的生成器
+    """
+    return parser._iter_csv_questions(file_path, stats)
+
 
 class ParserService:
     """文档解析服务，负责从Word文档中解析题目"""
 
-    def __init__(self):
-        """初始化解析服务"""
+    def __init__(self, parallel=True):
+        """
+        初始化解析服务
+
+        Args:
+            parallel (bool): 大文本文件是否允许分块多进程解析
+        """
         self.logger = get_logger()
+        self.parallel = parallel
 
         # 定义各种正则表达式模式
-        self.option_pattern = re.compile(r'^([A-D])[\.、:：]?\s*(.*)$')
+        self.option_pattern = OPTION_PATTERN
         self.answer_pattern = re.compile(r'[（(]\s*([A-Da-d])\s*[）)]')
         self.empty_brackets_pattern = re.compile(r'[（(]\s*[）)]')
         self.question_num_pattern = re.compile(r'^\d+[\.、]|^第\d+题|^\d+、')
+        self.pending_number_pattern = re.compile(r'^\d+[\.、]|^第(\d+)题')
+        self.csv_answer_pattern = re.compile(r'[A-D]')
 
         # 多种独立答案行格式
-        self.separate_answer_patterns = [
-            re.compile(r'^答案[：:]\s*([A-Da-d])', re.IGNORECASE),
-            re.compile(r'^答案[是为]?\s*([A-Da-d])', re.IGNORECASE),
-            re.compile(r'^\s*([A-Da-d])\s*$', re.IGNORECASE),
-            re.compile(r'^[（(]?\s*([A-Da-d])\s*[）)]?$', re.IGNORECASE),
-            re.compile(r'.*[（(]\s*([A-Da-d])\s*[）)].*')
-        ]
+        self.separate_answer_patterns = SEPARATE_ANSWER_PATTERNS
 
     def parse_document(self, file_path):
         """
@@ -49,352 +184,654 @@ class ParserService:
             self.logger.error(f"文件不存在: {file_path}")
             raise FileNotFoundError(f"文件不存在: {file_path}")
 
-        # 根据文件扩展名选择解析方法
-        file_ext = os.path.splitext(file_path)[1].lower()
+        if backend_for_extension(file_path):
+            return list(self.iter_questions(file_path))
 
-        if file_ext == '.docx':
-            return self._parse_docx(file_path)
-        elif file_ext == '.txt':
-            return self._parse_txt(file_path)
-        elif file_ext == '.csv':
-            return self._parse_csv(file_path)
-        else:
-            # 尝试作为文本文件解析
-            try:
-                return self._parse_txt(file_path)
-            except Exception as e:
-                self.logger.error(f"无法解析文件: {str(e)}")
-                raise ValueError(f"不支持的文件格式: {file_ext}")
+        # 未注册的扩展名：按内容识别格式，无法识别时作为文本文件解析
+        try:
+            return list(self.iter_questions(file_path))
+        except Exception as e:
+            self.logger.error(f"无法解析文件: {str(e)}")
+            raise ValueError(f"不支持的文件格式: {os.path.splitext(file_path)[1].lower()}")
 
-    def _parse_docx(self, file_path):
+    def iter_questions(self, file_path, stats=None):
         """
-        解析Word文档
+        流式解析文档，每道题目解析完成后立即产出
+
+        解析后端由 parser_registry 按扩展名或文件内容选择。TXT 和 DOCX 共用同一个
+        按行驱动的解析引擎，内存中只保留当前题目和少量待定题目，不会一次性读入整个文件。
+        各阶段耗时记录在本次调用的 stats 中，生成器耗尽后统计完整。同一个解析服务上的
+        多次解析（如被取消的后台加载和新的加载）互不影响。
 
         Args:
             file_path (str): 文档路径
+            stats (ParseStats): 记录本次解析统计的对象，默认新建
 
         Returns:
-            list: 题目对象列表
+            generator: 逐个产出题目对象的生成器
+
+        Raises:
+            FileNotFoundError: 文件不存在
         """
-        try:
-            doc = Document(file_path)
-        except Exception as e:
-            self.logger.error(f"打开Word文档失败: {str(e)}")
-            raise ValueError(f"打开Word文档失败: {str(e)}")
+        if not os.path.exists(file_path):
+            self.logger.error(f"文件不存在: {file_path}")
+            raise FileNotFoundError(f"文件不存在: {file_path}")
+
+        if stats is None:
+            stats = ParseStats(file_path)
 
-        questions = []
-        current_q = None
-        pending_questions = []
-        has_empty_brackets = False
+        # 根据扩展名或文件内容选择解析后端
+        backend = find_backend(file_path)
+        self.logger.debug("使用解析后端: %s", backend.name)
+        questions = backend.load()(self, file_path, stats)
 
-        # 解析文档段落
-        for i, para in enumerate(doc.paragraphs):
-            text = para.text.strip()
-            if not text:
+        return self._tag_source(questions, file_path)
+
+    def _assemble_text_file(self, file_path, stats):
+        """
+        组装文本文件中的题目，大文件在多个进程中分块组装
+
+        Args:
+            file_path (str): 文件路径
+            stats (ParseStats): 解析统计
+
+        Yields:
+            Question: 组装完成的题目对象（尚未做最终处理）
+        """
+        stream, encoding = self._open_text_file(file_path)
+        workers = os.cpu_count() or 1
+        size = os.path.getsize(file_path)
+
+        with stream:
+            if (not self.parallel or workers < 2 or encoding not in _SPLITTABLE_ENCODINGS or
+                    size < PARALLEL_PARSE_MIN_MB * 1024 * 1024):
+                batches = self._iter_text_batches(stream.buffer, encoding, stats)
+                yield from self._assemble_questions(batches, stats)
+                return
+
+        chunk_size = max(PARALLEL_CHUNK_MB * 1024 * 1024, size // (workers * 4))
+        split_start = time.perf_counter()
+        boundaries = self._find_chunk_boundaries(file_path, encoding, chunk_size)
+        stats.read_seconds += time.perf_counter() - split_start
+        self.logger.info(f"分块并行解析: {len(boundaries) - 1} 块, {workers} 个进程")
+        yield from self._assemble_chunks(file_path, encoding, boundaries, workers, stats)
+
+    def _find_chunk_boundaries(self, file_path, encoding, chunk_size):
+        """
+        在题目行的行首切分文件
+
+        Args:
+            file_path (str): 文件路径
+            encoding (str): 文本编码
+            chunk_size (int): 目标块大小（字节）
+
+        Returns:
+            list: 升序的字节偏移，首项为0，末项为文件大小
+        """
+        size = os.path.getsize(file_path)
+        encoding = _mid_file_encoding(encoding)
+        boundaries = [0]
+        with open(file_path, 'rb') as f:
+            target = chunk_size
+            while target < size:
+                offset = self._next_question_offset(f, target, encoding)
+                if offset is None:
+                    break
+                boundaries.append(offset)
+                target = offset + chunk_size
+        boundaries.append(size)
+        return boundaries
+
+    def _next_question_offset(self, f, offset, encoding):
+        """
+        从指定偏移之后查找下一个题目行的行首
+
+        Args:
+            f: 以二进制模式打开的文件
+            offset (int): 起始查找偏移
+            encoding (str): 文本编码
+
+        Returns:
+            int: 题目行行首的字节偏移，找不到时返回None
+        """
+        f.seek(offset)
+        f.readline()  # 跳过可能不完整的当前行
+        while True:
+            position = f.tell()
+            line = f.readline()
+            if not line:
+                return None
+
+            # 通用换行模式下，单独的 \r 也会结束一行
+            head = line.rstrip(b'\n').split(b'\r', 1)[0]
+            try:
+                text = head.decode(encoding).strip()
+            except UnicodeDecodeError:
                 continue
+            if text and classify_line(text)[0] == LINE_QUESTION:
+                return position
 
-            # 题目识别逻辑
-            if is_question_line(text, None):
-                self.logger.debug(f"[行 {i}] 识别为题目: {text[:50]}...")
-
-                if current_q and current_q.text:
-                    questions.append(current_q)
-                    self.logger.debug(f"添加上一题: {current_q.text[:30]}..., 答案: {current_q.answer}")
-
-                current_q = Question(text=text)
-
-                # 检查题目行中是否包含答案或空括号
-                match = self.answer_pattern.search(text)
-                brackets_match = self.empty_brackets_pattern.search(text)
-
-                if match:
-                    current_q.answer = match.group(1).upper()
-                    self.logger.debug(f"在题目中找到答案: {match.group(1).upper()}")
-                    has_empty_brackets = False
-                elif brackets_match:
-                    self.logger.debug(f"题目包含空括号，等待后续内容中找答案")
-                    has_empty_brackets = True
-                else:
-                    self.logger.debug(f"在题目中未找到答案或空括号")
-                    has_empty_brackets = False
-
-            elif self.option_pattern.match(text):
-                match = self.option_pattern.match(text)
-                option_text = f"{match.group(1)}. {match.group(2).strip()}"
-                if current_q:
-                    current_q.options.append(option_text)
-                    self.logger.debug(f"[行 {i}] 识别为选项: {option_text}")
-
-            # 处理答案和解析
-            elif current_q:
-                # 检查是否是答案行
-                is_answer_line = self._process_answer_line(text, current_q, has_empty_brackets, i)
-
-                if is_answer_line:
-                    continue
+    def _assemble_chunks(self, file_path, encoding, boundaries, workers, stats):
+        """
+        在进程池中组装各块题目，并按顺序拼接块之间的状态
 
-                # 检查是否是解析行
-                if re.match(r'^解析[:：]', text):
-                    current_q.explanation = re.sub(r'^解析[:：]\s*', '', text).strip()
-                    self.logger.debug(f"[行 {i}] 识别为解析: {text[:50]}...")
-                    continue
+        每块（除第一块外）都从题目行开始，因此上一块留下的未完成题目在此处结束，
+        待处理题目按块顺序累积，最后统一处理，结果与串行解析一致。
 
-                # 处理题目延续或新题目
-                if not current_q.options and not current_q.explanation:
-                    # 检查是否可能是下一题的题目被误认为是上一题的内容
-                    if self.question_num_pattern.search(text):
-                        self.logger.debug(f"[行 {i}] 可能是新题目，但格式未被识别: {text[:50]}...")
+        Args:
+            file_path (str): 文件路径
+            encoding (str): 文本编码
+            boundaries (list): 块边界的字节偏移
+            workers (int): 工作进程数
+            stats (ParseStats): 解析统计，累加各块的统计
 
-                        # 保存当前题目，如果它没有答案，加入待处理列表
-                        if not current_q.answer:
-                            self.logger.debug(f"上一题没有答案，加入待处理队列: {current_q.text[:30]}...")
-                            pending_questions.append(current_q)
-                        else:
-                            questions.append(current_q)
+        Yields:
+            Question: 组装完成的题目对象（尚未做最终处理）
+        """
+        # 进程池只在解析大文件时才需要，按需导入以缩短程序启动时间
+        from concurrent.futures import ProcessPoolExecutor
 
-                        # 创建新题目
-                        current_q = Question(text=text)
+        state = AssemblyState()
+        ranges = deque(zip(boundaries, boundaries[1:]))
+        futures = deque()
 
-                        # 检查题目行中是否包含答案或空括号
-                        match = self.answer_pattern.search(text)
-                        brackets_match = self.empty_brackets_pattern.search(text)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            try:
+                while ranges or futures:
+                    # 最多预先提交两倍进程数的块，限制内存中的结果数量
+                    while ranges and len(futures) < workers * 2:
+                        start, end = ranges.popleft()
+                        futures.append(executor.submit(_parse_chunk_worker, file_path, start, end, encoding))
+
+                    questions, chunk_state, chunk_stats = futures.popleft().result()
+                    stats.merge(chunk_stats)
+                    if questions or chunk_state.current_q:
+                        if state.current_q and state.current_q.text:
+                            yield state.current_q
+                        state.current_q = chunk_state.current_q
+                        state.has_empty_brackets = chunk_state.has_empty_brackets
+                    yield from questions
+                    state.pending_questions.extend(chunk_state.pending_questions)
+            finally:
+                for future in futures:
+                    future.cancel()
+
+        yield from self._finish_assembly(state, stats)
+
+    def _tag_source(self, questions, file_path):
+        """
+        为题目记录来源文件，已有来源的题目（如来自编译题库）保持不变
 
-                        if match:
-                            current_q.answer = match.group(1).upper()
-                            has_empty_brackets = False
-                        elif brackets_match:
-                            has_empty_brackets = True
-                        else:
-                            has_empty_brackets = False
-                    else:
-                        # 作为题目延续添加
-                        current_q.text += '\n' + text
-                        self.logger.debug(f"[行 {i}] 添加到题目文本: {text[:50]}...")
+        Args:
+            questions (iterable): 题目对象
+            file_path (str): 来源文件路径
 
-        # 处理最后一个题目
-        if current_q:
-            if current_q.answer:
-                questions.append(current_q)
-                self.logger.debug(f"添加最后一题: {current_q.text[:30]}..., 答案: {current_q.answer}")
-            elif pending_questions:
-                # 如果最后一题没有答案，查看是否有待处理题目也没答案
-                self.logger.debug(f"最后一题没有答案，检查是否可以从待处理题目中找到匹配")
-                pending_questions.append(current_q)
+        Yields:
+            Question: 已记录来源的题目对象
+        """
+        for question in questions:
+            if not question.source_file:
+                question.source_file = file_path
+            yield question
 
-                # 尝试处理没有答案的题目
-                for q in pending_questions:
-                    # 如果该题包含明显的题号，尝试解析
-                    match = re.search(r'^\d+[\.、]|^第(\d+)题', q.text)
-                    if match:
-                        self.logger.debug(f"处理待定题目: {q.text[:50]}...")
+    def _iter_docx_lines(self, file_path):
+        """
+        逐段产出Word文档的段落文本
 
-                        # 如果题目有空括号但没答案，尝试从相邻题目中查找答案
-                        if self.empty_brackets_pattern.search(q.text) and not q.answer:
-                            self._try_find_answer_from_neighbors(q, pending_questions)
+        优先流式读取 word/document.xml；lxml 不可用或包结构无法识别时，
+        回退到 python-docx 加载完整文档。
 
-                    # 无论如何，添加到问题列表
-                    questions.append(q)
-            else:
-                questions.append(current_q)
+        Args:
+            file_path (str): 文档路径
+
+        Yields:
+            str: 段落文本
+        """
+        # Word 文档的读取依赖 zipfile 和 lxml，首次解析 docx 时才导入
+        from services.docx_reader import open_docx_paragraphs
+
+        try:
+            paragraphs = open_docx_paragraphs(file_path)
+        except Exception as e:
+            self.logger.warning(f"无法流式读取Word文档，改用python-docx: {str(e)}")
+            yield from self._iter_docx_lines_fallback(file_path)
+            return
+
+        try:
+            yield from paragraphs
+        except Exception as e:
+            self.logger.error(f"读取Word文档失败: {str(e)}")
+            raise ValueError(f"读取Word文档失败: {str(e)}")
+
+    def _iter_docx_lines_fallback(self, file_path):
+        """
+        使用 python-docx 逐段产出Word文档的段落文本
+
+        Args:
+            file_path (str): 文档路径
 
-        # 清理 pending_questions，确保所有题目都被添加
-        for q in pending_questions:
-            if q not in questions:
-                questions.append(q)
-                self.logger.debug(f"添加待处理题目: {q.text[:30]}...")
+        Yields:
+            str: 段落文本
+        """
+        try:
+            from docx import Document
+            doc = Document(file_path)
+        except Exception as e:
+            self.logger.error(f"打开Word文档失败: {str(e)}")
+            raise ValueError(f"打开Word文档失败: {str(e)}")
 
-        # 最终处理：确保所有题目都有答案
-        self._finalize_questions(questions)
-        self.logger.info(f"解析完成，共解析 {len(questions)} 道题目")
-        return questions
+        for para in doc.paragraphs:
+            yield para.text
 
-    def _parse_txt(self, file_path):
+    def _open_text_file(self, file_path, newline=None):
         """
-        解析文本文件
+        打开文本文件并检测编码
 
         Args:
             file_path (str): 文件路径
+            newline: 换行模式，CSV 需传入 ''
 
         Returns:
-            list: 题目对象列表
+            tuple: (在同一文件句柄上增量解码的文本流 TextIOWrapper, 编码名称)
+
+        Raises:
+            ValueError: 文件无法打开
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        except UnicodeDecodeError:
-            # 尝试其他编码
-            try:
-                with open(file_path, 'r', encoding='gbk') as f:
-                    lines = f.readlines()
-            except Exception as e:
-                self.logger.error(f"打开文本文件失败: {str(e)}")
-                raise ValueError(f"打开文本文件失败: {str(e)}")
+            stream, encoding = open_text_file(file_path, newline=newline)
         except Exception as e:
             self.logger.error(f"打开文本文件失败: {str(e)}")
             raise ValueError(f"打开文本文件失败: {str(e)}")
 
-        questions = []
-        current_q = None
-        pending_questions = []
-        has_empty_brackets = False
+        self.logger.info(f"检测到文件编码: {encoding}")
+        return stream, encoding
 
-        # 解析文本行
-        for i, line in enumerate(lines):
-            text = line.strip()
-            if not text:
-                continue
+    def _iter_text_batches(self, raw, encoding, stats):
+        """
+        按块读取并解码文本，逐批产出文本行
 
-            # 题目识别逻辑
-            if is_question_line(text, None):
-                self.logger.debug(f"[行 {i}] 识别为题目: {text[:50]}...")
-
-                if current_q and current_q.text:
-                    questions.append(current_q)
-                    self.logger.debug(f"添加上一题: {current_q.text[:30]}..., 答案: {current_q.answer}")
-
-                current_q = Question(text=text)
-
-                # 检查题目行中是否包含答案或空括号
-                match = self.answer_pattern.search(text)
-                brackets_match = self.empty_brackets_pattern.search(text)
-
-                if match:
-                    current_q.answer = match.group(1).upper()
-                    self.logger.debug(f"在题目中找到答案: {match.group(1).upper()}")
-                    has_empty_brackets = False
-                elif brackets_match:
-                    self.logger.debug(f"题目包含空括号，等待后续内容中找答案")
-                    has_empty_brackets = True
-                else:
-                    self.logger.debug(f"在题目中未找到答案或空括号")
-                    has_empty_brackets = False
-
-            elif self.option_pattern.match(text):
-                match = self.option_pattern.match(text)
-                option_text = f"{match.group(1)}. {match.group(2).strip()}"
-                if current_q:
-                    current_q.options.append(option_text)
-                    self.logger.debug(f"[行 {i}] 识别为选项: {option_text}")
-
-            # 处理答案和解析
-            elif current_q:
-                # 检查是否是答案行
-                is_answer_line = self._process_answer_line(text, current_q, has_empty_brackets, i)
-
-                if is_answer_line:
-                    continue
+        每次读取一大块字节后增量解码，换行符处理与文本模式打开文件相同
+        （\r\n 和单独的 \r 都视为换行），读取和解码的耗时分别计入统计。
+
+        Args:
+            raw: 以二进制模式打开的文件对象
+            encoding (str): 文本编码
+            stats (ParseStats): 解析统计
+
+        Yields:
+            list: 一批文本行（不含换行符）
+        """
+        decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(), translate=True)
+        perf_counter = time.perf_counter
+        block_size = _FIRST_READ_BLOCK_SIZE
+        tail = ''
+
+        try:
+            while True:
+                read_start = perf_counter()
+                block = raw.read(block_size)
+                block_size = min(block_size * 2, _READ_BLOCK_SIZE)
+                decode_start = perf_counter()
+                lines = (tail + decoder.decode(block, final=not block)).split('\n')
+                tail = lines.pop()  # 最后一行可能不完整，留到下一块
+                stats.read_seconds += decode_start - read_start
+                stats.decode_seconds += perf_counter() - decode_start
+                stats.bytes_read += len(block)
+
+                if lines:
+                    yield lines
+                if not block:
+                    break
+        except UnicodeDecodeError as e:
+            self.logger.error(f"读取文本文件失败，内容与检测到的编码 {encoding} 不一致: {str(e)}")
+            raise ValueError(f"读取文本文件失败，内容与检测到的编码 {encoding} 不一致: {str(e)}")
+
+        if tail:
+            yield [tail]
+
+    def _iter_line_batches(self, lines, stats):
+        """
+        把逐行产出的文本分批，取行的耗时计入读取阶段
+
+        Args:
+            lines (iterable): 文本行
+            stats (ParseStats): 解析统计
+
+        Yields:
+            list: 一批文本行
+        """
+        lines = iter(lines)
+        perf_counter = time.perf_counter
+        batch_size = _FIRST_LINE_BATCH_SIZE
+        while True:
+            read_start = perf_counter()
+            batch = list(islice(lines, batch_size))
+            batch_size = min(batch_size * 2, _LINE_BATCH_SIZE)
+            stats.read_seconds += perf_counter() - read_start
+            if not batch:
+                return
+            yield batch
+
+    def _assemble_questions(self, batches, stats):
+        """
+        按行驱动的题目组装状态机
+
+        Args:
+            batches (iterable): 逐批产出的原始文本行
+            stats (ParseStats): 解析统计
+
+        Yields:
+            Question: 组装完成的题目对象（尚未做最终处理）
+        """
+        state = AssemblyState()
+        yield from self._assemble_lines(batches, state, stats)
+        yield from self._finish_assembly(state, stats)
+
+    def _assemble_lines(self, batches, state, stats):
+        """
+        组装一段文本行中的题目，结束时把未完成的题目留在状态中
+
+        每批文本行先整体识别行类型，再逐行组装，两步的耗时分别计入统计；
+        一批处理完后再产出其中完成的题目。
+
+        Args:
+            batches (iterable): 逐批产出的原始文本行
+            state (AssemblyState): 组装状态，处理后原地更新
+            stats (ParseStats): 解析统计
 
-                # 检查是否是解析行
-                if re.match(r'^解析[:：]', text):
-                    current_q.explanation = re.sub(r'^解析[:：]\s*', '', text).strip()
-                    self.logger.debug(f"[行 {i}] 识别为解析: {text[:50]}...")
+        Yields:
+            Question: 组装完成的题目对象
+        """
+        current_q = state.current_q
+        pending_questions = state.pending_questions
+        has_empty_brackets = state.has_empty_brackets
+
+        # 只在需要时格式化调试日志，避免逐行的切片和字符串拼接
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        log_debug = self.logger.debug
+        perf_counter = time.perf_counter
+        line_base = 0
+
+        for batch in batches:
+            classify_start = perf_counter()
+            texts = [line.strip() for line in batch]
+            kinds = [classify_line(text) if text else None for text in texts]
+            assemble_start = perf_counter()
+            ready = []
+
+            # 解析文本行
+            for i, (text, classified) in enumerate(zip(texts, kinds), line_base):
+                if classified is None:
                     continue
 
-                # 处理题目延续或新题目
-                if not current_q.options and not current_q.explanation:
-                    # 检查是否可能是下一题的题目被误认为是上一题的内容
-                    if self.question_num_pattern.search(text):
-                        self.logger.debug(f"[行 {i}] 可能是新题目，但格式未被识别: {text[:50]}...")
+                kind, value = classified
 
-                        # 保存当前题目，如果它没有答案，加入待处理列表
-                        if not current_q.answer:
-                            self.logger.debug(f"上一题没有答案，加入待处理队列: {current_q.text[:30]}...")
-                            pending_questions.append(current_q)
-                        else:
-                            questions.append(current_q)
+                # 题目识别逻辑
+                if kind == LINE_QUESTION:
+                    if debug:
+                        log_debug("[行 %d] 识别为题目: %s...", i, text[:50])
 
-                        # 创建新题目
-                        current_q = Question(text=text)
+                    if current_q and current_q.text:
+                        ready.append(current_q)
+                        if debug:
+                            log_debug("添加上一题: %s..., 答案: %s", current_q.text[:30], current_q.answer)
 
-                        # 检查题目行中是否包含答案或空括号
-                        match = self.answer_pattern.search(text)
-                        brackets_match = self.empty_brackets_pattern.search(text)
+                    current_q = Question(text=text)
 
-                        if match:
-                            current_q.answer = match.group(1).upper()
-                            has_empty_brackets = False
-                        elif brackets_match:
-                            has_empty_brackets = True
-                        else:
-                            has_empty_brackets = False
+                    # 检查题目行中是否包含答案或空括号
+                    match = self.answer_pattern.search(text)
+                    brackets_match = self.empty_brackets_pattern.search(text)
+
+                    if match:
+                        current_q.answer = match.group(1).upper()
+                        if debug:
+                            log_debug("在题目中找到答案: %s", current_q.answer)
+                        has_empty_brackets = False
+                    elif brackets_match:
+                        if debug:
+                            log_debug("题目包含空括号，等待后续内容中找答案")
+                        has_empty_brackets = True
                     else:
-                        # 作为题目延续添加
-                        current_q.text += '\n' + text
-                        self.logger.debug(f"[行 {i}] 添加到题目文本: {text[:50]}...")
+                        if debug:
+                            log_debug("在题目中未找到答案或空括号")
+                        has_empty_brackets = False
+
+                elif kind == LINE_OPTION:
+                    if current_q:
+                        current_q.add_option(value)
+                        if debug:
+                            log_debug("[行 %d] 识别为选项: %s", i, value)
+
+                # 处理答案和解析
+                elif current_q:
+                    # 检查是否是答案行
+                    if kind == LINE_ANSWER:
+                        self._process_answer_line(text, value, current_q, has_empty_brackets, i)
+                        continue
+
+                    # 检查是否是解析行
+                    if kind == LINE_EXPLANATION:
+                        current_q.explanation = value
+                        if debug:
+                            log_debug("[行 %d] 识别为解析: %s...", i, text[:50])
+                        continue
+
+                    # 处理题目延续或新题目
+                    if not current_q.options and not current_q.explanation:
+                        # 检查是否可能是下一题的题目被误认为是上一题的内容
+                        if self.question_num_pattern.search(text):
+                            if debug:
+                                log_debug("[行 %d] 可能是新题目，但格式未被识别: %s...", i, text[:50])
+
+                            # 保存当前题目，如果它没有答案，加入待处理列表
+                            if not current_q.answer:
+                                if debug:
+                                    log_debug("上一题没有答案，加入待处理队列: %s...", current_q.text[:30])
+                                pending_questions.append(current_q)
+                            else:
+                                ready.append(current_q)
+
+                            # 创建新题目
+                            current_q = Question(text=text)
+
+                            # 检查题目行中是否包含答案或空括号
+                            match = self.answer_pattern.search(text)
+                            brackets_match = self.empty_brackets_pattern.search(text)
+
+                            if match:
+                                current_q.answer = match.group(1).upper()
+                                has_empty_brackets = False
+                            elif brackets_match:
+                                has_empty_brackets = True
+                            else:
+                                has_empty_brackets = False
+                        else:
+                            # 作为题目延续添加
+                            current_q.text += '\n' + text
+                            if debug:
+                                log_debug("[行 %d] 添加到题目文本: %s...", i, text[:50])
+
+            line_base += len(batch)
+            stats.line_count += len(batch)
+            stats.classify_seconds += assemble_start - classify_start
+            stats.assemble_seconds += perf_counter() - assemble_start
+            yield from ready
+
+        state.current_q = current_q
+        state.has_empty_brackets = has_empty_brackets
+
+    def _finish_assembly(self, state, stats):
+        """
+        处理最后一个题目和待处理题目
+
+        Args:
+            state (AssemblyState): 全部文本行处理完后的组装状态
+            stats (ParseStats): 解析统计
+
+        Yields:
+            Question: 剩余的题目对象
+        """
+        assemble_start = time.perf_counter()
+        current_q = state.current_q
+        pending_questions = state.pending_questions
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        remaining = []
 
         # 处理最后一个题目
+        reconciled = []
+        removed = set()
         if current_q:
             if current_q.answer:
-                questions.append(current_q)
-                self.logger.debug(f"添加最后一题: {current_q.text[:30]}..., 答案: {current_q.answer}")
+                remaining.append(current_q)
+                if debug:
+                    self.logger.debug("添加最后一题: %s..., 答案: %s", current_q.text[:30], current_q.answer)
             elif pending_questions:
                 # 如果最后一题没有答案，查看是否有待处理题目也没答案
-                self.logger.debug(f"最后一题没有答案，检查是否可以从待处理题目中找到匹配")
+                self.logger.debug("最后一题没有答案，检查是否可以从待处理题目中找到匹配")
                 pending_questions.append(current_q)
+                reconciled, removed = self._reconcile_pending(pending_questions)
+            else:
+                remaining.append(current_q)
 
-                # 尝试处理没有答案的题目
-                for q in pending_questions:
-                    # 如果该题包含明显的题号，尝试解析
-                    match = re.search(r'^\d+[\.、]|^第(\d+)题', q.text)
-                    if match:
-                        self.logger.debug(f"处理待定题目: {q.text[:50]}...")
+        # 清理 pending_questions，确保所有题目都被添加（按对象身份去重）
+        reconciled_ids = {id(q) for q in reconciled}
+        for index, q in enumerate(pending_questions):
+            if index not in removed and id(q) not in reconciled_ids:
+                reconciled.append(q)
+                if debug:
+                    self.logger.debug("添加待处理题目: %s...", q.text[:30])
 
-                        # 如果题目有空括号但没答案，尝试从相邻题目中查找答案
-                        if self.empty_brackets_pattern.search(q.text) and not q.answer:
-                            self._try_find_answer_from_neighbors(q, pending_questions)
+        remaining.extend(reconciled)
+        stats.assemble_seconds += time.perf_counter() - assemble_start
+        yield from remaining
 
-                    # 无论如何，添加到问题列表
-                    questions.append(q)
-            else:
-                questions.append(current_q)
+    def _reconcile_pending(self, pending_questions):
+        """
+        逐个处理待定题目，尝试为有空括号的题目从单字母题目中找答案
+
+        被用作答案的题目视为从待处理列表中删除：位于当前题目之后的不再处理；
+        位于当前题目之前的会使紧随其后的一道题目被跳过，留给最后的清理步骤。
+        这与在遍历列表时直接删除元素的行为一致，但不修改列表，整体为线性时间。
+
+        Args:
+            pending_questions (list): 待处理题目列表
+
+        Returns:
+            tuple: (按处理顺序排列的题目列表, 被用作答案的题目索引集合)
+        """
+        candidates = deque(
+            index for index, q in enumerate(pending_questions)
+            if len(q.text) == 1 and q.text.upper() in "ABCD"
+        )
+        reconciled = []
+        removed = set()
+        skip_next = False
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        for index, q in enumerate(pending_questions):
+            if index in removed:
+                continue
+            if skip_next:
+                skip_next = False
+                continue
 
-        # 清理 pending_questions，确保所有题目都被添加
-        for q in pending_questions:
-            if q not in questions:
-                questions.append(q)
-                self.logger.debug(f"添加待处理题目: {q.text[:30]}...")
+            # 如果该题包含明显的题号，尝试解析
+            if self.pending_number_pattern.search(q.text):
+                if debug:
+                    self.logger.debug("处理待定题目: %s...", q.text[:50])
 
-        # 最终处理：确保所有题目都有答案
-        self._finalize_questions(questions)
-        self.logger.info(f"解析完成，共解析 {len(questions)} 道题目")
-        return questions
+                # 如果题目有空括号但没答案，尝试从相邻题目中查找答案
+                if self.empty_brackets_pattern.search(q.text) and not q.answer:
+                    taken = self._try_find_answer_from_neighbors(q, pending_questions, candidates)
+                    if taken is not None:
+                        removed.add(taken)
+                        skip_next = taken < index
 
-    def _parse_csv(self, file_path):
+            # 无论如何，添加到问题列表
+            reconciled.append(q)
+
+        return reconciled, removed
+
+    def _iter_csv_questions(self, file_path, stats):
         """
-        解析CSV文件
+        流式解析CSV文件，逐批产出题目
+
+        表头只解析一次，得到固定的列映射；数据行按批读取转换，不在内存中保留整个文件。
+        CSV 读取器内部完成解码，读取和解码的耗时合并计入读取阶段。
 
         Args:
             file_path (str): 文件路径
+            stats (ParseStats): 解析统计
 
-        Returns:
-            list: 题目对象列表
+        Yields:
+            Question: 题目对象
+
+        Raises:
+            ValueError: 文件无法打开或格式错误
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-        except UnicodeDecodeError:
-            # 尝试其他编码
+        perf_counter = time.perf_counter
+        row_count = 0
+        count = 0
+
+        stream, _ = self._open_text_file(file_path, newline='')
+        with stream as f:
+            reader = csv.reader(f)
             try:
-                with open(file_path, 'r', encoding='gbk') as f:
-                    reader = csv.reader(f)
-                    rows = list(reader)
-            except Exception as e:
+                headers = next(reader, None)
+                if headers is None:
+                    self.logger.error("CSV文件格式错误: 行数不足")
+                    raise ValueError("CSV文件格式错误: 行数不足")
+
+                question_col, option_cols, answer_col, explanation_col = self._resolve_csv_columns(headers)
+
+                # 解析每一行数据
+                batch_size = _FIRST_LINE_BATCH_SIZE
+                while True:
+                    read_start = perf_counter()
+                    rows = list(islice(reader, batch_size))
+                    batch_size = min(batch_size * 2, _LINE_BATCH_SIZE)
+                    assemble_start = perf_counter()
+                    if not rows:
+                        stats.read_seconds += assemble_start - read_start
+                        break
+
+                    ready = []
+                    for row in rows:
+                        question = self._csv_row_to_question(
+                            row, question_col, option_cols, answer_col, explanation_col
+                        )
+                        if question is not None:
+                            ready.append(question)
+
+                    row_count += len(rows)
+                    stats.line_count = row_count + 1
+                    stats.read_seconds += assemble_start - read_start
+                    stats.assemble_seconds += perf_counter() - assemble_start
+                    count += len(ready)
+                    yield from ready
+            except (csv.Error, UnicodeDecodeError) as e:
                 self.logger.error(f"打开CSV文件失败: {str(e)}")
                 raise ValueError(f"打开CSV文件失败: {str(e)}")
-        except Exception as e:
-            self.logger.error(f"打开CSV文件失败: {str(e)}")
-            raise ValueError(f"打开CSV文件失败: {str(e)}")
 
-        questions = []
-
-        # 检查CSV文件格式
-        if len(rows) < 2:  # 至少需要标题行和一行数据
+        # 至少需要标题行和一行数据
+        if row_count == 0:
             self.logger.error("CSV文件格式错误: 行数不足")
             raise ValueError("CSV文件格式错误: 行数不足")
 
-        # 尝试识别列
-        headers = rows[0]
+        stats.finish(count)
+        self.logger.info(f"解析完成，共解析 {count} 道题目")
+        self.logger.info(stats.summary())
+
+    def _resolve_csv_columns(self, headers):
+        """
+        根据表头识别各字段所在的列
+
+        Args:
+            headers (list): 表头单元格
+
+        Returns:
+            tuple: (题目列, [(选项列, 选项字母)], 答案列, 解析列)，未识别的列为 -1
+        """
         question_col = -1
         options_cols = []
         answer_col = -1
@@ -423,138 +860,179 @@ class ParserService:
         if question_col == -1:
             question_col = 0
 
-        # 解析每一行数据
-        for i, row in enumerate(rows[1:], 1):  # 跳过标题行
-            if len(row) <= question_col:
-                continue  # 跳过格式不正确的行
+        # 选项字母按选项列出现的顺序分配：A, B, C, D...
+        option_cols = [(col, chr(65 + i)) for i, col in enumerate(options_cols)]
+        return question_col, option_cols, answer_col, explanation_col
 
-            question_text = row[question_col].strip()
-            if not question_text:
-                continue  # 跳过空题目
-
-            # 创建题目对象
-            question = Question(text=question_text)
+    def _csv_row_to_question(self, row, question_col, option_cols, answer_col, explanation_col):
+        """
+        把一行CSV数据转换为题目
 
-            # 添加选项
-            for col in options_cols:
-                if col < len(row) and row[col].strip():
-                    option_letter = chr(65 + options_cols.index(col))  # A, B, C, D...
-                    option_text = f"{option_letter}. {row[col].strip()}"
-                    question.options.append(option_text)
+        Args:
+            row (list): 单元格列表
+            question_col (int): 题目列
+            option_cols (list): [(选项列, 选项字母)]
+            answer_col (int): 答案列，-1 表示没有
+            explanation_col (int): 解析列，-1 表示没有
 
-            # 添加答案
-            if answer_col != -1 and answer_col < len(row) and row[answer_col].strip():
-                answer = row[answer_col].strip().upper()
+        Returns:
+            Question: 题目对象，格式不正确或题目为空时返回None
+        """
+        row_len = len(row)
+        if row_len <= question_col:
+            return None  # 跳过格式不正确的行
+
+        question_text = row[question_col].strip()
+        if not question_text:
+            return None  # 跳过空题目
+
+        # 创建题目对象
+        question = Question(text=question_text)
+
+        # 添加选项
+        options = []
+        for col, letter in option_cols:
+            if col < row_len:
+                cell = row[col].strip()
+                if cell:
+                    options.append(f"{letter}. {cell}")
+        question.options = tuple(options)
+
+        # 添加答案
+        if 0 <= answer_col < row_len:
+            answer = row[answer_col].strip().upper()
+            if answer:
                 # 如果答案是多个字符，尝试提取第一个字母
                 if len(answer) > 1:
-                    match = re.search(r'[A-D]', answer)
+                    match = self.csv_answer_pattern.search(answer)
                     if match:
                         answer = match.group(0)
                 if answer in "ABCD":
                     question.answer = answer
 
-            # 添加解析
-            if explanation_col != -1 and explanation_col < len(row) and row[explanation_col].strip():
-                question.explanation = row[explanation_col].strip()
+        # 添加解析
+        if 0 <= explanation_col < row_len:
+            explanation = row[explanation_col].strip()
+            if explanation:
+                question.explanation = explanation
 
-            questions.append(question)
+        return question
 
-        self.logger.info(f"解析完成，共解析 {len(questions)} 道题目")
-        return questions
-
-    def _process_answer_line(self, text, question, has_empty_brackets, line_num):
+    def _process_answer_line(self, text, answer, question, has_empty_brackets, line_num):
         """
-        处理可能的答案行
+        处理已识别的答案行
 
         Args:
             text (str): 文本内容
+            answer (str): 识别出的答案字母
             question (Question): 题目对象
             has_empty_brackets (bool): 是否有空括号
             line_num (int): 行号
-
-        Returns:
-            bool: 是否是答案行
         """
-        # 检查是否是答案行
-        is_answer_line = False
-
-        # 1. 尝试直接匹配独立答案行
-        for pattern in self.separate_answer_patterns:
-            match = pattern.search(text)
-            if match:
-                answer = match.group(1).upper()
-
-                # 如果当前题目有空括号且没有答案，优先填充
-                if has_empty_brackets and not question.answer:
-                    question.answer = answer
-                    self.logger.debug(f"[行 {line_num}] 为题目空括号填充答案: {answer}")
-                    has_empty_brackets = False
-                else:
-                    question.answer = answer
-                    self.logger.debug(f"[行 {line_num}] 识别为独立答案行: {text} -> {answer}")
-
-                is_answer_line = True
-                break
-
-        # 2. 如果是纯字母行且长度为1，可能是答案
-        if not is_answer_line and len(text) == 1 and text.upper() in "ABCD":
-            question.answer = text.upper()
-            self.logger.debug(f"[行 {line_num}] 识别为单字母答案行: {text}")
-            is_answer_line = True
-
-        return is_answer_line
+        # 如果当前题目有空括号且没有答案，优先填充
+        if has_empty_brackets and not question.answer:
+            question.answer = answer
+            self.logger.debug("[行 %d] 为题目空括号填充答案: %s", line_num, answer)
+        else:
+            question.answer = answer
+            self.logger.debug("[行 %d] 识别为独立答案行: %s -> %s", line_num, text, answer)
 
-    def _try_find_answer_from_neighbors(self, question, pending_questions):
+    def _try_find_answer_from_neighbors(self, question, pending_questions, candidates):
         """
         尝试从相邻题目找答案
 
         Args:
             question (Question): 题目对象
             pending_questions (list): 待处理题目列表
+            candidates (deque): 尚未被使用的单字母题目索引，按列表顺序排列
+
+        Returns:
+            int: 被用作答案的题目索引，没有找到时返回None
         """
-        self.logger.debug(f"题目包含空括号但没有关联到答案")
+        self.logger.debug("题目包含空括号但没有关联到答案")
 
-        # 从待处理题目中查找可能的答案
-        for other_q in pending_questions:
-            if other_q != question and len(other_q.text) == 1 and other_q.text.upper() in "ABCD":
+        # 取第一个不是当前题目的候选项，当前题目最多占据一个位置
+        for position in range(min(2, len(candidates))):
+            index = candidates[position]
+            other_q = pending_questions[index]
+            if other_q is not question:
                 question.answer = other_q.text.upper()
-                self.logger.debug(f"从相邻内容中找到可能的答案: {question.answer}")
-                pending_questions.remove(other_q)
-                break
+                self.logger.debug("从相邻内容中找到可能的答案: %s", question.answer)
+                del candidates[position]
+                return index
+        return None
 
-    def _finalize_questions(self, questions):
+    def _finalize_stream(self, questions, stats):
         """
-        最终处理所有题目，确保有答案
+        最终处理题目流，确保有答案
+
+        只向后多看一道题，处理完上一题后立即产出。
 
         Args:
-            questions (list): 题目对象列表
-        """
-        for i, q in enumerate(questions):
-            # 1. 先检查题目文本中是否能找到答案
-            if not q.answer:
-                answer = extract_answer_from_text(q.text, self.separate_answer_patterns)
-                if answer:
-                    q.answer = answer
-                    self.logger.debug(f"从题目文本中提取答案: 题目 {i+1} -> {q.answer}")
+            questions (iterable): 组装完成的题目对象
+            stats (ParseStats): 解析统计
 
-            # 2. 如果仍然没答案，尝试从相邻题目推断
-            if not q.answer and self.empty_brackets_pattern.search(q.text):
-                self._check_next_question_for_answer(questions, i)
+        Yields:
+            Question: 最终处理后的题目对象
+        """
+        perf_counter = time.perf_counter
+        previous = None
+        count = 0
+        for question in questions:
+            if previous is not None:
+                finalize_start = perf_counter()
+                self._finalize_question(previous, question, count)
+                stats.finalize_seconds += perf_counter() - finalize_start
+                yield previous
+                count += 1
+            previous = question
+
+        if previous is not None:
+            finalize_start = perf_counter()
+            self._finalize_question(previous, None, count)
+            stats.finalize_seconds += perf_counter() - finalize_start
+            yield previous
+            count += 1
+
+        stats.finish(count)
+        self.logger.info(f"解析完成，共解析 {count} 道题目")
+        self.logger.info(stats.summary())
+
+    def _finalize_question(self, question, next_question, index):
+        """
+        最终处理单个题目
 
-    def _check_next_question_for_answer(self, questions, index):
+        Args:
+            question (Question): 当前题目对象
+            next_question (Question): 下一题目对象，没有则为None
+            index (int): 当前题目索引
+        """
+        # 1. 先检查题目文本中是否能找到答案
+        if not question.answer:
+            answer = extract_answer_from_text(question.text, self.separate_answer_patterns)
+            if answer:
+                question.answer = answer
+                self.logger.debug("从题目文本中提取答案: 题目 %d -> %s", index + 1, question.answer)
+
+        # 2. 如果仍然没答案，尝试从相邻题目推断
+        if not question.answer and self.empty_brackets_pattern.search(question.text):
+            self._check_next_question_for_answer(question, next_question, index)
+
+    def _check_next_question_for_answer(self, question, next_question, index):
         """
         检查下一题的第一行是否为当前题目的答案
 
         Args:
-            questions (list): 题目对象列表
+            question (Question): 当前题目对象
+            next_question (Question): 下一题目对象，没有则为None
             index (int): 当前题目索引
         """
-        if index < len(questions) - 1:
-            next_lines = questions[index+1].text.split('\n')
+        if next_question is not None:
+            next_lines = next_question.text.split('\n')
             if next_lines and len(next_lines[0]) == 1 and next_lines[0].upper() in "ABCD":
-                questions[index].answer = next_lines[0].upper()
-                self.logger.debug(f"从下一题第一行提取答案: 题目 {index+1} -> {questions[index].answer}")
+                question.answer = next_lines[0].upper()
+                self.logger.debug("从下一题第一行提取答案: 题目 %d -> %s", index + 1, question.answer)
 
                 # 更新下一题，移除第一行
                 if len(next_lines) > 1:
-                    questions[index+1].text = '\n'.join(next_lines[1:])
\ No newline at end of file
+                    next_question.text = '\n'.join(next_lines[1:])
@@ -0,0 +1,355 @@
+import os
+import json
+import time
+import asyncio
+import secrets
+from models.question_bank import QuestionBank
+from models.learner_session import LearnerSession, MODE_SEQUENTIAL
+from services.parser_service import ParserService
+from services.import_service import ImportService
+from utils.logger import get_logger
+from config.settings import SERVER_SESSION_TTL
+
+# 请求头和请求体的大小上限（字节）
+_MAX_HEADER_SIZE = 16 * 1024
+_MAX_BODY_SIZE = 64 * 1024
+
+# 清理闲置会话的间隔（秒）
+_SWEEP_INTERVAL = 60
+
+_REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+            405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HttpError(Exception):
+    """请求处理失败，携带 HTTP 状态码和错误信息"""
+
+    def __init__(self, status, message):
+        """
+        初始化请求错误
+
+        Args:
+            status (int): HTTP 状态码
+            message (str): 错误信息
+        """
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def load_bank(path):
+    """
+    加载题库文件或文件夹
+
+    Args:
+        path (str): 题库文件或文件夹路径
+
+    Returns:
+        QuestionBank: 题库
+
+    Raises:
+        ValueError: 题库中没有题目
+        Exception: 解析失败
+    """
+    if os.path.isdir(path):
+        questions, _ = ImportService().import_directory(path)
+    else:
+        questions = ParserService().iter_questions(path)
+    bank = QuestionBank(questions, path)
+    if not bank.get_question_count():
+        raise ValueError(f"题库中没有题目: {path}")
+    return bank
+
+
+class PracticeServer:
+    """
+    无界面的练习服务（HTTP/JSON）
+
+    题库只加载一次，由全部学员共享只读；每位学员的会话（LearnerSession）只保存游标、答案、
+    统计和随机顺序的种子。基于 asyncio 在单个线程中处理全部连接，支持 HTTP/1.1 长连接。
+
+    接口（请求体和响应均为 JSON）:
+        GET    /banks                     题库列表
+        POST   /sessions                  新建会话 {"bank": 题库名, "mode": "sequential"|"random", "seed": 整数}
+        GET    /sessions/{id}             当前题目和统计
+        POST   /sessions/{id}/next        下一题
+        POST   /sessions/{id}/prev        上一题
+        POST   /sessions/{id}/jump        跳转 {"number": 题号}
+        POST   /sessions/{id}/answer      作答当前题目 {"answer": "A"}，返回对错、正确答案和解析
+        GET    /sessions/{id}/stats       做题统计
+        DELETE /sessions/{id}             结束会话
+    """
+
+    def __init__(self, banks, session_ttl=SERVER_SESSION_TTL):
+        """
+        初始化练习服务
+
+        Args:
+            banks (dict): 题库名 -> QuestionBank
+            session_ttl (float): 会话闲置多久后清除（秒）
+        """
+        self.logger = get_logger()
+        self.banks = banks
+        self.session_ttl = session_ttl
+        self.sessions = {}  # 会话ID -> LearnerSession
+
+    # ---- 接口 ----
+
+    def dispatch(self, method, path, body):
+        """
+        处理一个请求
+
+        Args:
+            method (str): 请求方法
+            path (str): 请求路径（不含查询字符串）
+            body (bytes): 请求体
+
+        Returns:
+            tuple: (HTTP 状态码, 响应对象)
+
+        Raises:
+            HttpError: 请求无效
+        """
+        parts = path.strip('/').split('/')
+        if parts == ['banks']:
+            self._check_method(method, 'GET')
+            return 200, {'banks': [{'name': name, 'count': bank.get_question_count()}
+                                   for name, bank in self.banks.items()]}
+
+        if parts[0] != 'sessions' or len(parts) > 3:
+            raise HttpError(404, "接口不存在")
+        if len(parts) == 1:
+            self._check_method(method, 'POST')
+            return 201, self._create_session(self._parse_body(body))
+
+        session = self.sessions.get(parts[1])
+        if session is None:
+            raise HttpError(404, "会话不存在或已过期")
+        session.last_active = time.monotonic()
+        action = parts[2] if len(parts) == 3 else None
+
+        if action is None:
+            if method == 'DELETE':
+                del self.sessions[parts[1]]
+                return 200, {'deleted': True}
+            self._check_method(method, 'GET')
+            return 200, {'question': self._question(session), 'stats': self._stats(session)}
+        if action == 'stats':
+            self._check_method(method, 'GET')
+            return 200, {'stats': self._stats(session)}
+
+        self._check_method(method, 'POST')
+        if action == 'next':
+            session.next()
+        elif action == 'prev':
+            session.prev()
+        elif action == 'jump':
+            number = self._parse_body(body).get('number')
+            if not isinstance(number, int) or not session.jump(number - 1):
+                raise HttpError(400, f"请输入1-{session.bank.get_question_count()}之间的题号")
+        elif action == 'answer':
+            answer = self._parse_body(body).get('answer')
+            if not isinstance(answer, str) or not answer.strip():
+                raise HttpError(400, "请提供答案")
+            return 200, self._answer(session, answer.strip())
+        else:
+            raise HttpError(404, "接口不存在")
+        return 200, {'question': self._question(session)}
+
+    @staticmethod
+    def _check_method(method, expected):
+        """请求方法不符时抛出 405"""
+        if method != expected:
+            raise HttpError(405, f"请使用 {expected} 方法")
+
+    @staticmethod
+    def _parse_body(body):
+        """解析 JSON 请求体，空请求体视为空对象"""
+        if not body:
+            return {}
+        try:
+            data = json.loads(body)
+        except ValueError:
+            raise HttpError(400, "请求体不是有效的 JSON")
+        if not isinstance(data, dict):
+            raise HttpError(400, "请求体应为 JSON 对象")
+        return data
+
+    def _create_session(self, data):
+        """新建学员会话"""
+        name = data.get('bank')
+        if name is None and len(self.banks) == 1:
+            name = next(iter(self.banks))
+        bank = self.banks.get(name) if isinstance(name, str) else None
+        if bank is None:
+            raise HttpError(404, f"题库不存在: {name}")
+        seed = data.get('seed')
+        if seed is not None and not isinstance(seed, int):
+            raise HttpError(400, "seed 应为整数")
+        try:
+            session = LearnerSession(bank, data.get('mode', MODE_SEQUENTIAL), seed)
+        except ValueError as e:
+            raise HttpError(400, str(e))
+
+        session_id = secrets.token_urlsafe(12)
+        self.sessions[session_id] = session
+        return {'session': session_id, 'question': self._question(session)}
+
+    @staticmethod
+    def _question(session):
+        """当前题目（不含答案和解析）"""
+        index = session.current
+        question = session.bank.get_question(index)
+        return {
+            'number': index + 1,
+            'total': session.bank.get_question_count(),
+            'text': question.text,
+            'options': list(question.options),
+            'selected': session.answers.get(index),
+        }
+
+    @staticmethod
+    def _stats(session):
+        """做题统计"""
+        stats = session.stats
+        return {'answered': stats.answered, 'correct': stats.correct, 'incorrect': stats.incorrect}
+
+    def _answer(self, session, answer):
+        """作答当前题目，返回对错、正确答案和解析"""
+        is_correct = session.answer(answer)
+        question = session.bank.get_question(session.current)
+        return {
+            'correct': is_correct,
+            'answer': question.answer,
+            'explanation': question.explanation,
+            'stats': self._stats(session),
+        }
+
+    def sweep_sessions(self, now=None):
+        """
+        清除闲置超时的会话
+
+        Args:
+            now (float): 当前的 time.monotonic()，默认为当前时间
+
+        Returns:
+            int: 清除的会话数量
+        """
+        now = time.monotonic() if now is None else now
+        expired = [session_id for session_id, session in self.sessions.items()
+                   if now - session.last_active > self.session_ttl]
+        for session_id in expired:
+            del self.sessions[session_id]
+        return len(expired)
+
+    # ---- HTTP ----
+
+    async def handle_connection(self, reader, writer):
+        """
+        处理一个连接上的全部请求（长连接）
+
+        Args:
+            reader (asyncio.StreamReader): 读取流
+            writer (asyncio.StreamWriter): 写入流
+        """
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    return  # 客户端关闭连接
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, 413, {'error': "请求头过大"}, False)
+                    return
+
+                keep_alive, response = await self._handle_request(head, reader)
+                await self._respond(writer, *response, keep_alive)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, head, reader):
+        """
+        解析请求并调用接口
+
+        Args:
+            head (bytes): 请求行和请求头
+            reader (asyncio.StreamReader): 读取请求体的流
+
+        Returns:
+            tuple: (是否保持连接, (HTTP 状态码, 响应对象))
+        """
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ')
+        except ValueError:
+            return False, (400, {'error': "请求行格式错误"})
+
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            return False, (400, {'error': "Content-Length 无效"})
+        if length > _MAX_BODY_SIZE:
+            return False, (413, {'error': "请求体过大"})
+        body = await reader.readexactly(length) if length > 0 else b''
+
+        try:
+            return keep_alive, self.dispatch(method, target.split('?', 1)[0], body)
+        except HttpError as e:
+            return keep_alive, (e.status, {'error': e.message})
+        except Exception as e:
+            self.logger.error(f"处理请求 {method} {target} 出错: {str(e)}")
+            return keep_alive, (500, {'error': "服务器内部错误"})
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        """写出 JSON 响应"""
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+                "Content-Type: application/json; charset=utf-8",
+                f"Content-Length: {len(body)}"]
+        if not keep_alive:
+            head.append("Connection: close")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode('latin-1') + body)
+        await writer.drain()
+
+    async def _sweep_forever(self):
+        """定期清除闲置超时的会话"""
+        while True:
+            await asyncio.sleep(_SWEEP_INTERVAL)
+            expired = self.sweep_sessions()
+            if expired:
+                self.logger.info(f"清除 {expired} 个闲置会话，当前 {len(self.sessions)} 个会话")
+
+    async def serve(self, host, port, ready=None):
+        """
+        启动服务并一直运行
+
+        Args:
+            host (str): 监听地址
+            port (int): 监听端口，为0时由系统分配
+            ready (callable): 开始监听后调用，参数为实际监听的 (地址, 端口)
+        """
+        server = await asyncio.start_server(self.handle_connection, host, port,
+                                            limit=_MAX_HEADER_SIZE, backlog=1024)
+        address = server.sockets[0].getsockname()[:2]
+        self.logger.info(f"练习服务已启动: http://{address[0]}:{address[1]}")
+        if ready is not None:
+            ready(address)
+        sweeper = asyncio.create_task(self._sweep_forever())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            sweeper.cancel()
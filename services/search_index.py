@@ -0,0 +1,258 @@
+import sys
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+
+# 序列化格式：魔数、格式版本、字节序标记、题目数量、桶数量、非空桶数量，随后是非空桶的编号
+# （array('I')，递增）、各非空桶倒排表的起始位置（array('Q')，非空桶数量+1项）
+# 和全部倒排表依次相连的题目索引（array('I')）。空桶不占空间，小题库的索引也很小
+_MAGIC = b'QIDX'
+_VERSION = 3
+_HEADER = struct.Struct('<4sIBIII')
+_BYTE_ORDER = 0 if sys.byteorder == 'little' else 1
+
+# 索引的 n-gram 长度：中文没有词边界，用二字和三字片段覆盖常见检索词
+_MIN_GRAM = 2
+_MAX_GRAM = 3
+
+# 片段按字符编码计算出确定的整数键（不受字符串哈希随机化影响，可以持久化），再按桶数量取模。
+# 片段数量随题库规模增长很快，按桶保存使内存有上限；不同片段落入同一个桶的误命中由核对原文排除。
+# 只为出现过的桶分配倒排表
+_CODE_RANGE = 0x110000
+_BUCKET_COUNT = 262139  # 质数
+
+# 候选集比倒排表小得多时逐个二分查找，否则转为集合求交
+_BISECT_RATIO = 16
+
+# 求交时每个检索词最多使用的倒排表数量
+_GRAMS_PER_TERM = 2
+
+
+def _gram_buckets(value):
+    """
+    计算字符串全部二字、三字片段所在的桶
+
+    Args:
+        value (str): 字符串
+
+    Returns:
+        tuple: (二字片段的桶列表, 三字片段的桶列表)，按片段在字符串中的位置排列
+    """
+    codes = list(map(ord, value))
+    pairs = [first * _CODE_RANGE + second for first, second in zip(codes, codes[1:])]
+    triples = [(pair * _CODE_RANGE + third) % _BUCKET_COUNT for pair, third in zip(pairs, codes[2:])]
+    return [pair % _BUCKET_COUNT for pair in pairs], triples
+
+
+def _contains(posting, value):
+    """在有序倒排表中二分查找题目索引"""
+    position = bisect_left(posting, value)
+    return position < len(posting) and posting[position] == value
+
+
+class SearchIndex:
+    """
+    题目关键词检索的 n-gram 倒排索引
+
+    对题目文本、每个选项和解析分别取全部二字、三字片段，片段按确定的整数键分入固定数量的桶，
+    每个出现过的桶对应一个按题目索引递增的紧凑整数数组（array('I')），片段在同一道题中每出现一次
+    记录一次。题目按加入题库的顺序逐个加入索引，题库增加题目后可以继续加入。
+
+    检索时每个词取其中的三字片段（两个字的词取二字片段），从最短的倒排表开始求交得到候选题目，
+    按命中次数排序后逐个核对原文，排除片段同桶误命中和片段都出现但不连续的题目。
+    """
+
+    def __init__(self):
+        """初始化空索引"""
+        self._buckets = {}  # 桶 -> 倒排表；还原的索引为全部倒排表依次相连的数组
+        self._bucket_ids = None  # 还原的索引：非空桶的编号（递增）
+        self._offsets = None  # 还原的索引：各非空桶倒排表在 _buckets 中的起始位置
+        self.count = 0
+
+    @property
+    def readonly(self):
+        """索引是否从序列化数据还原（只能检索，不能再加入题目）"""
+        return self._offsets is not None
+
+    def add(self, question):
+        """
+        把下一道题目加入索引
+
+        Args:
+            question (Question): 题目对象，索引为已加入的题目数量
+
+        Raises:
+            ValueError: 索引是从序列化数据还原的，不能再加入题目
+        """
+        if self.readonly:
+            raise ValueError("还原的检索索引不能再加入题目")
+        index = self.count
+        buckets = self._buckets
+        for field in (question.text, question.explanation, *question.options):
+            pairs, triples = _gram_buckets(field)
+            for bucket in pairs + triples:
+                posting = buckets.get(bucket)
+                if posting is None:
+                    posting = buckets[bucket] = array('I')
+                posting.append(index)
+        self.count = index + 1
+
+    def extend(self, questions):
+        """
+        依次把多道题目加入索引
+
+        Args:
+            questions (iterable): 题目对象
+        """
+        add = self.add
+        for question in questions:
+            add(question)
+
+    def _posting(self, bucket):
+        """读取一个桶的倒排表，空桶返回空序列"""
+        if self._offsets is None:
+            return self._buckets.get(bucket, ())
+        position = bisect_left(self._bucket_ids, bucket)
+        if position == len(self._bucket_ids) or self._bucket_ids[position] != bucket:
+            return ()
+        return self._buckets[self._offsets[position]:self._offsets[position + 1]]
+
+    def _term_postings(self, term):
+        """
+        取检索词各片段的倒排表
+
+        Args:
+            term (str): 检索词
+
+        Returns:
+            list: 倒排表，有片段不在索引中时返回空列表；检索词过短无法使用索引时返回None
+        """
+        if len(term) < _MIN_GRAM:
+            return None
+        pairs, triples = _gram_buckets(term)
+        postings = []
+        for bucket in dict.fromkeys(triples or pairs):
+            posting = self._posting(bucket)
+            if not posting:
+                return []
+            postings.append(posting)
+        return postings
+
+    def search(self, keyword, limit, get_question):
+        """
+        按关键词检索题目，关键词以空白分隔时要求同时包含全部词，区分大小写
+
+        Args:
+            keyword (str): 关键词
+            limit (int): 最多返回的结果数
+            get_question (callable): 按索引读取题目的函数，用于核对原文
+
+        Returns:
+            list: 按命中次数从多到少排列的题目索引，次数相同时按题号排列；
+                所有词都短于两个字、无法使用索引时返回None
+        """
+        terms = keyword.split()
+        term_postings = []
+        for term in terms:
+            postings = self._term_postings(term)
+            if postings == []:
+                return []
+            if postings is not None:
+                term_postings.append(sorted(postings, key=len))
+        if not term_postings:
+            return None
+
+        # 每个词只取最短的几个倒排表求交，其余片段由核对原文保证
+        selected = sorted((p for postings in term_postings for p in postings[:_GRAMS_PER_TERM]), key=len)
+        candidates = set(selected[0])
+        for posting in selected[1:]:
+            if len(candidates) * _BISECT_RATIO < len(posting):
+                candidates = {index for index in candidates if _contains(posting, index)}
+            else:
+                candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+        # 命中次数：各词最短倒排表中该题出现的次数之和
+        hits = Counter()
+        for postings in term_postings:
+            rarest = postings[0]
+            if len(rarest) <= len(candidates) * _BISECT_RATIO:
+                counts = Counter(rarest)
+                for index in candidates:
+                    hits[index] += counts[index]
+            else:
+                for index in candidates:
+                    hits[index] += bisect_right(rarest, index) - bisect_left(rarest, index)
+
+        # 先按题号排序，再按命中次数稳定排序，然后按顺序核对原文直到取够结果
+        results = []
+        for index in sorted(sorted(candidates), key=hits.__getitem__, reverse=True):
+            question = get_question(index)
+            fields = (question.text, question.explanation, *question.options)
+            if all(any(term in field for field in fields) for term in terms):
+                results.append(index)
+                if len(results) >= limit:
+                    break
+        return results
+
+    def to_bytes(self):
+        """
+        序列化索引
+
+        Returns:
+            bytes: 序列化数据
+        """
+        if self.readonly:
+            bucket_ids, offsets, postings = self._bucket_ids, self._offsets, self._buckets
+        else:
+            bucket_ids = array('I', sorted(self._buckets))
+            offsets = array('Q', [0])
+            postings = array('I')
+            for bucket in bucket_ids:
+                postings += self._buckets[bucket]
+                offsets.append(len(postings))
+        header = _HEADER.pack(_MAGIC, _VERSION, _BYTE_ORDER, self.count, _BUCKET_COUNT, len(bucket_ids))
+        return b''.join((header, bucket_ids.tobytes(), offsets.tobytes(), postings.tobytes()))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        从序列化数据还原索引
+
+        全部倒排表还原为一个连续数组，按各桶的起始位置切片读取；还原的索引只用于检索，
+        不能再加入题目。
+
+        Args:
+            data (bytes): 序列化数据
+
+        Returns:
+            SearchIndex: 索引
+
+        Raises:
+            ValueError: 数据格式、版本或字节序不匹配
+        """
+        magic, version, byte_order, count, bucket_count, used = _HEADER.unpack_from(data)
+        if (magic != _MAGIC or version != _VERSION or byte_order != _BYTE_ORDER
+                or bucket_count != _BUCKET_COUNT):
+            raise ValueError("检索索引格式不匹配")
+
+        bucket_ids = array('I')
+        offsets = array('Q')
+        postings = array('I')
+        view = memoryview(data)
+        offsets_start = _HEADER.size + bucket_ids.itemsize * used
+        postings_start = offsets_start + offsets.itemsize * (used + 1)
+        bucket_ids.frombytes(view[_HEADER.size:offsets_start])
+        offsets.frombytes(view[offsets_start:postings_start])
+        postings.frombytes(view[postings_start:])
+        if len(offsets) != used + 1 or offsets[-1] != len(postings):
+            raise ValueError("检索索引数据不完整")
+
+        index = cls.__new__(cls)
+        index._buckets = postings
+        index._bucket_ids = bucket_ids
+        index._offsets = offsets
+        index.count = count
+        return index
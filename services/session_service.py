@@ -0,0 +1,139 @@
+import os
+import sys
+import json
+import hashlib
+from services.journal_service import AnswerJournal
+from services.import_service import ImportService
+from utils.logger import get_logger
+from config.settings import SESSION_DIR
+
+
+class SessionStore:
+    """
+    练习进度存储
+
+    按题库文件保存练习进度（如随机模式的做题顺序），下次打开同一题库时恢复；
+    用户答案随作答写入同一目录下的答案日志（AnswerJournal）。
+    以题库路径、大小和修改时间为键（题库文件夹以其中每个题库文件的相对路径、大小和修改时间为键），
+    题库文件被修改后不再沿用旧的进度。
+    """
+
+    def __init__(self, session_dir=None):
+        """
+        初始化练习进度存储
+
+        Args:
+            session_dir (str): 进度目录，默认为程序目录下的 SESSION_DIR
+        """
+        self.logger = get_logger()
+        self.session_dir = session_dir or os.path.join(self._get_app_directory(), SESSION_DIR)
+
+    def _get_app_directory(self):
+        """
+        获取程序所在目录
+
+        Returns:
+            str: 目录路径
+        """
+        if getattr(sys, 'frozen', False):
+            # 运行于 exe 模式
+            return os.path.dirname(sys.executable)
+        # 运行于脚本模式
+        return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    def _session_base(self, bank_path):
+        """
+        返回题库对应的进度文件路径（不含扩展名）
+
+        Args:
+            bank_path (str): 题库文件或文件夹路径
+
+        Returns:
+            str: 进度文件路径（不含扩展名）
+
+        Raises:
+            OSError: 无法读取题库文件信息
+        """
+        key = hashlib.blake2b(digest_size=16)
+        key.update(os.path.normcase(os.path.abspath(bank_path)).encode('utf-8'))
+        if os.path.isdir(bank_path):
+            # 文件夹的修改时间不随其中的文件被原地修改而变化，按导入的各个文件计算
+            for file_path in ImportService().list_bank_files(bank_path):
+                stat = os.stat(file_path)
+                key.update(f"|{os.path.relpath(file_path, bank_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+                           .encode('utf-8'))
+        else:
+            stat = os.stat(bank_path)
+            key.update(f"|{stat.st_size}|{stat.st_mtime_ns}".encode('ascii'))
+        return os.path.join(self.session_dir, key.hexdigest())
+
+    def _session_path(self, bank_path):
+        """
+        返回题库对应的进度文件路径
+
+        Args:
+            bank_path (str): 题库文件或文件夹路径
+
+        Returns:
+            str: 进度文件路径
+
+        Raises:
+            OSError: 无法读取题库文件信息
+        """
+        return self._session_base(bank_path) + '.json'
+
+    def open_journal(self, bank_path):
+        """
+        打开题库的答案日志，恢复已记录的答案
+
+        Args:
+            bank_path (str): 题库文件或文件夹路径
+
+        Returns:
+            AnswerJournal: 答案日志，无法打开时返回None
+        """
+        try:
+            base_path = self._session_base(bank_path)
+            os.makedirs(self.session_dir, exist_ok=True)
+        except OSError as e:
+            self.logger.warning(f"打开答案日志失败: {str(e)}")
+            return None
+        return AnswerJournal(base_path)
+
+    def load(self, bank_path):
+        """
+        读取题库的练习进度
+
+        Args:
+            bank_path (str): 题库文件或文件夹路径
+
+        Returns:
+            dict: 练习进度，没有保存过或读取失败时返回空字典
+        """
+        try:
+            with open(self._session_path(bank_path), 'r', encoding='utf-8') as f:
+                session = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"读取练习进度失败: {str(e)}")
+            return {}
+        return session if isinstance(session, dict) else {}
+
+    def save(self, bank_path, session):
+        """
+        保存题库的练习进度
+
+        Args:
+            bank_path (str): 题库文件或文件夹路径
+            session (dict): 可以保存为 JSON 的练习进度
+        """
+        try:
+            session_path = self._session_path(bank_path)
+            tmp_path = session_path + '.tmp'
+            os.makedirs(self.session_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(session, f, ensure_ascii=False)
+            os.replace(tmp_path, session_path)
+        except OSError as e:
+            self.logger.warning(f"保存练习进度失败: {str(e)}")
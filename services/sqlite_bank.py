@@ -0,0 +1,265 @@
+import os
+import json
+import sqlite3
+import pathlib
+from models.question import Question
+from utils.logger import get_logger
+
+# SQLite 题库文件扩展名
+SQLITE_EXTENSION = '.qdb'
+
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE questions (
+    id INTEGER PRIMARY KEY,
+    text TEXT NOT NULL,
+    options TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    explanation TEXT NOT NULL,
+    source_file TEXT NOT NULL,
+    option_text TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE questions_fts USING fts5(
+    text, option_text, explanation,
+    content='questions', content_rowid='id', tokenize='trigram case_sensitive 1'
+);
+"""
+
+# options 列是选项列表的 JSON，只用于还原题目；检索使用按行连接的 option_text 列，
+# 检索词不含空白，不会跨越两个选项或匹配到 JSON 的引号、转义和分隔符
+_OPTION_SEPARATOR = '\n'
+
+# 按题号读取时使用固定的语句文本，sqlite3 模块会缓存预编译的语句
+_SELECT_QUESTION = "SELECT text, options, answer, explanation, source_file FROM questions WHERE id = ?"
+_SELECT_ANSWER = "SELECT answer FROM questions WHERE id = ?"
+_SELECT_ALL = "SELECT text, options, answer, explanation, source_file FROM questions ORDER BY id"
+
+# 三元组分词器只能用不少于3个字符的词检索全文索引，更短的词改为逐行查找子串
+_MIN_INDEXED_TERM = 3
+
+
+def build_sqlite_bank(questions, output_path):
+    """
+    把题目导入新的 SQLite 题库
+
+    全部题目在同一个事务中批量插入，最后一次性重建全文索引。
+    先写入临时文件，完成后再替换目标文件。
+
+    Args:
+        questions (iterable): 题目对象
+        output_path (str): 输出文件路径
+
+    Returns:
+        int: 导入的题目数量
+
+    Raises:
+        ValueError: 当前 SQLite 不支持 FTS5 三元组分词器
+    """
+    temp_path = output_path + '.tmp'
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+    count = 0
+
+    def rows():
+        nonlocal count
+        for question in questions:
+            count += 1
+            yield (count, question.text, json.dumps(question.options, ensure_ascii=False),
+                   question.answer, question.explanation, question.source_file,
+                   _OPTION_SEPARATOR.join(question.options))
+
+    conn = sqlite3.connect(temp_path, isolation_level=None)
+    try:
+        # 临时文件写完才替换目标文件，构建期间不需要日志和同步
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        try:
+            conn.executescript(_SCHEMA)
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"当前 SQLite 不支持全文索引: {str(e)}")
+
+        conn.execute("BEGIN")
+        conn.executemany("INSERT INTO questions VALUES (?, ?, ?, ?, ?, ?, ?)", rows())
+        conn.execute("INSERT INTO questions_fts(questions_fts) VALUES ('rebuild')")
+        conn.executemany("INSERT INTO meta VALUES (?, ?)",
+                         [('schema_version', str(_SCHEMA_VERSION)), ('count', str(count))])
+        conn.execute("COMMIT")
+        conn.close()
+        os.replace(temp_path, output_path)
+    except BaseException:
+        conn.close()
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return count
+
+
+class SqliteBank:
+    """
+    SQLite 题库
+
+    题目按题号保存在 questions 表中，题目文本、选项和解析建有 FTS5 全文索引。
+    与 QuestionStore 提供相同的读取接口，可以直接作为 QuestionBank 的题目存储，
+    另外支持按关键词检索。
+    """
+
+    def __init__(self, file_path):
+        """
+        以只读方式打开 SQLite 题库
+
+        Args:
+            file_path (str): 文件路径
+
+        Raises:
+            FileNotFoundError: 文件不存在
+            ValueError: 文件不是有效的 SQLite 题库
+        """
+        self.logger = get_logger()
+        self.file_path = file_path
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"文件不存在: {file_path}")
+
+        uri = pathlib.Path(os.path.abspath(file_path)).as_uri() + '?mode=ro'
+        self._conn = sqlite3.connect(uri, uri=True)
+        try:
+            meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+            if meta.get('schema_version') != str(_SCHEMA_VERSION):
+                raise ValueError("SQLite 题库版本不受支持")
+            self._count = int(meta['count'])
+        except (sqlite3.DatabaseError, KeyError, ValueError) as e:
+            self._conn.close()
+            if isinstance(e, ValueError):
+                raise
+            raise ValueError(f"不是有效的 SQLite 题库文件: {str(e)}")
+
+        self.logger.info(f"已打开 SQLite 题库: {file_path}，共 {self._count} 道题目")
+
+    def close(self):
+        """关闭数据库连接"""
+        self._conn.close()
+
+    def __len__(self):
+        """题目数量"""
+        return self._count
+
+    def __getitem__(self, index):
+        """
+        按索引读取题目
+
+        Args:
+            index (int): 题目索引，支持负数
+
+        Returns:
+            Question: 新建的题目对象
+
+        Raises:
+            IndexError: 索引越界
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("题目索引越界")
+        return self._to_question(self._conn.execute(_SELECT_QUESTION, (index + 1,)).fetchone())
+
+    def __iter__(self):
+        """依次产出全部题目"""
+        for row in self._conn.execute(_SELECT_ALL):
+            yield self._to_question(row)
+
+    @staticmethod
+    def _to_question(row):
+        """把查询结果转换为题目对象"""
+        text, options, answer, explanation, source_file = row
+        return Question(text, json.loads(options), answer, explanation, source_file)
+
+    def answer(self, index):
+        """
+        只读取一道题的正确答案
+
+        Args:
+            index (int): 题目索引
+
+        Returns:
+            str: 正确答案
+        """
+        return self._conn.execute(_SELECT_ANSWER, (index + 1,)).fetchone()[0]
+
+    def search(self, keyword, limit):
+        """
+        按关键词检索题目文本、选项和解析
+
+        关键词以空白分隔时要求同时包含全部词，区分大小写。不少于3个字符的词通过全文索引检索，
+        全部是短词时逐行查找子串。结果按题号排序，取够 limit 个即停止，不必计算全部匹配的相关度。
+
+        Args:
+            keyword (str): 关键词
+            limit (int): 最多返回的结果数
+
+        Returns:
+            list: 匹配题目的索引
+        """
+        terms = keyword.split()
+        if not terms:
+            return []
+        indexed = [term for term in terms if len(term) >= _MIN_INDEXED_TERM]
+        short = [term for term in terms if len(term) < _MIN_INDEXED_TERM]
+
+        contains = " AND ".join(
+            "(instr(q.text, ?) OR instr(q.option_text, ?) OR instr(q.explanation, ?))" for _ in short
+        )
+        contains_params = [term for term in short for _ in range(3)]
+
+        if indexed:
+            # 每个词作为一个短语，短语之间默认为 AND
+            query = " ".join('"' + term.replace('"', '""') + '"' for term in indexed)
+            sql = ("SELECT f.rowid FROM questions_fts f JOIN questions q ON q.id = f.rowid "
+                   "WHERE questions_fts MATCH ?" + (" AND " + contains if contains else "") +
+                   " ORDER BY f.rowid LIMIT ?")
+            params = [query] + contains_params + [limit]
+        else:
+            sql = f"SELECT q.id FROM questions q WHERE {contains} ORDER BY q.id LIMIT ?"
+            params = contains_params + [limit]
+
+        return [row[0] - 1 for row in self._conn.execute(sql, params)]
+
+
+def open_sqlite_bank(file_path):
+    """
+    SQLite 题库的随机访问打开函数（供解析后端注册表使用）
+
+    Args:
+        file_path (str): 文件路径
+
+    Returns:
+        SqliteBank: 已打开的题库
+    """
+    return SqliteBank(file_path)
+
+
+def parse_sqlite_bank(parser, file_path, stats):
+    """
+    SQLite 题库的流式解析后端，依次产出其中的全部题目（如合并导入文件夹时使用）
+
+    Args:
+        parser (ParserService): 解析服务
+        file_path (str): 文件路径
+        stats (ParseStats): 解析统计
+
+    Yields:
+        Question: 题目对象
+    """
+    bank = SqliteBank(file_path)
+    try:
+        count = 0
+        for question in bank:
+            count += 1
+            stats.line_count = count
+            yield question
+        stats.bytes_read = os.path.getsize(file_path)
+        stats.finish(count)
+    finally:
+        bank.close()
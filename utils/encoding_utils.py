@@ -0,0 +1,100 @@
+import io
+import codecs
+
+# 文件头采样大小；采样全为 ASCII 时继续读取，直到出现非 ASCII 字节或达到上限
+SAMPLE_SIZE = 64 * 1024
+MAX_SAMPLE_SIZE = 4 * 1024 * 1024
+
+# 依次尝试的无 BOM 编码
+_CANDIDATE_ENCODINGS = ('utf-8', 'gbk', 'gb18030')
+
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def detect_encoding(f):
+    """
+    检测二进制文件对象的文本编码
+
+    先识别 BOM，再对文件头采样依次尝试 UTF-16（无 BOM）、UTF-8、GBK、GB18030。
+    检测结束后文件位置回到开头。
+
+    Args:
+        f: 以二进制模式打开、位于文件开头的文件对象
+
+    Returns:
+        str: 编码名称
+    """
+    sample = f.read(SAMPLE_SIZE)
+    at_eof = len(sample) < SAMPLE_SIZE
+
+    # 纯 ASCII 的采样无法区分编码，继续向后读取
+    while not at_eof and sample.isascii() and len(sample) < MAX_SAMPLE_SIZE:
+        chunk = f.read(SAMPLE_SIZE)
+        at_eof = len(chunk) < SAMPLE_SIZE
+        sample += chunk
+    f.seek(0)
+
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+
+    utf16 = _guess_utf16(sample)
+    if utf16:
+        return utf16
+
+    for encoding in _CANDIDATE_ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=at_eof)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return 'gb18030'
+
+
+def _guess_utf16(sample):
+    """
+    根据零字节的分布猜测无 BOM 的 UTF-16 编码
+
+    题库文本中的数字、标点和换行在 UTF-16 下会产生大量位于同一奇偶位置的零字节，
+    而 UTF-8 和 GBK 文本中不会出现零字节。
+
+    Args:
+        sample (bytes): 文件头采样
+
+    Returns:
+        str: 'utf-16-le' 或 'utf-16-be'，不像 UTF-16 时返回None
+    """
+    zeros = sample.count(b'\x00')
+    if zeros < max(2, len(sample) // 100):
+        return None
+
+    odd_zeros = sample[1::2].count(b'\x00')
+    if odd_zeros >= zeros * 0.9:
+        return 'utf-16-le'
+    if zeros - odd_zeros >= zeros * 0.9:
+        return 'utf-16-be'
+    return None
+
+
+def open_text_file(file_path, newline=None):
+    """
+    打开文本文件：只打开一次，检测编码后在同一个文件句柄上增量解码
+
+    Args:
+        file_path (str): 文件路径
+        newline: 传给 TextIOWrapper 的换行模式，CSV 需传入 ''
+
+    Returns:
+        tuple: (文本流, 编码名称)
+    """
+    f = open(file_path, 'rb')
+    try:
+        encoding = detect_encoding(f)
+        return io.TextIOWrapper(f, encoding=encoding, newline=newline), encoding
+    except Exception:
+        f.close()
+        raise
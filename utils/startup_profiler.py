@@ -0,0 +1,79 @@
+import sys
+import json
+import time
+
+# 启动后才需要的重量级模块，出现在启动阶段说明有模块被提前导入
+HEAVY_MODULES = (
+    'docx',
+    'lxml',
+    'zipfile',
+    'multiprocessing',
+    'concurrent.futures.process',
+    'sqlite3',
+)
+
+# 启动性能分析结果在标准输出中的行前缀，便于基准脚本识别
+REPORT_PREFIX = 'STARTUP_PROFILE '
+
+_origin = time.perf_counter()
+_enabled = False
+_marks = []
+
+
+def enable():
+    """开启启动性能分析"""
+    global _enabled
+    _enabled = True
+
+
+def is_enabled():
+    """
+    是否处于启动性能分析模式
+
+    Returns:
+        bool: 是否开启
+    """
+    return _enabled
+
+
+def mark(name):
+    """
+    记录一个启动阶段的结束时间点
+
+    Args:
+        name (str): 阶段名称
+    """
+    if _enabled:
+        _marks.append((name, time.perf_counter()))
+
+
+def report():
+    """
+    生成启动性能报告
+
+    Returns:
+        dict: 各阶段耗时和累计耗时（毫秒），以及已被导入的重量级模块
+    """
+    phases = {}
+    previous = _origin
+    for name, moment in _marks:
+        phases[name] = round((moment - previous) * 1000, 2)
+        previous = moment
+    return {
+        'phases_ms': phases,
+        'total_ms': round((previous - _origin) * 1000, 2),
+        'heavy_modules': [name for name in HEAVY_MODULES if name in sys.modules],
+    }
+
+
+def finish_at_first_dialog():
+    """
+    在第一次打开文件对话框前调用：分析模式下输出报告并退出程序
+
+    分析模式只关心启动到出现第一个对话框的耗时，不等待用户操作。
+    """
+    if not _enabled:
+        return
+    mark('first_dialog')
+    print(REPORT_PREFIX + json.dumps(report(), ensure_ascii=False), flush=True)
+    sys.exit(0)
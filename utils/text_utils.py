@@ -3,6 +3,36 @@ from utils.logger import get_logger
 
 logger = get_logger()
 
+# 行类型
+LINE_QUESTION = 'question'
+LINE_OPTION = 'option'
+LINE_ANSWER = 'answer'
+LINE_EXPLANATION = 'explanation'
+LINE_CONTINUATION = 'continuation'
+
+# 预编译的行识别模式
+OPTION_PATTERN = re.compile(r'^([A-D])[\.、:：]?\s*(.*)$')
+EXPLANATION_PATTERN = re.compile(r'^解析[:：]')
+EXPLANATION_PREFIX_PATTERN = re.compile(r'^解析[:：]\s*')
+ANSWER_PREFIX_PATTERN = re.compile(r'^答案[:：]')
+
+# 多种独立答案行格式（顺序即优先级）
+SEPARATE_ANSWER_PATTERNS = [
+    re.compile(r'^答案[：:]\s*([A-Da-d])', re.IGNORECASE),
+    re.compile(r'^答案[是为]?\s*([A-Da-d])', re.IGNORECASE),
+    re.compile(r'^\s*([A-Da-d])\s*$', re.IGNORECASE),
+    re.compile(r'^[（(]?\s*([A-Da-d])\s*[）)]?$', re.IGNORECASE),
+    re.compile(r'.*[（(]\s*([A-Da-d])\s*[）)].*')
+]
+
+# 题目行：行首题号（数字、第N题、（题型）N.）或行尾的 )N.
+_QUESTION_HEAD_PATTERN = re.compile(r'\d+[^\d\s]|第\d+题|（[\u4e00-\u9fa5]+）\d+[\.、]')
+_QUESTION_TAIL_PATTERN = re.compile(r'\)\d+[\.、]\s*$')
+
+_QUESTION_LEADS = frozenset('第（')
+_OPTION_LEADS = frozenset('ABCD')
+_LETTER_ANSWER_LEADS = frozenset('ABCDabcd(（')
+
 def hide_answer_in_text(text):
     """
     隐藏文本中括号内的答案，同时确保保留括号后的内容
@@ -49,6 +79,87 @@ def extract_answer_from_text(text, patterns):
         logger.error(f"提取答案时出错: {str(e)}")
         return ""
 
+def _match_question(text, first):
+    """
+    判断一行文本是否是题目（text 非空且已去除首尾空白）
+
+    Args:
+        text (str): 文本内容
+        first (str): 文本首字符
+
+    Returns:
+        bool: 是否是题目行
+    """
+    if (first.isdecimal() or first in _QUESTION_LEADS) and _QUESTION_HEAD_PATTERN.match(text):
+        return True
+    return (
+        ')' in text and
+        _QUESTION_TAIL_PATTERN.search(text) is not None and
+        not EXPLANATION_PATTERN.match(text) and
+        not ANSWER_PREFIX_PATTERN.match(text)
+    )
+
+def _match_answer(text, first):
+    """
+    按优先级匹配独立答案行
+
+    Args:
+        text (str): 文本内容
+        first (str): 文本首字符
+
+    Returns:
+        str: 答案字母，不是答案行则返回None
+    """
+    match = None
+    if first == '答':
+        match = (SEPARATE_ANSWER_PATTERNS[0].search(text) or
+                 SEPARATE_ANSWER_PATTERNS[1].search(text))
+    elif first in _LETTER_ANSWER_LEADS:
+        match = (SEPARATE_ANSWER_PATTERNS[2].search(text) or
+                 SEPARATE_ANSWER_PATTERNS[3].search(text))
+    if match is None and ('(' in text or '（' in text):
+        match = SEPARATE_ANSWER_PATTERNS[4].search(text)
+    if match is not None:
+        return match.group(1).upper()
+
+    # 纯字母行且长度为1，可能是答案
+    if len(text) == 1 and text.upper() in "ABCD":
+        return text.upper()
+    return None
+
+def classify_line(text):
+    """
+    单次识别一行文本的类型
+
+    按首字符分派，只运行可能匹配的预编译模式。判定顺序与原解析流程一致：
+    题目 > 选项 > 答案 > 解析 > 延续文本。
+
+    Args:
+        text (str): 非空且已去除首尾空白的文本
+
+    Returns:
+        tuple: (行类型, 附加值)。选项行附加格式化后的选项文本，答案行附加答案字母，
+            解析行附加解析内容，其余为None
+    """
+    first = text[0]
+
+    if _match_question(text, first):
+        return LINE_QUESTION, None
+
+    if first in _OPTION_LEADS:
+        match = OPTION_PATTERN.match(text)
+        if match:
+            return LINE_OPTION, f"{match.group(1)}. {match.group(2).strip()}"
+
+    answer = _match_answer(text, first)
+    if answer:
+        return LINE_ANSWER, answer
+
+    if first == '解' and EXPLANATION_PATTERN.match(text):
+        return LINE_EXPLANATION, EXPLANATION_PREFIX_PATTERN.sub('', text).strip()
+
+    return LINE_CONTINUATION, None
+
 def is_question_line(text, patterns):
     """
     判断一行文本是否是题目
@@ -61,14 +172,7 @@ def is_question_line(text, patterns):
         bool: 是否是题目行
     """
     try:
-        return (
-            re.match(r'^\（[\u4e00-\u9fa5]+\）\d+[\.、]\s*', text) or
-            re.search(r'\)\d+[\.、]\s*$', text) or
-            re.match(r'^\d+[\.、]\s*', text) or
-            re.match(r'^第\d+题[\.、]?\s*', text) or
-            re.match(r'^\d+、.*', text) or
-            re.match(r'^\d+[^\d\s].*', text)
-        ) and not re.match(r'^解析[:：]', text) and not re.match(r'^答案[:：]', text)
+        return bool(text) and _match_question(text, text[0])
     except Exception as e:
         logger.error(f"判断题目行时出错: {str(e)}")
         return False
\ No newline at end of file
@@ -1,8 +1,5 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from views.components.question_frame import QuestionFrame
-from views.components.feedback_frame import FeedbackFrame
-from views.components.navigation_frame import NavigationFrame
 from config.settings import APP_TITLE, WINDOW_SIZE, COLOR_STATUS_TEXT
 
 class AppView:
@@ -20,8 +17,20 @@ class AppView:
         self.root.title(APP_TITLE)
         self.root.geometry(WINDOW_SIZE)
 
-        self.configure_styles()
-        self._create_widgets()
+        # 样式和组件在主窗口第一次显示时才创建，使启动后的文件对话框尽快出现
+        self.widgets_created = False
+
+    def show(self):
+        """显示主窗口，第一次显示时创建样式和组件"""
+        self.ensure_widgets()
+        self.root.deiconify()
+
+    def ensure_widgets(self):
+        """确保样式和组件已经创建"""
+        if not self.widgets_created:
+            self.widgets_created = True
+            self.configure_styles()
+            self._create_widgets()
 
     def configure_styles(self):
         """配置界面样式"""
@@ -37,6 +46,10 @@ class AppView:
 
     def _create_widgets(self):
         """创建组件"""
+        from views.components.question_frame import QuestionFrame
+        from views.components.feedback_frame import FeedbackFrame
+        from views.components.navigation_frame import NavigationFrame
+
         # 创建组件
         self.question_frame = QuestionFrame(self.root, self.controller)
         self.feedback_frame = FeedbackFrame(self.root, self.controller)
@@ -65,13 +78,38 @@ class AppView:
         )
         self.reselect_btn.pack(side=tk.RIGHT, padx=5)
 
-        # 状态栏
+        # 选取题库文件夹按钮
+        self.reselect_folder_btn = ttk.Button(
+            file_path_frame,
+            text="选取题库文件夹",
+            command=self._on_reselect_folder
+        )
+        self.reselect_folder_btn.pack(side=tk.RIGHT, padx=5)
+
+        # 导出错题按钮
+        self.export_mistakes_btn = ttk.Button(
+            file_path_frame,
+            text="导出错题",
+            command=self._on_export_mistakes
+        )
+        self.export_mistakes_btn.pack(side=tk.RIGHT, padx=5)
+
+        # 状态栏：题库加载中显示取消加载按钮（增量加载时进度对话框已关闭）
+        status_frame = ttk.Frame(self.root)
+        status_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=5)
+
         self.status_bar = ttk.Label(
-            self.root,
+            status_frame,
             text="0/0",
             foreground=COLOR_STATUS_TEXT
         )
-        self.status_bar.pack(side=tk.BOTTOM, fill=tk.X, pady=5)
+        self.status_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        self.cancel_load_btn = ttk.Button(
+            status_frame,
+            text="取消加载",
+            command=self._on_cancel_load
+        )
 
     # 删除 show_file_selection_dialog 方法，不再需要
 
@@ -87,15 +125,29 @@ class AppView:
         else:
             self.file_path_label.config(text="题库路径: 未加载")
 
-    def update_status(self, current, total):
+    def update_status(self, current, total, loading=False, waiting_for=None):
         """
         更新状态栏
 
         Args:
             current (int): 当前题目索引
-            total (int): 题目总数
+            total (int): 题目总数（加载中为已加载的数量）
+            loading (bool): 题库是否仍在加载
+            waiting_for (int): 正在等待加载的题号，没有则为None
         """
-        self.status_bar.config(text=f"第 {current}/{total} 题")
+        if loading:
+            if not self.cancel_load_btn.winfo_manager():
+                self.cancel_load_btn.config(state='normal')
+                self.cancel_load_btn.pack(side=tk.RIGHT)
+        else:
+            self.cancel_load_btn.pack_forget()
+
+        if not loading:
+            self.status_bar.config(text=f"第 {current}/{total} 题")
+        elif waiting_for:
+            self.status_bar.config(text=f"第 {current}/{total}…(加载中)，正在等待第 {waiting_for} 题")
+        else:
+            self.status_bar.config(text=f"第 {current}/{total}…(加载中)")
 
     def show_error(self, title, message):
         """
@@ -117,6 +169,36 @@ class AppView:
         """
         messagebox.showinfo(title, message)
 
+    def show_progress(self, file_path, on_cancel):
+        """
+        显示题库加载进度对话框
+
+        Args:
+            file_path (str): 正在加载的题库路径
+            on_cancel (callable): 取消加载的回调
+
+        Returns:
+            ProgressDialog: 进度对话框
+        """
+        from views.components.progress_dialog import ProgressDialog
+        return ProgressDialog(self.root, file_path, on_cancel)
+
+    def show_search_results(self, keyword, results, elapsed_ms, on_select):
+        """
+        显示关键词检索结果
+
+        Args:
+            keyword (str): 检索的关键词
+            results (list): (题目索引, 题目文本) 列表，检索索引尚未就绪时为None（显示构建中）
+            elapsed_ms (float): 检索耗时（毫秒）
+            on_select (callable): 选中题目时的回调，参数为题目索引
+
+        Returns:
+            SearchDialog: 检索结果对话框
+        """
+        from views.components.search_dialog import SearchDialog
+        return SearchDialog(self.root, keyword, results, elapsed_ms, on_select)
+
     def start(self):
         """启动应用程序"""
         self.root.mainloop()
@@ -141,4 +223,17 @@ class AppView:
 
     def _on_reselect_bank(self):
         """重新选取题库按钮点击事件"""
-        self.controller.reselect_question_bank()
\ No newline at end of file
+        self.controller.reselect_question_bank()
+
+    def _on_reselect_folder(self):
+        """选取题库文件夹按钮点击事件"""
+        self.controller.reselect_question_folder()
+
+    def _on_cancel_load(self):
+        """取消加载按钮点击事件"""
+        self.cancel_load_btn.config(state='disabled')
+        self.controller.cancel_loading()
+
+    def _on_export_mistakes(self):
+        """导出错题按钮点击事件"""
+        self.controller.export_mistakes()
\ No newline at end of file
@@ -2,6 +2,10 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from config.settings import UI_FONT_FAMILY, UI_NORMAL_FONT_SIZE
 
+# 练习模式下拉框的选项：(显示文本, 控制器的模式值)
+_PRACTICE_MODES = [("顺序练习", 'sequential'), ("随机抽题", 'random'), ("间隔复习", 'review'),
+                   ("错题练习", 'mistakes')]
+
 class NavigationFrame:
     """导航控制组件"""
 
@@ -50,15 +54,17 @@ class NavigationFrame:
         )
         self.btn_next.grid(row=0, column=1, padx=5)
 
-        # 随机模式复选框
-        self.random_var = tk.BooleanVar()
-        self.random_check = ttk.Checkbutton(
+        # 练习模式下拉框
+        self.mode_var = tk.StringVar(value=_PRACTICE_MODES[0][0])
+        self.mode_combo = ttk.Combobox(
             control_frame,
-            text="随机抽题",
-            variable=self.random_var,
-            command=self._on_random_toggle
+            textvariable=self.mode_var,
+            values=[label for label, _ in _PRACTICE_MODES],
+            state='readonly',
+            width=8
         )
-        self.random_check.pack(side=tk.LEFT, padx=(10, 5))
+        self.mode_combo.pack(side=tk.LEFT, padx=(10, 5))
+        self.mode_combo.bind('<<ComboboxSelected>>', self._on_mode_selected)
 
         # 保存做题记录复选框
         self.save_records_check = ttk.Checkbutton(
@@ -73,9 +79,12 @@ class NavigationFrame:
         self.stats_label = ttk.Label(
             control_frame,
             text="",
-            font=(UI_FONT_FAMILY, UI_NORMAL_FONT_SIZE)
+            font=(UI_FONT_FAMILY, UI_NORMAL_FONT_SIZE),
+            cursor='hand2'
         )
         self.stats_label.pack(side=tk.LEFT, padx=10)
+        # 点击统计信息显示按来源文件分组的统计
+        self.stats_label.bind('<Button-1>', lambda event: self.controller.show_stats_breakdown())
 
         # 跳转题号输入框
         jump_frame = ttk.Frame(control_frame)
@@ -83,7 +92,7 @@ class NavigationFrame:
 
         ttk.Label(jump_frame, text="跳转到:").pack(side=tk.LEFT)
 
-        self.jump_entry = ttk.Entry(jump_frame, width=8)
+        self.jump_entry = ttk.Entry(jump_frame, width=14)
         self.jump_entry.pack(side=tk.LEFT, padx=5)
 
         ttk.Button(
@@ -92,6 +101,7 @@ class NavigationFrame:
             command=self._on_jump_click,
             width=6
         ).pack(side=tk.LEFT)
+        self.jump_entry.bind('<Return>', lambda event: self._on_jump_click())
 
     def _on_prev_click(self):
         """上一题按钮点击事件"""
@@ -101,10 +111,13 @@ class NavigationFrame:
         """下一题按钮点击事件"""
         self.controller.next_question()
 
-    def _on_random_toggle(self):
-        """随机模式切换事件"""
-        is_random = self.random_var.get()
-        self.controller.toggle_random_mode(is_random)
+    def _on_mode_selected(self, event=None):
+        """练习模式切换事件"""
+        label = self.mode_var.get()
+        for mode_label, mode in _PRACTICE_MODES:
+            if mode_label == label:
+                self.controller.set_practice_mode(mode)
+                return
 
     def _on_save_records_toggle(self):
         """保存做题记录切换事件"""
@@ -116,26 +129,35 @@ class NavigationFrame:
             self.stats_label.config(text="")
 
     def _on_jump_click(self):
-        """跳转按钮点击事件处理函数"""
+        """跳转按钮点击事件处理函数：输入数字时按题号跳转，否则按关键词检索"""
+        text = self.jump_entry.get().strip()
+        if not text:
+            messagebox.showerror("错误", "请输入题号或关键词")
+            return
+
         try:
-            question_num = int(self.jump_entry.get())
-            result = self.controller.jump_to_question(question_num)
-            # 无论跳转成功或失败，都清空输入框
-            self.jump_entry.delete(0, tk.END)
-            # 控制器会处理错误提示，此处不再重复显示错误
+            question_num = int(text)
         except ValueError:
-            # 输入非数字时显示错误并清空输入框
-            messagebox.showerror("错误", "请输入有效的题号数字")
-            self.jump_entry.delete(0, tk.END)
+            # 非数字输入作为关键词检索，保留输入内容便于修改后再次检索
+            self.controller.search_questions(text)
+            return
+
+        self.controller.jump_to_question(question_num)
+        # 无论跳转成功或失败，都清空输入框
+        # 控制器会处理错误提示，此处不再重复显示错误
+        self.jump_entry.delete(0, tk.END)
 
-    def set_random_mode(self, is_random):
+    def set_practice_mode(self, mode):
         """
-        设置随机模式
+        设置下拉框显示的练习模式
 
         Args:
-            is_random (bool): 是否随机模式
+            mode (str): 控制器的模式值
         """
-        self.random_var.set(is_random)
+        for label, mode_value in _PRACTICE_MODES:
+            if mode_value == mode:
+                self.mode_var.set(label)
+                return
 
     def update_stats(self, total_answered, correct_count, incorrect_count):
         """
@@ -0,0 +1,107 @@
+import os
+import tkinter as tk
+from tkinter import ttk
+from config.settings import UI_FONT_FAMILY, UI_NORMAL_FONT_SIZE, COLOR_STATUS_TEXT
+
+class ProgressDialog:
+    """题库加载进度对话框"""
+
+    def __init__(self, parent, file_path, on_cancel):
+        """
+        初始化加载进度对话框
+
+        Args:
+            parent: 父窗口
+            file_path (str): 正在加载的题库路径
+            on_cancel (callable): 点击取消或关闭窗口时的回调
+        """
+        self.parent = parent
+        self.on_cancel = on_cancel
+        self.cancelling = False
+
+        self.window = tk.Toplevel(parent)
+        self.window.title("正在加载题库")
+        self.window.resizable(False, False)
+        self.window.protocol("WM_DELETE_WINDOW", self._on_cancel_click)
+
+        self._create_widgets(file_path)
+
+        # 窗口显示后再独占输入，主窗口隐藏时对话框尚未映射，不能立即 grab
+        self.window.bind('<Map>', self._on_map)
+
+    def _create_widgets(self, file_path):
+        """
+        创建组件
+
+        Args:
+            file_path (str): 正在加载的题库文件或文件夹路径
+        """
+        name = os.path.basename(file_path.rstrip('/\\'))
+        frame = ttk.Frame(self.window, padding=15)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(
+            frame,
+            text=f"正在加载: {name}",
+            font=(UI_FONT_FAMILY, UI_NORMAL_FONT_SIZE)
+        ).pack(anchor='w')
+
+        # 进度条：总量未知时使用来回滚动的模式
+        self.progress_bar = ttk.Progressbar(frame, length=360, maximum=100, mode='indeterminate')
+        self.progress_bar.pack(fill=tk.X, pady=10)
+        self.progress_bar.start(15)
+
+        self.lbl_detail = ttk.Label(
+            frame,
+            text="正在打开文件...",
+            foreground=COLOR_STATUS_TEXT,
+            font=(UI_FONT_FAMILY, UI_NORMAL_FONT_SIZE)
+        )
+        self.lbl_detail.pack(anchor='w')
+
+        self.btn_cancel = ttk.Button(
+            frame,
+            text="取消",
+            command=self._on_cancel_click,
+            width=10
+        )
+        self.btn_cancel.pack(side=tk.RIGHT, pady=(10, 0))
+
+    def _on_map(self, event):
+        """对话框显示事件：独占输入，避免加载期间操作主窗口"""
+        if event.widget is self.window:
+            try:
+                self.window.grab_set()
+            except tk.TclError:
+                pass
+
+    def update_progress(self, progress):
+        """
+        显示最新的加载进度
+
+        Args:
+            progress (LoadProgress): 进度快照
+        """
+        fraction = progress.fraction
+        if fraction is not None:
+            if str(self.progress_bar.cget('mode')) != 'determinate':
+                self.progress_bar.stop()
+                self.progress_bar.config(mode='determinate')
+            self.progress_bar.config(value=fraction * 100)
+        if not self.cancelling:
+            self.lbl_detail.config(text=progress.describe())
+
+    def _on_cancel_click(self):
+        """取消按钮点击事件"""
+        if self.cancelling:
+            return
+        self.cancelling = True
+        self.btn_cancel.config(state='disabled')
+        self.lbl_detail.config(text="正在取消...")
+        self.on_cancel()
+
+    def close(self):
+        """关闭对话框"""
+        self.progress_bar.stop()
+        self.window.grab_release()
+        self.window.destroy()
@@ -0,0 +1,102 @@
+import tkinter as tk
+from tkinter import ttk
+from config.settings import UI_FONT_FAMILY, UI_NORMAL_FONT_SIZE, COLOR_STATUS_TEXT
+
+# 结果列表中题目文本的最大显示长度
+_PREVIEW_LENGTH = 60
+
+
+class SearchDialog:
+    """
+    关键词检索结果对话框，双击或回车跳转到选中的题目
+
+    检索索引尚未就绪时先显示“检索索引构建中”，就绪后由 show_results 填入结果。
+    """
+
+    def __init__(self, parent, keyword, results, elapsed_ms, on_select):
+        """
+        初始化检索结果对话框
+
+        Args:
+            parent: 父窗口
+            keyword (str): 检索的关键词
+            results (list): (题目索引, 题目文本) 列表，检索索引尚未就绪时为None
+            elapsed_ms (float): 检索耗时（毫秒）
+            on_select (callable): 选中题目时的回调，参数为题目索引
+        """
+        self.on_select = on_select
+        self.indexes = []
+
+        self.window = tk.Toplevel(parent)
+        self.window.title(f"检索: {keyword}")
+        self.window.transient(parent)
+
+        self._create_widgets()
+        if results is None:
+            self.lbl_summary.config(text="检索索引构建中，完成后显示结果...")
+        else:
+            self.show_results(results, elapsed_ms)
+
+    def _create_widgets(self):
+        """创建组件"""
+        frame = ttk.Frame(self.window, padding=10)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        self.lbl_summary = ttk.Label(
+            frame,
+            foreground=COLOR_STATUS_TEXT,
+            font=(UI_FONT_FAMILY, UI_NORMAL_FONT_SIZE)
+        )
+        self.lbl_summary.pack(anchor='w')
+
+        list_frame = ttk.Frame(frame)
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+
+        scrollbar = ttk.Scrollbar(list_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.listbox = tk.Listbox(
+            list_frame,
+            width=70,
+            height=15,
+            font=(UI_FONT_FAMILY, UI_NORMAL_FONT_SIZE),
+            yscrollcommand=scrollbar.set
+        )
+        self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.listbox.yview)
+
+        self.listbox.bind('<Double-Button-1>', self._on_choose)
+        self.listbox.bind('<Return>', self._on_choose)
+
+    def show_results(self, results, elapsed_ms):
+        """
+        显示检索结果（用户可能已经关闭了窗口）
+
+        Args:
+            results (list): (题目索引, 题目文本) 列表
+            elapsed_ms (float): 检索耗时（毫秒）
+        """
+        try:
+            self.lbl_summary.config(text=f"找到 {len(results)} 道题目（{elapsed_ms:.1f} ms），双击跳转")
+            self.indexes = [index for index, _ in results]
+            for index, text in results:
+                preview = text if len(text) <= _PREVIEW_LENGTH else text[:_PREVIEW_LENGTH] + "..."
+                self.listbox.insert(tk.END, f"第{index + 1}题  {preview}")
+            if results:
+                self.listbox.selection_set(0)
+                self.listbox.focus_set()
+        except tk.TclError:
+            pass
+
+    def _on_choose(self, event=None):
+        """跳转到选中的题目"""
+        selection = self.listbox.curselection()
+        if selection:
+            self.on_select(self.indexes[selection[0]])
+
+    def close(self):
+        """关闭对话框（用户可能已经关闭了窗口）"""
+        try:
+            self.window.destroy()
+        except tk.TclError:
+            pass